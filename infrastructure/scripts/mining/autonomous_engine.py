@@ -20,14 +20,9 @@ from orchestrator.main import app
 from miner_agent.agent import MinerAgent
 import uvicorn
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/tmp/azr_mining_engine.log'),
-        logging.StreamHandler()
-    ]
-)
+from mining_logging import configure_logging
+
+configure_logging('azr_mining_engine')
 logger = logging.getLogger(__name__)
 
 class AutonomousMiningEngine:
@@ -8,23 +8,16 @@ Date: October 27, 2025
 import os
 import sys
 import subprocess
-import logging
 from pathlib import Path
 from dotenv import load_dotenv
 
+from mining_logging import configure_logging
+
 # Load environment variables
 load_dotenv('.env.production')
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('mining_launcher.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
-logger = logging.getLogger(__name__)
+# Configure logging (queued and rotated, so miner output never blocks on disk)
+logger = configure_logging('mining_launcher', fmt='%(asctime)s - %(levelname)s - %(message)s')
 
 class AzoraMiningLauncher:
     def __init__(self):
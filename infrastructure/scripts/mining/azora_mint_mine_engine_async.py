@@ -0,0 +1,416 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT-MINE INTEGRATION ENGINE v2.0 - ASYNCIO MODE
+Single event loop for every monitor with async HTTP/DB clients and concurrency limits
+"""
+
+import os
+import time
+import asyncio
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional, Any, Tuple
+
+from azora_mint_mine_engine_v2 import AzoraMintMineEngineV2
+from miner_api_client import normalize_summary, get_miner_client
+from earnings_sources import MinerSource, PoolSource, SourceReading
+from mint_mine_events import ENGINE_EVENTS_CHANNEL, encode_event
+from resilient_http import get_http_client, CircuitOpenError
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+    print("⚠️  aiohttp not available - install with: pip install aiohttp")
+
+try:
+    import asyncpg
+    ASYNCPG_AVAILABLE = True
+except ImportError:
+    ASYNCPG_AVAILABLE = False
+    print("⚠️  asyncpg not available - telemetry writes fall back to the write-behind buffers")
+
+
+class AsyncMintMineEngine(AzoraMintMineEngineV2):
+    """Drop-in alternative to the threaded engine with the same start/stop/get_stats surface"""
+
+    def __init__(self):
+        if not AIOHTTP_AVAILABLE:
+            raise Exception("aiohttp is required for the asyncio engine mode")
+
+        super().__init__()
+
+        self.config['async'] = {
+            'http_concurrency': int(os.getenv('ASYNC_HTTP_CONCURRENCY', '64')),
+            'per_host_concurrency': int(os.getenv('ASYNC_PER_HOST_CONCURRENCY', '8')),
+            'db_pool_size': int(os.getenv('ASYNC_DB_POOL_SIZE', '8')),
+            'mint_concurrency': int(os.getenv('ASYNC_MINT_CONCURRENCY', '2')),
+            'intervals': {
+                'mining_monitor': 30,
+                'blockchain_monitor': 60,
+                'price_oracle': 300,
+                'auto_mint': 300,
+                'journal_replay': self.config['journal']['replay_interval']
+            }
+        }
+
+        # The event loop replaces the job scheduler
+        self.scheduler = None
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._stop_event: Optional[asyncio.Event] = None
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self.http_session = None
+        self.db_pool = None
+        self._mint_slots = None
+        self._blocking_slots = None
+
+    # ------------------------------------------------------------------
+    # Event loop lifecycle
+    # ------------------------------------------------------------------
+
+    def _run_loop(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self._main())
+        except Exception as e:
+            self.logger.error(f"Async engine loop crashed: {e}")
+        finally:
+            self.loop.close()
+
+    async def _main(self):
+        async_config = self.config['async']
+        self._stop_event = asyncio.Event()
+        self._mint_slots = asyncio.Semaphore(async_config['mint_concurrency'])
+        self._blocking_slots = asyncio.Semaphore(async_config['db_pool_size'])
+
+        connector = aiohttp.TCPConnector(
+            limit=async_config['http_concurrency'],
+            limit_per_host=async_config['per_host_concurrency']
+        )
+        self.http_session = aiohttp.ClientSession(connector=connector)
+
+        if ASYNCPG_AVAILABLE:
+            db_config = self.config['database']
+            try:
+                self.db_pool = await asyncpg.create_pool(
+                    host=db_config['host'],
+                    port=db_config['port'],
+                    database=db_config['name'],
+                    user=db_config['user'],
+                    password=db_config['password'],
+                    min_size=1,
+                    max_size=async_config['db_pool_size'],
+                    server_settings={'statement_timeout': str(db_config['statement_timeout_ms'])}
+                )
+            except Exception as e:
+                self.logger.warning(f"asyncpg pool unavailable, using write-behind buffers: {e}")
+                self.db_pool = None
+
+        workers = {
+            'mining_monitor': self.monitor_mining_async,
+            'blockchain_monitor': self.monitor_blockchain_async,
+            'price_oracle': self.price_oracle_async,
+            'auto_mint': self.auto_mint_async,
+            'journal_replay': self.replay_journal_async
+        }
+        if self.receipt_tracker:
+            # Drive the shared receipt tracker from the loop instead of its own thread
+            self.config['async']['intervals']['receipt_tracker'] = self.config['blockchain']['receipt_poll_interval']
+            workers['receipt_tracker'] = self.poll_receipts_async
+        for index in range(self.config['outbox']['dispatchers']):
+            self.config['async']['intervals'][f'mint_dispatcher_{index}'] = self.config['outbox']['poll_interval']
+            workers[f'mint_dispatcher_{index}'] = self.dispatch_mints_async
+        for name, worker in workers.items():
+            self._tasks[name] = asyncio.create_task(self._periodic(name, worker), name=name)
+            self.logger.info(f"✅ Started {name} task")
+
+        await self._stop_event.wait()
+
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+        await self.http_session.close()
+        if self.db_pool:
+            await self.db_pool.close()
+
+    async def _periodic(self, name: str, worker):
+        """Run a worker every interval until the engine stops"""
+        interval = self.config['async']['intervals'][name]
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                await worker()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"{name} error: {e}")
+
+            # Publishing builds the full stats, so only the slower workers do it
+            if name.startswith('mint_dispatcher') or name in ('receipt_tracker', 'journal_replay'):
+                self.record_worker_loop(name, started, publish=False)
+            else:
+                await self._run_blocking(self.record_worker_loop, name, started)
+
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_blocking(self, func, *args):
+        """Run a synchronous engine method in the default executor with a concurrency cap"""
+        async with self._blocking_slots:
+            return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    # ------------------------------------------------------------------
+    # Async HTTP helpers
+    # ------------------------------------------------------------------
+
+    async def _get_json(self, url: str, params: Optional[Dict] = None, timeout: float = 10) -> Optional[Any]:
+        try:
+            async with self.http_session.get(url, params=params,
+                                             timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                if response.status == 200:
+                    return await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+        return None
+
+    # ------------------------------------------------------------------
+    # Workers
+    # ------------------------------------------------------------------
+
+    async def _probe_rig_port(self, host: str, port: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+        return port, await self._get_json(f'http://{host}:{port}/summary', timeout=5)
+
+    async def fetch_rig_summary(self, source: MinerSource) -> Optional[Dict[str, Any]]:
+        """Query a rig's cached lolMiner port, re-probing every port concurrently on failure.
+
+        The port cache and discovery backoff are the shared MinerApiClient's, so the
+        threaded paths and the event loop never disagree about where a rig's API is.
+        """
+        client = get_miner_client(source.host, source.ports)
+        cached_port = client.port
+        if cached_port is not None:
+            started = time.monotonic()
+            summary = await self._get_json(f'http://{source.host}:{cached_port}/summary', timeout=client.timeout)
+            client.latency.observe(time.monotonic() - started)
+            if summary:
+                return normalize_summary(summary)
+        if not client.discovery_due():
+            return None
+
+        probes = [asyncio.ensure_future(self._probe_rig_port(source.host, port)) for port in source.ports]
+        try:
+            for probe in asyncio.as_completed(probes):
+                port, summary = await probe
+                if summary:
+                    client.record_discovery(port)
+                    return normalize_summary(summary)
+        finally:
+            for probe in probes:
+                probe.cancel()
+        client.record_discovery(None)
+        return None
+
+    async def fetch_pool_wallet(self, source: PoolSource) -> Optional[Dict[str, Any]]:
+        """A pool wallet payload, through the same per-pool circuit breaker as the threaded engine"""
+        http = get_http_client()
+        breaker = http.breaker(source.pool)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit for {source.pool} is open")
+
+        started = time.monotonic()
+        status, data = None, None
+        try:
+            async with self.http_session.get(source.url(self.config['apis']),
+                                             timeout=aiohttp.ClientTimeout(total=10)) as response:
+                status = response.status
+                if status == 200:
+                    data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            # Missed the poll deadline; a half-open probe that never finished must not wedge the breaker
+            breaker.cancel_probe()
+            raise
+        finally:
+            elapsed = time.monotonic() - started
+            self.pool_api_latency.observe(elapsed)
+            http.latency(source.pool).observe(elapsed)
+
+        if status is None or status == 429 or status >= 500:
+            if breaker.record_failure(elapsed):
+                self.logger.warning(f"⚡ Circuit for {source.pool} opened after "
+                                    f"{breaker.consecutive_failures} failures")
+        else:
+            breaker.record_success()
+        return data
+
+    async def fetch_source_async(self, source: Any) -> SourceReading:
+        """One source's reading, paced by the shared request-rate budget"""
+        await asyncio.sleep(self.source_poller.budget.reserve())
+        started = time.monotonic()
+        try:
+            if isinstance(source, MinerSource):
+                data = await self.fetch_rig_summary(source)
+            else:
+                data = await self.fetch_pool_wallet(source)
+            error = None
+        except CircuitOpenError as e:
+            data, error = None, str(e)
+        return SourceReading(source, data, time.monotonic() - started, error)
+
+    async def monitor_mining_async(self):
+        """Poll every owned rig and wallet concurrently, then aggregate like the threaded engine"""
+        sources = self.owned_sources()
+        tasks = [asyncio.ensure_future(self.fetch_source_async(source)) for source in sources]
+        if not tasks:
+            return
+        done, late = await asyncio.wait(tasks, timeout=self.config['sources']['deadline_seconds'])
+        for task in late:
+            task.cancel()
+        if late:
+            self.source_poller.late.inc(len(late))
+            self.logger.warning(f"⏱️ {len(late)} of {len(sources)} earnings sources missed the poll deadline")
+
+        readings = [task.result() for task in done if not task.exception()]
+        await self._run_blocking(self.aggregate_readings, readings)
+        await self._run_blocking(self.flush_mint_queue)
+
+    def update_mining_statistics(self, summaries: List[Dict[str, Any]] = ()):
+        """Statistics rows go out through asyncpg on the event loop"""
+        rows = self.mining_statistics_rows(summaries)
+        asyncio.run_coroutine_threadsafe(self.store_rows_async(self.statistics_buffer, rows), self.loop)
+
+    async def price_oracle_async(self):
+        """Fetch every tracked coin price through the shared price service"""
+        if not self.cluster.is_leader:
+            return
+
+        coin_ids = ['iron-fish', 'ergo', 'conflux-token']
+        data = await self._run_blocking(self.price_service.get_prices, coin_ids)
+        if not data:
+            self.logger.warning("Failed to get crypto prices")
+            return
+
+        observed_at = datetime.now()
+        rows = [
+            (observed_at, coin_id, data[coin_id]['usd'], 'coingecko')
+            for coin_id in coin_ids if data.get(coin_id, {}).get('usd') is not None
+        ]
+        await self.store_rows_async(self.price_buffer, rows)
+
+    async def monitor_blockchain_async(self):
+        """Check chain connectivity, gas price and AZR supply from one batched sample"""
+        await self._run_blocking(self.check_chain_state)
+
+    async def auto_mint_async(self):
+        await self._run_blocking(self.perform_maintenance_tasks)
+
+    async def replay_journal_async(self):
+        await self._run_blocking(self.replay_journal)
+
+    async def store_rows_async(self, buffer, rows: List[Tuple]):
+        """Bulk-copy telemetry rows with asyncpg, or hand them to the write-behind buffer"""
+        if not rows:
+            return
+
+        if self.db_pool:
+            try:
+                async with self.db_pool.acquire() as conn:
+                    async with conn.transaction():
+                        await conn.copy_records_to_table(buffer.table, records=rows, columns=list(buffer.columns))
+                        if buffer is self.price_buffer:
+                            await conn.execute(
+                                "SELECT pg_notify($1, $2)",
+                                ENGINE_EVENTS_CHANNEL, encode_event('prices', prices=self.latest_prices(rows))
+                            )
+                return
+            except Exception as e:
+                self.logger.warning(f"Async {buffer.table} write failed, buffering instead: {e}")
+
+        for row in rows:
+            if not buffer.add(row):
+                self.logger.warning(f"{buffer.table} buffer full - dropped row")
+
+    # ------------------------------------------------------------------
+    # Transaction tracking
+    # ------------------------------------------------------------------
+
+    async def dispatch_mints_async(self):
+        """Drain the mint outbox on an executor thread, bounded by the mint concurrency limit"""
+        async with self._mint_slots:
+            await self._run_blocking(self.dispatch_mint_intents)
+
+    async def poll_receipts_async(self):
+        """Check every pending mint receipt in one batch when a new block arrives"""
+        await self._run_blocking(self.receipt_tracker.poll_once)
+
+    # ------------------------------------------------------------------
+    # Public surface
+    # ------------------------------------------------------------------
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats = super().get_stats()
+        stats['system']['mode'] = 'asyncio'
+        stats['system']['tasks_active'] = sum(1 for task in self._tasks.values() if not task.done())
+        stats['system']['async_db'] = bool(self.db_pool)
+        return stats
+
+    def start(self):
+        """Start the engine's event loop"""
+        self.journal.start()
+        self.statistics_buffer.start()
+        self.price_buffer.start()
+        self.cluster.start()
+        self.start_api_server()
+
+        self._loop_thread = threading.Thread(target=self._run_loop, name='mint-mine-async', daemon=True)
+        self._loop_thread.start()
+
+        self.logger.info("=" * 60)
+        self.logger.info("🚀 AZORA MINT-MINE INTEGRATION ENGINE v2.0 (asyncio mode)")
+        self.logger.info("=" * 60)
+        self.logger.info(f"   ⛏️ Rigs: {len(self.miner_sources)}")
+        self.logger.info(f"   👛 Pool wallets: {len(self.pool_sources)}")
+        self.logger.info(f"   🔀 HTTP concurrency: {self.config['async']['http_concurrency']}")
+
+    def stop(self):
+        """Stop the event loop, then shut down shared components"""
+        self.monitoring_active = False
+
+        if self.loop and self._stop_event:
+            self.loop.call_soon_threadsafe(self._stop_event.set)
+        if self._loop_thread:
+            self._loop_thread.join(timeout=10)
+            if self._loop_thread.is_alive():
+                self.logger.warning("Async engine loop did not stop gracefully")
+
+        super().stop()
+
+
+def main():
+    """Main function"""
+    engine = AsyncMintMineEngine()
+
+    try:
+        engine.start()
+
+        # Keep running
+        while True:
+            time.sleep(1)
+
+    except KeyboardInterrupt:
+        print("\n⏹️ Received shutdown signal...")
+        engine.stop()
+
+    except Exception as e:
+        print(f"❌ Engine error: {e}")
+        engine.stop()
+
+if __name__ == '__main__':
+    main()
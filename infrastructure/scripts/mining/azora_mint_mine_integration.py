@@ -7,12 +7,14 @@ Mines crypto → Converts to AZR tokens → Mints based on mining value
 
 import json
 import time
-import requests
 import threading
 from datetime import datetime, timedelta
 import os
 from decimal import Decimal, ROUND_DOWN
 
+from miner_api_client import get_miner_client
+from mining_logging import configure_logging
+
 try:
     from web3 import Web3
     WEB3_AVAILABLE = True
@@ -22,6 +24,8 @@ except ImportError:
 
 class AzoraMintMineEngine:
     def __init__(self):
+        self.logger = configure_logging('mint_mine_integration')
+
         # Mining configuration
         self.mining_data = {
             'total_mined_usd': 0.0,
@@ -60,11 +64,11 @@ class AzoraMintMineEngine:
             with open('/workspaces/azora-os/secrets/minter_key.txt', 'r') as f:
                 self.wallet_address = f.read().strip()
 
-            print(f"✅ Loaded wallet: {self.wallet_address[:10]}...")
+            self.logger.info(f"✅ Loaded wallet: {self.wallet_address[:10]}...")
 
         except FileNotFoundError as e:
-            print(f"❌ Configuration file missing: {e}")
-            print("💡 Please ensure minter keys are configured in /secrets/")
+            self.logger.error(f"❌ Configuration file missing: {e}")
+            self.logger.warning("💡 Please ensure minter keys are configured in /secrets/")
             return False
 
         return True
@@ -73,7 +77,7 @@ class AzoraMintMineEngine:
         """Initialize blockchain connection and contracts"""
         try:
             if not WEB3_AVAILABLE:
-                print("🔗 Using mock blockchain connection (web3 not available)")
+                self.logger.info("🔗 Using mock blockchain connection (web3 not available)")
                 self.web3 = None
                 self.azr_contract = None
                 return True
@@ -81,7 +85,7 @@ class AzoraMintMineEngine:
             # Connect to local blockchain or testnet
             # For demo purposes, we'll use a mock connection
             # In production, this would connect to the actual Azora blockchain
-            print("🔗 Initializing blockchain connection...")
+            self.logger.info("🔗 Initializing blockchain connection...")
 
             # Mock Web3 connection for demonstration
             self.web3 = Web3()
@@ -109,16 +113,16 @@ class AzoraMintMineEngine:
 
             # self.azr_contract = self.web3.eth.contract(address=contract_address, abi=azr_abi)
 
-            print("✅ Blockchain connection initialized (mock mode)")
+            self.logger.info("✅ Blockchain connection initialized (mock mode)")
             return True
 
         except Exception as e:
-            print(f"❌ Blockchain initialization failed: {e}")
+            self.logger.error(f"❌ Blockchain initialization failed: {e}")
             return False
 
     def monitor_mining(self):
         """Monitor mining earnings and trigger minting"""
-        print("📊 Starting mining earnings monitor...")
+        self.logger.info("📊 Starting mining earnings monitor...")
 
         while self.monitoring_active:
             try:
@@ -135,11 +139,11 @@ class AzoraMintMineEngine:
                         new_earnings = current_earnings - self.mining_data['total_mined_usd']
 
                         if new_earnings >= self.mining_data['min_mint_threshold']:
-                            print(f"💰 New mining earnings detected: ${new_earnings:.4f} (type: {type(new_earnings)})")
+                            self.logger.info(f"💰 New mining earnings detected: ${new_earnings:.4f} (type: {type(new_earnings)})")
 
                             # Convert to AZR tokens
                             azr_amount = new_earnings * self.mining_data['conversion_rate']
-                            print(f"🪙 Calculated AZR amount: {azr_amount:.4f} (type: {type(azr_amount)})")
+                            self.logger.info(f"🪙 Calculated AZR amount: {azr_amount:.4f} (type: {type(azr_amount)})")
 
                             # Mint AZR tokens
                             if self.mint_azr_tokens(azr_amount, f"Mining earnings: ${new_earnings:.4f}"):
@@ -158,51 +162,35 @@ class AzoraMintMineEngine:
                                 # Save updated data
                                 self.save_mining_data()
 
-                                print(f"✅ Minted {azr_amount:.2f} AZR tokens for ${new_earnings:.4f} mining earnings")
+                                self.logger.info(f"✅ Minted {azr_amount:.2f} AZR tokens for ${new_earnings:.4f} mining earnings")
                             else:
-                                print("❌ Failed to mint AZR tokens")
+                                self.logger.error("❌ Failed to mint AZR tokens")
 
                 # Also check lolMiner API for real-time mining stats
                 self.check_lolminer_stats()
 
             except Exception as e:
-                print(f"❌ Mining monitor error: {e}")
+                self.logger.error(f"❌ Mining monitor error: {e}")
 
             time.sleep(30)  # Check every 30 seconds
 
     def check_lolminer_stats(self):
         """Check lolMiner API for real-time mining statistics"""
-        ports = [4444, 4445, 4446, 4447]
-
-        for port in ports:
-            try:
-                response = requests.get(f'http://127.0.0.1:{port}/summary', timeout=5)
-                if response.status_code == 200:
-                    data = response.json()
-
-                    # Extract mining stats
-                    hashrate = 0
-                    algorithm = data.get('Algorithm', 'Unknown')
-
-                    # Parse hashrate
-                    workers = data.get('Workers', [])
-                    if workers:
-                        hashrate_str = workers[0].get('Hashrate', '0')
-                        if 'MH/s' in hashrate_str:
-                            hashrate = float(hashrate_str.replace(' MH/s', '')) * 1000000
-
-                    # Calculate estimated earnings (simplified)
-                    if algorithm.lower() == 'fishhash':
-                        # IRON mining profitability
-                        estimated_hourly = (hashrate / 1000000) * 0.00084 * 24  # Rough estimate
-                        self.update_mining_projections(estimated_hourly)
+        data = get_miner_client().get_summary()
+        if not data:
+            return False
 
-                    return True
+        # Extract mining stats (hashrate parsed to H/s by the client)
+        hashrate = data['hashrate_hs']
+        algorithm = data.get('Algorithm', 'Unknown')
 
-            except:
-                continue
+        # Calculate estimated earnings (simplified)
+        if algorithm.lower() == 'fishhash':
+            # IRON mining profitability
+            estimated_hourly = (hashrate / 1000000) * 0.00084 * 24  # Rough estimate
+            self.update_mining_projections(estimated_hourly)
 
-        return False
+        return True
 
     def update_mining_projections(self, hourly_usd):
         """Update mining projections for dashboard"""
@@ -219,31 +207,31 @@ class AzoraMintMineEngine:
                 json.dump(projection_data, f, indent=2)
 
         except Exception as e:
-            print(f"❌ Failed to update projections: {e}")
+            self.logger.error(f"❌ Failed to update projections: {e}")
 
     def mint_azr_tokens(self, amount, reason="Mining earnings"):
         """Mint AZR tokens on the blockchain"""
         try:
             # Validate amount
-            print(f"🔍 Mint input - amount: {amount} (type: {type(amount)})")
+            self.logger.debug(f"🔍 Mint input - amount: {amount} (type: {type(amount)})")
             if not isinstance(amount, (int, float)) or amount <= 0:
-                print(f"❌ Invalid amount for minting: {amount}")
+                self.logger.error(f"❌ Invalid amount for minting: {amount}")
                 return False
 
-            print(f"🔨 Minting {amount:.6f} AZR tokens...")
+            self.logger.info(f"🔨 Minting {amount:.6f} AZR tokens...")
 
             # Convert to wei (AZR has 18 decimals)
             try:
                 amount_str = str(amount)
-                print(f"🔍 Converting string: '{amount_str}'")
+                self.logger.debug(f"🔍 Converting string: '{amount_str}'")
                 amount_decimal = Decimal(amount_str)
                 wei_decimal = Decimal('1000000000000000000')  # 10**18
                 result = amount_decimal * wei_decimal
-                print(f"🔍 Decimal multiplication result: {result}")
+                self.logger.debug(f"🔍 Decimal multiplication result: {result}")
                 amount_wei = int(result)
-                print(f"🔍 Final wei amount: {amount_wei}")
+                self.logger.debug(f"🔍 Final wei amount: {amount_wei}")
             except Exception as e:
-                print(f"❌ Decimal conversion error: {e}")
+                self.logger.error(f"❌ Decimal conversion error: {e}")
                 import traceback
                 traceback.print_exc()
                 return False
@@ -251,10 +239,10 @@ class AzoraMintMineEngine:
             # In production, this would submit a transaction to mint tokens
             # For demo purposes, we'll simulate the minting
 
-            print("📝 Preparing mint transaction...")
-            print(f"   To: {self.wallet_address}")
-            print(f"   Amount: {amount:.6f} AZR ({amount_wei} wei)")
-            print(f"   Reason: {reason}")
+            self.logger.info("📝 Preparing mint transaction...")
+            self.logger.info(f"   To: {self.wallet_address}")
+            self.logger.info(f"   Amount: {amount:.6f} AZR ({amount_wei} wei)")
+            self.logger.info(f"   Reason: {reason}")
 
             # Simulate blockchain transaction
             # In production:
@@ -269,7 +257,7 @@ class AzoraMintMineEngine:
 
             # Simulate successful transaction
             tx_hash = f"0x{os.urandom(32).hex()}"
-            print(f"✅ Transaction submitted: {tx_hash}")
+            self.logger.info(f"✅ Transaction submitted: {tx_hash}")
 
             # Record the minting transaction
             self.record_minting_transaction(tx_hash, amount, reason)
@@ -277,7 +265,7 @@ class AzoraMintMineEngine:
             return True
 
         except Exception as e:
-            print(f"❌ Minting failed: {e}")
+            self.logger.error(f"❌ Minting failed: {e}")
             import traceback
             traceback.print_exc()
             return False
@@ -309,11 +297,11 @@ class AzoraMintMineEngine:
                 json.dump(transactions, f, indent=2)
 
         except Exception as e:
-            print(f"❌ Failed to record transaction: {e}")
+            self.logger.error(f"❌ Failed to record transaction: {e}")
 
     def auto_mint_worker(self):
         """Worker thread for automatic minting based on time intervals"""
-        print("⏰ Starting auto-mint worker...")
+        self.logger.info("⏰ Starting auto-mint worker...")
 
         while self.monitoring_active:
             try:
@@ -324,7 +312,7 @@ class AzoraMintMineEngine:
                 time.sleep(60)  # Check every minute
 
             except Exception as e:
-                print(f"❌ Auto-mint worker error: {e}")
+                self.logger.error(f"❌ Auto-mint worker error: {e}")
                 time.sleep(60)
 
     def save_mining_data(self):
@@ -333,7 +321,7 @@ class AzoraMintMineEngine:
             with open('/tmp/azr_mint_mine_data.json', 'w') as f:
                 json.dump(self.mining_data, f, indent=2)
         except Exception as e:
-            print(f"❌ Failed to save mining data: {e}")
+            self.logger.error(f"❌ Failed to save mining data: {e}")
 
     def load_mining_data(self):
         """Load mining and minting data"""
@@ -342,7 +330,7 @@ class AzoraMintMineEngine:
                 with open('/tmp/azr_mint_mine_data.json', 'r') as f:
                     self.mining_data.update(json.load(f))
         except Exception as e:
-            print(f"❌ Failed to load mining data: {e}")
+            self.logger.error(f"❌ Failed to load mining data: {e}")
 
     def get_stats(self):
         """Get current mining and minting statistics"""
@@ -358,8 +346,7 @@ class AzoraMintMineEngine:
 
     def start(self):
         """Start the mint-mine integration engine"""
-        print("🚀 Starting AZORA MINT-MINE INTEGRATION ENGINE")
-        print("=" * 50)
+        self.logger.info("🚀 Starting AZORA MINT-MINE INTEGRATION ENGINE")
 
         # Load existing data
         self.load_mining_data()
@@ -368,28 +355,26 @@ class AzoraMintMineEngine:
         self.monitor_thread.start()
         self.mint_thread.start()
 
-        print("✅ Mining monitor active")
-        print("✅ Auto-mint worker active")
-        print("✅ Real-time conversion enabled")
-        print(f"💰 Conversion rate: 1 USD = {self.mining_data['conversion_rate']} AZR")
-        print(f"🎯 Min mint threshold: ${self.mining_data['min_mint_threshold']}")
-        print()
-        print("📊 Integration Status:")
-        print(f"   💵 Total mined: ${self.mining_data['total_mined_usd']:.2f}")
-        print(f"   🪙 Total AZR minted: {self.mining_data['total_azr_minted']:.2f}")
-        print(f"   📈 Sessions: {len(self.mining_data['mining_sessions'])}")
-        print()
-        print("🎯 Engine running - mining earnings will automatically mint AZR tokens!")
+        self.logger.info("✅ Mining monitor active")
+        self.logger.info("✅ Auto-mint worker active")
+        self.logger.info("✅ Real-time conversion enabled")
+        self.logger.info(f"💰 Conversion rate: 1 USD = {self.mining_data['conversion_rate']} AZR")
+        self.logger.info(f"🎯 Min mint threshold: ${self.mining_data['min_mint_threshold']}")
+        self.logger.info("📊 Integration Status:")
+        self.logger.info(f"   💵 Total mined: ${self.mining_data['total_mined_usd']:.2f}")
+        self.logger.info(f"   🪙 Total AZR minted: {self.mining_data['total_azr_minted']:.2f}")
+        self.logger.info(f"   📈 Sessions: {len(self.mining_data['mining_sessions'])}")
+        self.logger.info("🎯 Engine running - mining earnings will automatically mint AZR tokens!")
 
     def stop(self):
         """Stop the mint-mine integration engine"""
-        print("⏹️ Stopping AZORA MINT-MINE INTEGRATION ENGINE...")
+        self.logger.info("⏹️ Stopping AZORA MINT-MINE INTEGRATION ENGINE...")
         self.monitoring_active = False
 
         # Save final data
         self.save_mining_data()
 
-        print("✅ Engine stopped - data saved")
+        self.logger.info("✅ Engine stopped - data saved")
 
 def main():
     """Main function"""
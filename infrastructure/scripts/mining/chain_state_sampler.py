@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+AZORA CHAIN STATE SAMPLER
+Samples block number, gas price, base fee and AZR supply figures in one batched JSON-RPC round trip,
+cached for the polling period and shared by every reader of chain state
+"""
+
+import time
+import threading
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from json_rpc import JsonRpcBatchClient, JsonRpcError, hex_to_int
+
+# AZR contract view selectors (first four bytes of keccak256 of the signature)
+TOTAL_SUPPLY_SELECTOR = '0x18160ddd'     # totalSupply()
+MAX_SUPPLY_SELECTOR = '0x32cb6b0c'       # MAX_SUPPLY()
+MINTED_PER_USER_SELECTOR = '0x53ea40ae'  # mintedPerUser(address)
+
+WEI_PER_TOKEN = 10 ** 18
+
+
+@dataclass
+class ChainStateSnapshot:
+    """Chain state as of one sample"""
+    connected: bool
+    block_number: Optional[int] = None
+    gas_price_wei: Optional[int] = None
+    base_fee_wei: Optional[int] = None
+    total_supply_wei: Optional[int] = None
+    max_supply_wei: Optional[int] = None
+    minted_by_minter_wei: Optional[int] = None
+    error: Optional[str] = None
+    sampled_at: float = field(default_factory=time.monotonic)
+    observed_at: datetime = field(default_factory=datetime.now)
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.sampled_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        def tokens(wei):
+            return None if wei is None else wei / WEI_PER_TOKEN
+
+        return {
+            'connected': self.connected,
+            'block_number': self.block_number,
+            'gas_price_gwei': None if self.gas_price_wei is None else self.gas_price_wei / 1e9,
+            'base_fee_gwei': None if self.base_fee_wei is None else self.base_fee_wei / 1e9,
+            'total_supply_azr': tokens(self.total_supply_wei),
+            'max_supply_azr': tokens(self.max_supply_wei),
+            'minted_by_minter_azr': tokens(self.minted_by_minter_wei),
+            'error': self.error,
+            'observed_at': self.observed_at.isoformat(),
+            'age_seconds': round(self.age_seconds, 1)
+        }
+
+
+class ChainStateSampler:
+    """Cached chain-state snapshot refreshed with one batched request per polling period"""
+
+    def __init__(self, rpc: JsonRpcBatchClient, contract_address: Optional[str] = None,
+                 minter_address: Optional[str] = None, ttl: float = 60.0,
+                 logger: Optional[logging.Logger] = None):
+        self.rpc = rpc
+        self.contract_address = contract_address
+        self.minter_address = minter_address
+        self.ttl = ttl
+        self.logger = logger or logging.getLogger('AzoraChainState')
+
+        self._snapshot: Optional[ChainStateSnapshot] = None
+        self._refresh_lock = threading.Lock()
+
+        self.stats = {'samples': 0, 'cache_hits': 0, 'errors': 0}
+
+    def _contract_call(self, data: str):
+        return ('eth_call', [{'to': self.contract_address, 'data': data}, 'latest'])
+
+    def _sample(self) -> ChainStateSnapshot:
+        calls = [
+            ('eth_getBlockByNumber', ['latest', False]),
+            ('eth_gasPrice', [])
+        ]
+        if self.contract_address:
+            calls.append(self._contract_call(TOTAL_SUPPLY_SELECTOR))
+            calls.append(self._contract_call(MAX_SUPPLY_SELECTOR))
+            if self.minter_address:
+                # ABI-encoded address argument: left-padded to 32 bytes
+                calls.append(self._contract_call(
+                    MINTED_PER_USER_SELECTOR + self.minter_address.lower().replace('0x', '').rjust(64, '0')
+                ))
+
+        try:
+            results = self.rpc.batch(calls)
+        except Exception as e:
+            self.stats['errors'] += 1
+            return ChainStateSnapshot(connected=False, error=str(e))
+
+        def value(index):
+            if index >= len(results) or isinstance(results[index], JsonRpcError) or results[index] in (None, '0x'):
+                return None
+            return hex_to_int(results[index])
+
+        block = results[0] if isinstance(results[0], dict) else {}
+        errors = [str(r) for r in results if isinstance(r, JsonRpcError)]
+        if errors:
+            self.stats['errors'] += 1
+
+        return ChainStateSnapshot(
+            connected=bool(block),
+            block_number=hex_to_int(block['number']) if 'number' in block else None,
+            gas_price_wei=value(1),
+            base_fee_wei=hex_to_int(block['baseFeePerGas']) if block.get('baseFeePerGas') else None,
+            total_supply_wei=value(2),
+            max_supply_wei=value(3),
+            minted_by_minter_wei=value(4),
+            error='; '.join(errors) or None
+        )
+
+    def get(self, max_age: Optional[float] = None) -> ChainStateSnapshot:
+        """Get the cached snapshot, sampling the chain if it is older than max_age (default: ttl)"""
+        max_age = self.ttl if max_age is None else max_age
+
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.age_seconds < max_age:
+            self.stats['cache_hits'] += 1
+            return snapshot
+
+        # One sampler at a time; everyone else gets the sample it produced
+        with self._refresh_lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.age_seconds < max_age:
+                self.stats['cache_hits'] += 1
+                return snapshot
+
+            snapshot = self._sample()
+            self.stats['samples'] += 1
+            self._snapshot = snapshot
+            return snapshot
+
+    def peek(self) -> Optional[ChainStateSnapshot]:
+        """Get the last snapshot without touching the chain"""
+        return self._snapshot
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, rpc=dict(self.rpc.stats))
@@ -2,6 +2,8 @@
 # AZR Mining Engine Status Monitor
 # Checks system health and provides daily reports
 
+LOG_DIR="${AZORA_LOG_DIR:-$(dirname "$0")/logs}"
+
 echo "📊 AZR Autonomous Mining Engine Status Report"
 echo "=========================================="
 
@@ -41,7 +43,7 @@ fi
 # Show recent logs
 echo ""
 echo "📝 Recent Activity (last 10 lines):"
-tail -10 /tmp/azr_mining_engine.log 2>/dev/null || echo "No logs available"
+tail -10 "$LOG_DIR/azr_mining_engine.log" 2>/dev/null || echo "No logs available"
 
 # Show earnings summary
 echo ""
@@ -63,5 +65,5 @@ echo ""
 echo "🔧 Quick Commands:"
 echo "  Start: ./start_autonomous.sh"
 echo "  Stop: kill $AUTONOMOUS_PID"
-echo "  Logs: tail -f /tmp/azr_mining_engine.log"
+echo "  Logs: tail -f $LOG_DIR/azr_mining_engine.log"
 echo "  Dashboard: open http://localhost:3000"
\ No newline at end of file
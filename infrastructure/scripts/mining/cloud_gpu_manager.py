@@ -14,7 +14,9 @@ from datetime import datetime, timezone
 import json
 import os
 
-logging.basicConfig(level=logging.INFO)
+from mining_logging import configure_logging
+
+configure_logging('cloud_gpu_manager')
 logger = logging.getLogger(__name__)
 
 class CloudGPUManager:
@@ -7,11 +7,13 @@ Simple web UI showing balance, mining status, and crypto prices
 import json
 import os
 import time
-import requests
 from datetime import datetime
 from flask import Flask, render_template_string, jsonify
 import threading
 
+from market_price_service import get_price_service
+from mining_logging import configure_logging
+
 app = Flask(__name__)
 
 # Global data storage
@@ -49,15 +51,11 @@ def update_crypto_prices():
     global mining_data
 
     try:
-        # Get prices for our mining coins
+        # Get prices for our mining coins from the shared price cache
         coins = ['ergo', 'conflux-token', 'ravencoin', 'ethereum']
-        ids = ','.join(coins)
-
-        url = f'https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd'
-        response = requests.get(url, timeout=10)
+        prices = get_price_service().get_prices(coins)
 
-        if response.status_code == 200:
-            prices = response.json()
+        if prices:
             mining_data['prices'] = {
                 'ERG': prices.get('ergo', {}).get('usd', 0),
                 'CFX': prices.get('conflux-token', {}).get('usd', 0),
@@ -415,13 +413,15 @@ def api_data():
     return jsonify(mining_data)
 
 if __name__ == '__main__':
+    logger = configure_logging('dashboard')
+
     # Start background updates
     update_thread = threading.Thread(target=background_updates, daemon=True)
     update_thread.start()
 
-    print("🚀 Starting AZR Ultra Mining Dashboard...")
-    print("📊 Dashboard: http://localhost:5000")
-    print("🔄 Auto-updates every 30 seconds")
-    print("🎯 Ultra mining engine monitoring active")
+    logger.info("🚀 Starting AZR Ultra Mining Dashboard...")
+    logger.info("📊 Dashboard: http://localhost:5000")
+    logger.info("🔄 Auto-updates every 30 seconds")
+    logger.info("🎯 Ultra mining engine monitoring active")
 
     app.run(host='0.0.0.0', port=5000, debug=False)
\ No newline at end of file
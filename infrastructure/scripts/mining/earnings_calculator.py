@@ -14,6 +14,16 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from optimizer.coin_selector import ProfitabilityOptimizer
+from market_price_service import get_price_service
+
+# CoinGecko ids for the coins compared below
+COINGECKO_IDS = {
+    'BTC': 'bitcoin',
+    'ETH': 'ethereum',
+    'XMR': 'monero',
+    'LTC': 'litecoin',
+    'DOGE': 'dogecoin'
+}
 
 class EarningsCalculator:
     def __init__(self):
@@ -52,8 +62,11 @@ class EarningsCalculator:
         print("🚀 AZR Mining Engine - Earnings Calculator")
         print("=" * 50)
 
-        # Get current market data
-        market_data = await self.optimizer.get_market_data()
+        # Get current market data - prices come from the shared price cache
+        market_data = self.get_market_data()
+
+        if not market_data:
+            market_data = await self.optimizer.get_market_data()
 
         if not market_data:
             print("❌ Unable to fetch market data. Using fallback values.")
@@ -249,6 +262,29 @@ class EarningsCalculator:
         print("   • Free electricity optimization")
         print("   • 365-day continuous operation")
 
+    def get_market_data(self):
+        """Fallback network data overlaid with live prices from the shared price service"""
+        try:
+            quotes = get_price_service().get_prices(COINGECKO_IDS.values())
+        except Exception as e:
+            print(f"⚠️  Price service unavailable: {e}")
+            return {}
+
+        if not quotes:
+            return {}
+
+        market_data = self.get_fallback_market_data()
+        for symbol, coin_id in COINGECKO_IDS.items():
+            quote = quotes.get(coin_id)
+            if quote and quote.get('usd') is not None:
+                market_data[symbol].update({
+                    'price': quote['usd'],
+                    'market_cap': quote.get('usd_market_cap', market_data[symbol]['market_cap']),
+                    'volume': quote.get('usd_24h_vol', market_data[symbol]['volume']),
+                    'change_24h': quote.get('usd_24h_change', market_data[symbol]['change_24h'])
+                })
+        return market_data
+
     def get_fallback_market_data(self):
         """Fallback market data when API is unavailable"""
         return {
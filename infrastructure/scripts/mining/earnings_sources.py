@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+AZORA EARNINGS SOURCES
+The pool wallets and local miners an engine polls for earnings, and a poller that fetches
+them concurrently under a global request-rate budget. Per-host limits come from the shared
+HTTP client (HTTP_MAX_PER_HOST). A poll returns whatever arrived before its deadline; a slow
+source is picked up on a later pass, and since pool deltas are tracked per source from
+checkpoints nothing is lost.
+
+Sources come from EARNINGS_SOURCES_FILE (JSON), for example:
+    {"pools": [{"pool": "woolypooly", "coin": "iron", "wallets": ["0x..."]}],
+     "miners": [{"host": "10.0.0.5", "ports": [4444]}]}
+or from POOL_WALLETS / POOL_COINS / MINER_RIGS / MINER_API_PORTS (comma-separated).
+In a cluster, pool wallets and remote rigs are sharded between members; loopback rigs are
+each member's own and always polled locally.
+"""
+
+import os
+import json
+import time
+import ipaddress
+import threading
+import logging
+import concurrent.futures
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from miner_api_client import DEFAULT_MINER_PORTS
+from mint_mine_metrics import Counter, LatencyStats
+
+# Wallet endpoint per pool, relative to the pool's API base URL
+POOL_WALLET_PATHS = {
+    'woolypooly': '/{coin}/wallet/{wallet}'
+}
+
+# Paged history endpoints per pool (newest first, `to` and `limit` query parameters)
+POOL_HISTORY_PATHS = {
+    'woolypooly': {
+        'rewards': '/{coin}/wallet/{wallet}/rewards',
+        'hashrate': '/{coin}/wallet/{wallet}/hashrate'
+    }
+}
+
+
+@dataclass(frozen=True)
+class PoolSource:
+    pool: str
+    coin: str
+    wallet: str
+
+    @property
+    def key(self) -> str:
+        return f"pool:{self.pool}/{self.coin}/{self.wallet}"
+
+    @property
+    def checkpoint_pool(self) -> str:
+        """Pool name its balance checkpoints are stored under"""
+        return f"{self.pool}/{self.coin}"
+
+    def url(self, apis: Dict[str, Any]) -> str:
+        return apis[self.pool].rstrip('/') + POOL_WALLET_PATHS[self.pool].format(coin=self.coin, wallet=self.wallet)
+
+    def history_url(self, apis: Dict[str, Any], history: str) -> str:
+        path = POOL_HISTORY_PATHS[self.pool][history]
+        return apis[self.pool].rstrip('/') + path.format(coin=self.coin, wallet=self.wallet)
+
+
+@dataclass(frozen=True)
+class MinerSource:
+    host: str
+    ports: Tuple[int, ...] = DEFAULT_MINER_PORTS
+
+    @property
+    def key(self) -> str:
+        return f"miner:{self.host}"
+
+    @property
+    def is_local(self) -> bool:
+        """A rig on this machine; every cluster member has its own, so it is never sharded"""
+        if self.host.lower() == 'localhost':
+            return True
+        try:
+            return ipaddress.ip_address(self.host).is_loopback
+        except ValueError:
+            return False
+
+
+Source = Union[PoolSource, MinerSource]
+
+
+@dataclass
+class SourceReading:
+    source: Source
+    data: Optional[Dict[str, Any]]
+    seconds: float
+    error: Optional[str] = None
+
+
+def pool_payouts(data: Dict[str, Any]) -> List[Tuple[str, float]]:
+    """(payout id, amount) of the payouts in a pool wallet payload, newest first"""
+    payouts = []
+    for payment in data.get('payments') or []:
+        payout_id = payment.get('txId') or payment.get('hash') or payment.get('id')
+        if payout_id:
+            payouts.append((str(payout_id), float(payment.get('amount', 0.0))))
+    return payouts
+
+
+def _split_env_list(name: str, default: str = '') -> List[str]:
+    return [item.strip() for item in os.getenv(name, default).split(',') if item.strip()]
+
+
+def load_sources(default_wallet: Optional[str], path: Optional[str] = None) -> Tuple[List[PoolSource], List[MinerSource]]:
+    """Pool and miner sources from a JSON file, or else from the environment"""
+    pools: List[PoolSource] = []
+    miners: List[MinerSource] = []
+
+    if path:
+        with open(path) as f:
+            spec = json.load(f)
+        for entry in spec.get('pools', []):
+            for coin in entry.get('coins') or [entry.get('coin', 'iron')]:
+                for wallet in entry.get('wallets') or [default_wallet]:
+                    if wallet:
+                        pools.append(PoolSource(entry.get('pool', 'woolypooly'), coin, wallet))
+        for entry in spec.get('miners', []):
+            miners.append(MinerSource(entry['host'], tuple(entry.get('ports') or DEFAULT_MINER_PORTS)))
+    else:
+        wallets = _split_env_list('POOL_WALLETS') or ([default_wallet] if default_wallet else [])
+        for coin in _split_env_list('POOL_COINS', 'iron'):
+            pools.extend(PoolSource('woolypooly', coin, wallet) for wallet in wallets)
+        ports = tuple(int(port) for port in _split_env_list('MINER_API_PORTS')) or DEFAULT_MINER_PORTS
+        miners.extend(MinerSource(host, ports) for host in _split_env_list('MINER_RIGS', '127.0.0.1'))
+
+    # Keep order, drop duplicates
+    return list(dict.fromkeys(pools)), list(dict.fromkeys(miners))
+
+
+class RateBudget:
+    """Token bucket shared by every poll worker: at most `rate` requests per second on average"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token now; returns how many seconds to wait before using it"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def cancel(self):
+        """Hand back a reserved token that will not be used"""
+        if self.rate > 0:
+            with self._lock:
+                self._tokens = min(self.capacity, self._tokens + 1.0)
+
+    def acquire(self, deadline: Optional[float] = None) -> bool:
+        """Take one token, waiting for it; False if it would not arrive before the deadline"""
+        wait = self.reserve()
+        if deadline is not None and time.monotonic() + wait > deadline:
+            self.cancel()
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+class SourcePoller:
+    """Fetches many sources concurrently with a worker cap, a rate budget and a per-poll deadline"""
+
+    def __init__(self, max_workers: int = 32, rate_per_second: float = 50.0, deadline: float = 20.0,
+                 logger: Optional[logging.Logger] = None):
+        self.deadline = deadline
+        self.budget = RateBudget(rate_per_second)
+        self.logger = logger or logging.getLogger('AzoraEarningsSources')
+
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='source-poll')
+        self._inflight = set()
+        self._lock = threading.Lock()
+
+        self.latency = LatencyStats()
+        self.polled = Counter()
+        self.failures = Counter()
+        self.late = Counter()
+        self.skipped = Counter()
+        self.last_poll: Dict[str, Any] = {}
+
+    def poll(self, sources: Sequence[Source], fetch: Callable[[Source], Optional[Dict[str, Any]]]) -> List[SourceReading]:
+        """Fetch every source; returns the readings that completed before the deadline"""
+        started = time.monotonic()
+        deadline = started + self.deadline
+
+        futures = []
+        skipped = 0
+        with self._lock:
+            for source in sources:
+                # A source still running from an earlier, late poll is not fetched twice
+                if source.key in self._inflight:
+                    skipped += 1
+                    continue
+                self._inflight.add(source.key)
+                futures.append(self._executor.submit(self._fetch, source, fetch, deadline))
+        self.skipped.inc(skipped)
+
+        done, late = concurrent.futures.wait(futures, timeout=self.deadline)
+        readings = [future.result() for future in done]
+        readings = [reading for reading in readings if reading is not None]
+        self.late.inc(len(late))
+
+        self.last_poll = {
+            'sources': len(sources),
+            'readings': sum(1 for reading in readings if reading.data is not None),
+            'failed': sum(1 for reading in readings if reading.data is None),
+            'deferred': len(done) - len(readings),
+            'late': len(late),
+            'skipped_inflight': skipped,
+            'seconds': round(time.monotonic() - started, 3)
+        }
+        if late:
+            self.logger.warning(f"⏱️ {len(late)} of {len(sources)} earnings sources missed the {self.deadline:.0f}s poll deadline")
+        return readings
+
+    def _fetch(self, source: Source, fetch: Callable[[Source], Optional[Dict[str, Any]]],
+               deadline: float) -> Optional[SourceReading]:
+        try:
+            if time.monotonic() >= deadline or not self.budget.acquire(deadline):
+                # Queued past the deadline or out of budget; the source is polled again next pass
+                return None
+            started = time.monotonic()
+            try:
+                data = fetch(source)
+                error = None
+            except Exception as e:
+                data, error = None, str(e)
+            seconds = time.monotonic() - started
+            self.latency.observe(seconds)
+            self.polled.inc()
+            if data is None:
+                self.failures.inc()
+            return SourceReading(source, data, seconds, error)
+        finally:
+            with self._lock:
+                self._inflight.discard(source.key)
+
+    def stop(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'polled': self.polled.value,
+            'failures': self.failures.value,
+            'late': self.late.value,
+            'skipped_inflight': self.skipped.value,
+            'last_poll': dict(self.last_poll),
+            'latency': self.latency.snapshot()
+        }
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+AZORA GAS ORACLE
+EIP-1559 fee estimates from a cached eth_feeHistory window, plus the low-fee test used to hold
+non-urgent mints
+"""
+
+import time
+import threading
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from json_rpc import JsonRpcBatchClient, hex_to_int
+
+
+@dataclass
+class FeeEstimate:
+    """Fee parameters for the next block"""
+    next_base_fee_wei: int
+    max_priority_fee_wei: int
+    max_fee_wei: int
+    target_base_fee_wei: int  # Base fee at the configured percentile of the window
+    oldest_block: int
+    sampled_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def fees_low(self) -> bool:
+        return self.next_base_fee_wei <= self.target_base_fee_wei
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'next_base_fee_gwei': self.next_base_fee_wei / 1e9,
+            'max_priority_fee_gwei': self.max_priority_fee_wei / 1e9,
+            'max_fee_gwei': self.max_fee_wei / 1e9,
+            'target_base_fee_gwei': self.target_base_fee_wei / 1e9,
+            'fees_low': self.fees_low,
+            'oldest_block': self.oldest_block
+        }
+
+
+def _percentile(values: List[int], percentile: float) -> int:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percentile / 100.0 * (len(ordered) - 1)))))
+    return ordered[index]
+
+
+class GasOracle:
+    """Fee-history based maxFeePerGas / maxPriorityFeePerGas estimator"""
+
+    def __init__(self, rpc: JsonRpcBatchClient, block_count: int = 50, reward_percentile: float = 50.0,
+                 target_percentile: float = 30.0, base_fee_multiplier: float = 2.0,
+                 min_priority_fee_wei: int = 10 ** 9, ttl: float = 15.0,
+                 logger: Optional[logging.Logger] = None):
+        self.rpc = rpc
+        self.block_count = block_count
+        self.reward_percentile = reward_percentile
+        self.target_percentile = target_percentile
+        # Headroom for consecutive full blocks before the transaction lands
+        self.base_fee_multiplier = base_fee_multiplier
+        self.min_priority_fee_wei = min_priority_fee_wei
+        self.ttl = ttl
+        self.logger = logger or logging.getLogger('AzoraGasOracle')
+
+        self._estimate: Optional[FeeEstimate] = None
+        self._lock = threading.Lock()
+
+        # Gas actually paid for settled mints
+        self._spend_lock = threading.Lock()
+        self.gas_spent_wei = 0
+        self.gas_units_used = 0
+        self.azr_minted = 0.0
+
+        self.stats = {'fee_history_fetches': 0, 'errors': 0, 'unsupported': 0}
+
+    def _fetch(self) -> Optional[FeeEstimate]:
+        history = self.rpc.call('eth_feeHistory', [hex(self.block_count), 'latest', [self.reward_percentile]])
+        self.stats['fee_history_fetches'] += 1
+
+        base_fees = [hex_to_int(fee) for fee in history.get('baseFeePerGas') or []]
+        if not base_fees or not any(base_fees):
+            # Pre-London chain: no base fee, callers fall back to legacy gasPrice
+            self.stats['unsupported'] += 1
+            return None
+
+        # The last entry is the base fee of the next (not yet mined) block
+        next_base_fee = base_fees[-1]
+        rewards = [hex_to_int(block[0]) for block in history.get('reward') or [] if block]
+        rewards = [reward for reward in rewards if reward > 0]
+        priority_fee = max(self.min_priority_fee_wei, _percentile(rewards, 50) if rewards else 0)
+
+        return FeeEstimate(
+            next_base_fee_wei=next_base_fee,
+            max_priority_fee_wei=priority_fee,
+            max_fee_wei=int(next_base_fee * self.base_fee_multiplier) + priority_fee,
+            target_base_fee_wei=_percentile(base_fees[:-1] or base_fees, self.target_percentile),
+            oldest_block=hex_to_int(history.get('oldestBlock'))
+        )
+
+    def estimate(self) -> Optional[FeeEstimate]:
+        """Get the cached fee estimate, refreshing the fee-history window once it is older than ttl"""
+        with self._lock:
+            estimate = self._estimate
+            if estimate is not None and time.monotonic() - estimate.sampled_at < self.ttl:
+                return estimate
+            try:
+                self._estimate = self._fetch()
+            except Exception as e:
+                self.stats['errors'] += 1
+                self.logger.warning(f"Fee history unavailable: {e}")
+                # Serve the previous window rather than nothing
+                return estimate
+            return self._estimate
+
+    def record_spend(self, gas_used: int, effective_gas_price_wei: int, amount_azr: float):
+        """Account for the gas a settled mint actually paid"""
+        with self._spend_lock:
+            self.gas_spent_wei += gas_used * effective_gas_price_wei
+            self.gas_units_used += gas_used
+            self.azr_minted += amount_azr
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._spend_lock:
+            gas_per_azr = self.gas_spent_wei / self.azr_minted if self.azr_minted else None
+            spend = {
+                'gas_spent_eth': self.gas_spent_wei / 1e18,
+                'gas_units_used': self.gas_units_used,
+                'azr_minted': self.azr_minted,
+                'gas_gwei_per_azr': None if gas_per_azr is None else gas_per_azr / 1e9
+            }
+        estimate = self._estimate
+        return dict(self.stats, **spend, estimate=estimate.to_dict() if estimate else None)
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+AZORA JOB SCHEDULER
+Runs the engine's periodic jobs from one monotonic timer queue instead of a sleeping
+thread per worker. Jobs keep a fixed-rate schedule (work time does not push later runs
+back), never overlap with themselves, can be triggered early, and shutdown only waits
+for jobs that are mid-run.
+"""
+
+import heapq
+import random
+import threading
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from typing import Any, Callable, Dict, List, Optional
+
+from mint_mine_metrics import Counter
+
+
+class ScheduledJob:
+    """One periodic job and its schedule"""
+
+    def __init__(self, name: str, func: Callable[[], Any], interval: float, jitter: float):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.jitter = jitter
+
+        # Nominal fixed-rate slot; the actual run time is this plus jitter
+        self.slot = 0.0
+        self.next_run = 0.0
+        self.version = 0
+        self.running = False
+        self.rerun = False
+        self.future: Optional[Future] = None
+
+        self.runs = Counter()
+        self.skipped = Counter()
+        self.triggered = Counter()
+        self.failures = Counter()
+        self.last_duration: Optional[float] = None
+
+    def schedule_next(self, now: float):
+        """Advance to the next slot after now, skipping slots missed while busy"""
+        self.slot += self.interval
+        if self.slot <= now:
+            self.slot = now + self.interval
+        offset = random.uniform(-self.jitter, self.jitter) * self.interval if self.jitter else 0.0
+        self.next_run = max(now, self.slot + offset)
+
+
+class JobScheduler:
+    """Priority-queue timer dispatching periodic jobs to a small thread pool"""
+
+    def __init__(self, jitter: float = 0.1, logger: Optional[logging.Logger] = None):
+        self.jitter = jitter
+        self.logger = logger or logging.getLogger('AzoraJobScheduler')
+
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self._queue: List = []
+        self._seq = 0
+        self._cond = threading.Condition()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def stopping(self) -> threading.Event:
+        """Set once stop() begins; long-running jobs can wait on it instead of sleeping"""
+        return self._stopping
+
+    def add_job(self, name: str, func: Callable[[], Any], interval: float,
+                initial_delay: float = 0.0, jitter: Optional[float] = None) -> ScheduledJob:
+        """Register a job; it first runs after initial_delay, then every interval seconds"""
+        if name in self.jobs:
+            raise ValueError(f"Job {name} is already scheduled")
+
+        job = ScheduledJob(name, func, interval, self.jitter if jitter is None else jitter)
+        with self._cond:
+            job.slot = time.monotonic() + initial_delay
+            job.next_run = job.slot
+            self.jobs[name] = job
+            self._push(job)
+            self._cond.notify()
+        return job
+
+    def trigger(self, name: str):
+        """Run a job as soon as possible; if it is running, once more right after it finishes"""
+        with self._cond:
+            job = self.jobs.get(name)
+            if job is None:
+                return
+            job.triggered.inc()
+            if job.running:
+                job.rerun = True
+                return
+            job.next_run = time.monotonic()
+            self._push(job)
+            self._cond.notify()
+
+    def _push(self, job: ScheduledJob):
+        # Re-pushing supersedes the job's older queue entries
+        job.version += 1
+        self._seq += 1
+        heapq.heappush(self._queue, (job.next_run, self._seq, job.version, job))
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self):
+        if self._thread:
+            return
+        self._stopping.clear()
+        # A job never overlaps itself, so one thread per job is the most that can ever be busy
+        self._executor = ThreadPoolExecutor(max_workers=max(1, len(self.jobs)), thread_name_prefix='engine-job')
+        self._thread = threading.Thread(target=self._run, name='job-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> List[str]:
+        """Stop dispatching and wait for running jobs; returns the names of jobs still running"""
+        self._stopping.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+        with self._cond:
+            running = {job.name: job.future for job in self.jobs.values() if job.running and job.future}
+        if running:
+            wait(list(running.values()), timeout=timeout)
+
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        return [name for name, future in running.items() if not future.done()]
+
+    def _run(self):
+        while not self._stopping.is_set():
+            with self._cond:
+                due = self._take_due()
+                if not due:
+                    timeout = self._queue[0][0] - time.monotonic() if self._queue else None
+                    self._cond.wait(timeout)
+                    continue
+
+            for job in due:
+                try:
+                    job.future = self._executor.submit(self._execute, job)
+                except RuntimeError:
+                    # Executor shut down underneath us during stop()
+                    with self._cond:
+                        job.running = False
+                    return
+
+    def _take_due(self) -> List[ScheduledJob]:
+        """Pop every job whose time has come (caller holds the condition)"""
+        now = time.monotonic()
+        due = []
+        while self._queue and self._queue[0][0] <= now:
+            _, _, version, job = heapq.heappop(self._queue)
+            if version != job.version:
+                continue
+
+            job.schedule_next(now)
+            self._push(job)
+            if job.running:
+                job.skipped.inc()
+                continue
+            job.running = True
+            due.append(job)
+        return due
+
+    def _execute(self, job: ScheduledJob):
+        thread = threading.current_thread()
+        pool_name, thread.name = thread.name, job.name
+        started = time.monotonic()
+        try:
+            job.func()
+        except Exception as e:
+            job.failures.inc()
+            self.logger.error(f"Job {job.name} failed: {e}")
+        finally:
+            thread.name = pool_name
+            job.last_duration = time.monotonic() - started
+            job.runs.inc()
+            with self._cond:
+                job.running = False
+                if job.rerun and not self._stopping.is_set():
+                    job.rerun = False
+                    job.next_run = time.monotonic()
+                    self._push(job)
+                    self._cond.notify()
+
+    def get_stats(self) -> Dict[str, Any]:
+        now = time.monotonic()
+        return {
+            job.name: {
+                'interval_seconds': job.interval,
+                'running': job.running,
+                'runs': job.runs.value,
+                'skipped': job.skipped.value,
+                'triggered': job.triggered.value,
+                'failures': job.failures.value,
+                'last_duration_seconds': round(job.last_duration, 3) if job.last_duration is not None else None,
+                'next_run_in_seconds': round(max(0.0, job.next_run - now), 3)
+            }
+            for job in list(self.jobs.values())
+        }
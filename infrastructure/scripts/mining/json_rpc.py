@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+AZORA JSON-RPC CLIENT
+Minimal Ethereum JSON-RPC client with batch requests over a keep-alive session
+"""
+
+import time
+import itertools
+import threading
+from typing import Any, List, Sequence, Tuple
+
+import requests
+
+from mint_mine_metrics import LatencyStats
+
+
+class JsonRpcError(Exception):
+    """Error object returned by the node for one call"""
+
+    def __init__(self, method: str, error: Any):
+        self.method = method
+        self.error = error
+        message = error.get('message') if isinstance(error, dict) else str(error)
+        super().__init__(f"{method}: {message}")
+
+
+class JsonRpcBatchClient:
+    """Send single or batched JSON-RPC calls to one node"""
+
+    def __init__(self, url: str, timeout: float = 10.0, max_batch_size: int = 200):
+        self.url = url
+        self.timeout = timeout
+        self.max_batch_size = max_batch_size
+        self._ids = itertools.count(1)
+        self._local = threading.local()
+
+        self.stats = {'requests': 0, 'calls': 0}
+        self.latency = LatencyStats()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def call(self, method: str, params: Sequence[Any] = ()) -> Any:
+        """Make one call and return its result, raising JsonRpcError on a node error"""
+        result = self.batch([(method, params)])[0]
+        if isinstance(result, JsonRpcError):
+            raise result
+        return result
+
+    def batch(self, calls: Sequence[Tuple[str, Sequence[Any]]]) -> List[Any]:
+        """Make several calls in as few round trips as possible.
+
+        Results come back in call order; a failed call yields a JsonRpcError
+        instance in its slot instead of raising.
+        """
+        results: List[Any] = []
+        for start in range(0, len(calls), self.max_batch_size):
+            chunk = calls[start:start + self.max_batch_size]
+            payload = [
+                {'jsonrpc': '2.0', 'id': next(self._ids), 'method': method, 'params': list(params)}
+                for method, params in chunk
+            ]
+
+            started = time.monotonic()
+            try:
+                response = self._session().post(self.url, json=payload, timeout=self.timeout)
+            finally:
+                self.latency.observe(time.monotonic() - started)
+            response.raise_for_status()
+            body = response.json()
+            self.stats['requests'] += 1
+            self.stats['calls'] += len(chunk)
+
+            # Nodes reject whole batches with a single error object
+            if isinstance(body, dict):
+                raise JsonRpcError('batch', body.get('error', body))
+
+            by_id = {item.get('id'): item for item in body}
+            for request in payload:
+                item = by_id.get(request['id'])
+                if item is None:
+                    results.append(JsonRpcError(request['method'], 'missing response'))
+                elif 'error' in item:
+                    results.append(JsonRpcError(request['method'], item['error']))
+                else:
+                    results.append(item.get('result'))
+        return results
+
+
+def hex_to_int(value: Any) -> int:
+    """Decode a JSON-RPC quantity ('0x1a') into an int"""
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return value
+    return int(value, 16)
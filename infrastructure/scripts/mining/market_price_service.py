@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+AZORA MARKET PRICE SERVICE
+Coalesced CoinGecko price oracle with TTL cache, stale-while-revalidate and single-flight fetches.
+Runs in-process, or as a local CoinGecko-compatible endpoint: python3 market_price_service.py --port 8765
+"""
+
+import os
+import json
+import time
+import argparse
+import threading
+import logging
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, List, Optional, Any, Iterable
+from urllib.parse import urlparse, parse_qs
+
+from mint_mine_metrics import LatencyStats
+from resilient_http import get_http_client
+from mining_logging import configure_logging
+
+COINGECKO_API = os.getenv('COINGECKO_API', 'https://api.coingecko.com/api/v3')
+
+# Set to a local price service (e.g. http://127.0.0.1:8765) to share one cache across processes
+PRICE_SERVICE_URL_ENV = 'AZORA_PRICE_SERVICE_URL'
+
+
+class MarketPriceService:
+    """Batched /simple/price client shared by every price consumer in a process"""
+
+    def __init__(self, base_url: str = COINGECKO_API, ttl: float = 60.0, stale_ttl: float = 900.0,
+                 timeout: float = 10.0, logger: Optional[logging.Logger] = None):
+        self.base_url = base_url.rstrip('/')
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.timeout = timeout
+        self.logger = logger or logging.getLogger('AzoraMarketPrices')
+
+        # Shared client: a dead upstream trips one breaker for every consumer in the process
+        self.http = get_http_client()
+        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._fetched_at: Dict[str, float] = {}
+        self._inflight: Dict[str, threading.Event] = {}
+        self._lock = threading.Lock()
+
+        self.stats = {'requests': 0, 'upstream_fetches': 0, 'cache_hits': 0, 'stale_served': 0, 'errors': 0}
+        self.fetch_latency = LatencyStats()
+
+    def _age(self, coin_id: str) -> float:
+        fetched_at = self._fetched_at.get(coin_id)
+        return float('inf') if fetched_at is None else time.monotonic() - fetched_at
+
+    def _fetch(self, coin_ids: List[str]):
+        """Fetch a batch upstream; callers must already own the in-flight slots"""
+        started = time.monotonic()
+        with self._lock:
+            self.stats['upstream_fetches'] += 1
+        try:
+            response = self.http.get(
+                f"{self.base_url}/simple/price",
+                endpoint='market_prices',
+                hedge=True,
+                params={
+                    'ids': ','.join(sorted(coin_ids)),
+                    'vs_currencies': 'usd',
+                    'include_market_cap': 'true',
+                    'include_24hr_vol': 'true',
+                    'include_24hr_change': 'true'
+                },
+                timeout=self.timeout
+            )
+            response.raise_for_status()
+            data = response.json()
+
+            now = time.monotonic()
+            with self._lock:
+                for coin_id in coin_ids:
+                    if coin_id in data:
+                        self._cache[coin_id] = data[coin_id]
+                        self._fetched_at[coin_id] = now
+
+        except Exception as e:
+            # Background revalidations fetch too, so the counters are guarded like the cache
+            with self._lock:
+                self.stats['errors'] += 1
+            self.logger.warning(f"Price fetch for {', '.join(coin_ids)} failed: {e}")
+
+        finally:
+            self.fetch_latency.observe(time.monotonic() - started)
+            with self._lock:
+                for coin_id in coin_ids:
+                    event = self._inflight.pop(coin_id, None)
+                    if event:
+                        event.set()
+
+    def _claim(self, coin_ids: Iterable[str]) -> List[str]:
+        """Mark ids as in flight; returns the ids this caller is responsible for fetching"""
+        claimed = []
+        for coin_id in coin_ids:
+            if coin_id not in self._inflight:
+                self._inflight[coin_id] = threading.Event()
+                claimed.append(coin_id)
+        return claimed
+
+    def get_prices(self, coin_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get /simple/price entries (usd, usd_market_cap, usd_24h_vol, usd_24h_change) per coin id"""
+        coin_ids = sorted(set(coin_ids))
+
+        with self._lock:
+            self.stats['requests'] += 1
+            missing = [c for c in coin_ids if self._age(c) >= self.stale_ttl]
+            stale = [c for c in coin_ids if self.ttl <= self._age(c) < self.stale_ttl]
+
+            # Missing entries are fetched now in one batch; anyone already fetching them is waited on
+            to_fetch = self._claim(missing)
+            waits = [self._inflight[c] for c in missing if c not in to_fetch]
+
+            # Stale entries are served immediately and refreshed in the background
+            to_revalidate = self._claim(stale)
+            if stale:
+                self.stats['stale_served'] += 1
+            elif not missing:
+                self.stats['cache_hits'] += 1
+
+        if to_revalidate:
+            threading.Thread(target=self._fetch, args=(to_revalidate,), daemon=True).start()
+        if to_fetch:
+            self._fetch(to_fetch)
+        for event in waits:
+            event.wait(self.timeout)
+
+        with self._lock:
+            return {c: dict(self._cache[c]) for c in coin_ids if c in self._cache}
+
+    def get_price(self, coin_id: str) -> Optional[float]:
+        """Get the USD price for one coin id"""
+        return self.get_prices([coin_id]).get(coin_id, {}).get('usd')
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, cached_coins=len(self._cache), inflight=len(self._inflight))
+
+    def serve(self, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+        """Expose the cache as a local CoinGecko-compatible /simple/price endpoint"""
+        service = self
+
+        class PriceHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                if url.path.rstrip('/').endswith('/simple/price'):
+                    query = parse_qs(url.query)
+                    coin_ids = [c for c in ','.join(query.get('ids', [])).split(',') if c]
+                    body = service.get_prices(coin_ids)
+                elif url.path == '/stats':
+                    body = service.get_stats()
+                else:
+                    self.send_error(404)
+                    return
+
+                payload = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), PriceHandler)
+        threading.Thread(target=server.serve_forever, name='price-service-http', daemon=True).start()
+        self.logger.info(f"✅ Price service listening on http://{host}:{port}/simple/price")
+        return server
+
+
+_shared_service: Optional[MarketPriceService] = None
+_shared_lock = threading.Lock()
+
+
+def get_price_service(upstream: str = COINGECKO_API) -> MarketPriceService:
+    """Get the process-wide price service (pointed at AZORA_PRICE_SERVICE_URL when set)"""
+    global _shared_service
+    with _shared_lock:
+        if _shared_service is None:
+            local_url = os.getenv(PRICE_SERVICE_URL_ENV)
+            if local_url:
+                # The local endpoint owns the upstream cache - keep only a short local TTL
+                _shared_service = MarketPriceService(local_url, ttl=5.0, stale_ttl=60.0, timeout=5.0)
+            else:
+                _shared_service = MarketPriceService(upstream)
+        return _shared_service
+
+
+def main():
+    """Run the shared price service as a local endpoint"""
+    parser = argparse.ArgumentParser(description='AZORA market price service')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--ttl', type=float, default=60.0)
+    parser.add_argument('--stale-ttl', type=float, default=900.0)
+    parser.add_argument('--upstream', default=COINGECKO_API)
+    args = parser.parse_args()
+
+    configure_logging('market_price_service')
+    service = MarketPriceService(args.upstream, ttl=args.ttl, stale_ttl=args.stale_ttl)
+    server = service.serve(args.host, args.port)
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n⏹️ Stopping price service...")
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
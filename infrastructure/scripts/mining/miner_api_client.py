@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+AZORA MINER API CLIENT
+Shared lolMiner /summary client with parallel port discovery, cached port and keep-alive sessions
+"""
+
+import os
+import re
+import time
+import threading
+import concurrent.futures
+from typing import Dict, Optional, Any, Sequence
+
+import requests
+
+from mint_mine_metrics import LatencyStats
+
+# lolMiner API ports configured by the mining scripts
+DEFAULT_MINER_PORTS = (4444, 4445, 4446, 4447)
+
+HASHRATE_UNITS = {
+    'h/s': 1.0,
+    'kh/s': 1e3,
+    'mh/s': 1e6,
+    'gh/s': 1e9,
+    'th/s': 1e12
+}
+
+_HASHRATE_PATTERN = re.compile(r'^\s*([0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)\s*([kmgt]?h/s)?\s*$', re.IGNORECASE)
+
+_probe_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_probe_executor_lock = threading.Lock()
+
+
+def _get_probe_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Get the bounded pool every client's port discovery shares, so probe threads don't grow per host"""
+    global _probe_executor
+    with _probe_executor_lock:
+        if _probe_executor is None:
+            _probe_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=int(os.getenv('MINER_PROBE_WORKERS', '16')), thread_name_prefix='miner-probe'
+            )
+        return _probe_executor
+
+
+def parse_hashrate(value: Any) -> float:
+    """Convert a lolMiner hashrate ('42.0 MH/s', '850 KH/s', 1234) into H/s"""
+    if value is None:
+        return 0.0
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    match = _HASHRATE_PATTERN.match(str(value))
+    if not match:
+        return 0.0
+    number, unit = match.groups()
+    return float(number) * HASHRATE_UNITS[(unit or 'h/s').lower()]
+
+
+def normalize_summary(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Annotate a raw /summary payload with numeric hashrates (H/s)"""
+    workers = data.get('Workers', []) or []
+    worker_rates = [parse_hashrate(worker.get('Hashrate', 0)) for worker in workers]
+    data['workers_hashrate_hs'] = worker_rates
+    data['hashrate_hs'] = sum(worker_rates)
+    return data
+
+
+class MinerApiClient:
+    """lolMiner API client for one host that remembers which port answered"""
+
+    def __init__(self, host: str = '127.0.0.1', ports: Sequence[int] = DEFAULT_MINER_PORTS,
+                 timeout: float = 5.0, discovery_backoff: float = 10.0):
+        self.host = host
+        self.ports = tuple(ports)
+        self.timeout = timeout
+        self.discovery_backoff = discovery_backoff
+
+        self.port: Optional[int] = None
+        self.latency = LatencyStats()
+        self._failed_discovery_at = 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        # One keep-alive session per calling thread
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def _fetch(self, port: int) -> Optional[Dict[str, Any]]:
+        started = time.monotonic()
+        try:
+            response = self._session().get(f'http://{self.host}:{port}/summary', timeout=self.timeout)
+            if response.status_code == 200:
+                return response.json()
+        except (requests.RequestException, ValueError):
+            pass
+        finally:
+            self.latency.observe(time.monotonic() - started)
+        return None
+
+    def discovery_due(self) -> bool:
+        """Whether ports may be probed again (a failed discovery backs off for discovery_backoff)"""
+        return time.monotonic() - self._failed_discovery_at >= self.discovery_backoff
+
+    def record_discovery(self, port: Optional[int]):
+        """Cache the port a discovery found; None starts the discovery backoff"""
+        self.port = port
+        self._failed_discovery_at = 0.0 if port is not None else time.monotonic()
+
+    def discover(self) -> Optional[Dict[str, Any]]:
+        """Probe every port concurrently; cache the first port that answers and return its payload"""
+        executor = _get_probe_executor()
+        futures = {executor.submit(self._fetch, port): port for port in self.ports}
+        for future in concurrent.futures.as_completed(futures):
+            data = future.result()
+            if data is not None:
+                self.record_discovery(futures[future])
+                return data
+        self.record_discovery(None)
+        return None
+
+    def get_summary(self) -> Optional[Dict[str, Any]]:
+        """Get the normalized /summary payload, or None when no miner answers"""
+        port = self.port
+        if port is not None:
+            data = self._fetch(port)
+            if data is not None:
+                return normalize_summary(data)
+
+        with self._lock:
+            # Another thread may have re-discovered while we were waiting
+            if self.port is not None and self.port != port:
+                data = self._fetch(self.port)
+                if data is not None:
+                    return normalize_summary(data)
+
+            if not self.discovery_due():
+                return None
+
+            data = self.discover()
+            return normalize_summary(data) if data is not None else None
+
+
+_clients: Dict[tuple, MinerApiClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_miner_client(host: str = '127.0.0.1', ports: Sequence[int] = DEFAULT_MINER_PORTS) -> MinerApiClient:
+    """Get the process-wide client for a host, creating it on first use"""
+    key = (host, tuple(ports))
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = MinerApiClient(host, ports)
+            _clients[key] = client
+        return client
+
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+AZORA MINING LOGGING
+Shared logging setup for the long-running mining services. Callers only enqueue records;
+a QueueListener thread formats them and does the file and console I/O. Files rotate by
+size and by day and are gzipped, and info messages that keep repeating are rate-limited.
+
+Environment overrides:
+    AZORA_LOG_DIR          directory for log files (default: ./logs next to these scripts)
+    AZORA_LOG_LEVEL        minimum level (default: INFO)
+    AZORA_LOG_FORMAT       'text' or 'json'
+    AZORA_LOG_MAX_BYTES    rotate when a file reaches this size (default: 50 MB)
+    AZORA_LOG_BACKUPS      rotated files to keep (default: 30)
+    AZORA_LOG_RATE_LIMIT   copies of one INFO/DEBUG message per minute before suppressing
+                           (default: 30, 0 disables); warnings and errors are never suppressed
+"""
+
+import os
+import gzip
+import json
+import time
+import queue
+import shutil
+import atexit
+import threading
+import logging
+import logging.handlers
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_LOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'logs')
+DEFAULT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_setup_lock = threading.Lock()
+
+
+class CompressingRotatingFileHandler(logging.handlers.BaseRotatingHandler):
+    """Rotates when the file reaches max_bytes or at midnight, gzipping rotated files"""
+
+    def __init__(self, filename: str, max_bytes: int = 50 * 1024 * 1024, backup_count: int = 30,
+                 encoding: Optional[str] = 'utf-8'):
+        super().__init__(filename, 'a', encoding=encoding, delay=True)
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rollover_at = self._next_midnight()
+
+    @staticmethod
+    def _next_midnight() -> float:
+        now = datetime.now()
+        return datetime(now.year, now.month, now.day).timestamp() + 86400
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if time.time() >= self.rollover_at:
+            return True
+        if self.max_bytes <= 0:
+            return False
+        if self.stream is None:
+            self.stream = self._open()
+        return self.stream.tell() >= self.max_bytes
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+
+        if os.path.exists(self.baseFilename) and os.path.getsize(self.baseFilename) > 0:
+            rotated = f"{self.baseFilename}.{datetime.now():%Y%m%d-%H%M%S}"
+            suffix = 0
+            while os.path.exists(rotated + '.gz'):
+                suffix += 1
+                rotated = f"{self.baseFilename}.{datetime.now():%Y%m%d-%H%M%S}-{suffix}"
+            os.rename(self.baseFilename, rotated)
+            self._compress(rotated)
+            self._prune()
+
+        self.rollover_at = self._next_midnight()
+
+    @staticmethod
+    def _compress(path: str):
+        with open(path, 'rb') as source, gzip.open(path + '.gz', 'wb') as target:
+            shutil.copyfileobj(source, target)
+        os.remove(path)
+
+    def _prune(self):
+        directory, base = os.path.split(self.baseFilename)
+        rotated = sorted(
+            (os.stat(path).st_mtime_ns, path)
+            for path in (os.path.join(directory, name) for name in os.listdir(directory or '.')
+                         if name.startswith(base + '.') and name.endswith('.gz'))
+        )
+        for _, path in rotated[:max(0, len(rotated) - self.backup_count)]:
+            os.remove(path)
+
+
+class RateLimitFilter(logging.Filter):
+    """Lets through at most `limit` copies of the same message per `period` seconds.
+
+    Keyed by call site and rendered message, so a message that keeps repeating is
+    limited while distinct lines from one call site (miner output forwarded line by
+    line, per-transaction logs) all pass. When a window with suppressed records ends,
+    the next copy of that message reports how many were dropped. Only records at or
+    below `max_level` are limited; warnings and errors always pass.
+    """
+
+    def __init__(self, limit: int = 30, period: float = 60.0, max_level: int = logging.INFO,
+                 max_keys: int = 10000):
+        super().__init__()
+        self.limit = limit
+        self.period = period
+        self.max_level = max_level
+        # Distinct messages are unbounded; expired windows are pruned past this many
+        self.max_keys = max_keys
+        self._windows: Dict[Tuple[str, int, str], List] = {}
+        self._lock = threading.Lock()
+
+    def _prune(self, now: float):
+        expired = [key for key, window in self._windows.items() if now - window[0] >= self.period]
+        for key in expired:
+            del self._windows[key]
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.limit <= 0 or record.levelno > self.max_level:
+            return True
+
+        message = record.getMessage()
+        key = (record.pathname, record.lineno, message)
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window[0] >= self.period:
+                suppressed = window[2] if window else 0
+                if window is None and len(self._windows) >= self.max_keys:
+                    self._prune(now)
+                self._windows[key] = [now, 1, 0]
+                if suppressed:
+                    record.msg = f"{message} (suppressed {suppressed} repeats)"
+                    record.args = None
+                return True
+
+            window[1] += 1
+            if window[1] <= self.limit:
+                return True
+            window[2] += 1
+            return False
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'timestamp': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName
+        }
+        if record.exc_info:
+            entry['exception'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+def configure_logging(name: str, log_dir: Optional[str] = None, level: Optional[str] = None,
+                      fmt: str = DEFAULT_FORMAT, json_output: Optional[bool] = None,
+                      console: bool = True) -> logging.Logger:
+    """Route the root logger through a queue to a rotating `<name>.log` (and the console).
+
+    Safe to call more than once; only the first call in a process installs handlers.
+    Returns the logger called `name`.
+    """
+    global _listener, _queue_handler
+
+    with _setup_lock:
+        if _listener is not None:
+            return logging.getLogger(name)
+
+        log_dir = log_dir or os.getenv('AZORA_LOG_DIR', DEFAULT_LOG_DIR)
+        os.makedirs(log_dir, exist_ok=True)
+        level = (level or os.getenv('AZORA_LOG_LEVEL', 'INFO')).upper()
+        if json_output is None:
+            json_output = os.getenv('AZORA_LOG_FORMAT', 'text').lower() == 'json'
+        formatter = JsonFormatter() if json_output else logging.Formatter(fmt)
+
+        file_handler = CompressingRotatingFileHandler(
+            os.path.join(log_dir, f"{name}.log"),
+            max_bytes=int(os.getenv('AZORA_LOG_MAX_BYTES', str(50 * 1024 * 1024))),
+            backup_count=int(os.getenv('AZORA_LOG_BACKUPS', '30'))
+        )
+        handlers: List[logging.Handler] = [file_handler]
+        if console:
+            handlers.append(logging.StreamHandler())
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        # Unbounded: a slow disk delays the file, never the thread that logged
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _queue_handler = logging.handlers.QueueHandler(log_queue)
+        _queue_handler.addFilter(RateLimitFilter(int(os.getenv('AZORA_LOG_RATE_LIMIT', '30'))))
+
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(_queue_handler)
+        root.setLevel(getattr(logging, level, logging.INFO))
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+    return logging.getLogger(name)
+
+
+def shutdown_logging():
+    """Write out queued records and stop the listener thread"""
+    global _listener, _queue_handler
+
+    with _setup_lock:
+        if _listener is None:
+            return
+        logging.getLogger().removeHandler(_queue_handler)
+        _queue_handler = None
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
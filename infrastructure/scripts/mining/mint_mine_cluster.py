@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT-MINE CLUSTER
+Coordination between engine instances sharing one database: a Postgres advisory lock elects
+the leader that runs singleton jobs, and heartbeat rows define the members that per-rig and
+per-wallet work is sharded across with consistent hashing
+"""
+
+import bisect
+import hashlib
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import psycopg2
+
+from mint_mine_metrics import Counter
+
+CLUSTER_MEMBERS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS cluster_members (
+        member_id VARCHAR(255) PRIMARY KEY,
+        is_leader BOOLEAN NOT NULL DEFAULT FALSE,
+        started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        heartbeat_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Held for as long as the leader's lock connection lives
+LEADER_LOCK_ID = 0x415A524C  # 'AZRL'
+
+
+class ConsistentHashRing:
+    """Maps keys to nodes so that a membership change only moves the keys of the affected node"""
+
+    def __init__(self, nodes: Iterable[str] = (), replicas: int = 64):
+        self.replicas = replicas
+        self._points: List[int] = []
+        self._owners: Dict[int, str] = {}
+        self._nodes = set()
+        for node in nodes:
+            self.add(node)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        return int.from_bytes(hashlib.md5(key.encode('utf-8')).digest()[:8], 'big')
+
+    @property
+    def nodes(self) -> List[str]:
+        return sorted(self._nodes)
+
+    def add(self, node: str):
+        if node in self._nodes:
+            return
+        self._nodes.add(node)
+        for replica in range(self.replicas):
+            point = self._hash(f"{node}#{replica}")
+            self._owners[point] = node
+            bisect.insort(self._points, point)
+
+    def remove(self, node: str):
+        if node not in self._nodes:
+            return
+        self._nodes.discard(node)
+        for replica in range(self.replicas):
+            point = self._hash(f"{node}#{replica}")
+            if self._owners.pop(point, None) is not None:
+                self._points.pop(bisect.bisect_left(self._points, point))
+
+    def get(self, key: str) -> Optional[str]:
+        """Node owning key: the first ring point clockwise from the key's hash"""
+        if not self._points:
+            return None
+        index = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._owners[self._points[index]]
+
+
+class ClusterCoordinator:
+    """Leader election and membership for engine instances.
+
+    With clustering disabled the coordinator reports this instance as leader and
+    owner of every key, so callers do not need a separate single-node path.
+    """
+
+    def __init__(self, storage, db_config: Dict[str, Any], member_id: str, enabled: bool = True,
+                 heartbeat_interval: float = 5.0, member_ttl: float = 15.0, replicas: int = 64,
+                 on_leadership_change: Optional[Callable[[bool], None]] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.storage = storage
+        self.db_config = db_config
+        self.member_id = member_id
+        self.enabled = enabled
+        self.heartbeat_interval = heartbeat_interval
+        self.member_ttl = member_ttl
+        self.on_leadership_change = on_leadership_change
+        self.logger = logger or logging.getLogger('AzoraMintMineCluster')
+
+        self.ring = ConsistentHashRing([member_id], replicas=replicas)
+        self._is_leader = not enabled
+        self._lock_conn = None
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.leadership_changes = Counter()
+        self.heartbeat_errors = Counter()
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    @property
+    def members(self) -> List[str]:
+        return self.ring.nodes
+
+    def owns(self, key: str) -> bool:
+        """Whether this member is responsible for a rig, wallet or other shard key"""
+        if not self.enabled:
+            return True
+        with self._lock:
+            return self.ring.get(key) == self.member_id
+
+    def owned(self, keys: Iterable[str]) -> List[str]:
+        return [key for key in keys if self.owns(key)]
+
+    # ------------------------------------------------------------------
+    # Heartbeat loop
+    # ------------------------------------------------------------------
+
+    def start(self):
+        if not self.enabled or self._thread:
+            return
+        self.tick()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name='cluster-heartbeat', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread:
+            self._thread.join(timeout=self.heartbeat_interval + 5)
+            self._thread = None
+        if self.enabled:
+            self._step_down()
+            try:
+                with self.storage.cursor() as cursor:
+                    cursor.execute("DELETE FROM cluster_members WHERE member_id = %s", (self.member_id,))
+            except Exception as e:
+                self.logger.warning(f"Failed to leave cluster: {e}")
+
+    def _run(self):
+        while not self._stop_event.wait(self.heartbeat_interval):
+            self.tick()
+
+    def tick(self):
+        """Heartbeat, refresh the member ring, then hold or contend for leadership"""
+        try:
+            self._refresh_members()
+        except Exception as e:
+            self.heartbeat_errors.inc()
+            self.logger.warning(f"Cluster heartbeat failed: {e}")
+
+        self._update_leadership()
+
+    def _refresh_members(self):
+        with self.storage.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO cluster_members (member_id, is_leader)
+                VALUES (%s, %s)
+                ON CONFLICT (member_id) DO UPDATE
+                SET heartbeat_at = CURRENT_TIMESTAMP, is_leader = EXCLUDED.is_leader
+            """, (self.member_id, self._is_leader))
+
+            # Members that stopped heartbeating drop out of the ring; long-dead rows are removed
+            cursor.execute("""
+                DELETE FROM cluster_members
+                WHERE heartbeat_at < CURRENT_TIMESTAMP - make_interval(secs => %s)
+            """, (self.member_ttl * 10,))
+            cursor.execute("""
+                SELECT member_id FROM cluster_members
+                WHERE heartbeat_at >= CURRENT_TIMESTAMP - make_interval(secs => %s)
+            """, (self.member_ttl,))
+            live = {row[0] for row in cursor.fetchall()} | {self.member_id}
+
+        with self._lock:
+            current = set(self.ring.nodes)
+            if live == current:
+                return
+            for node in current - live:
+                self.ring.remove(node)
+            for node in live - current:
+                self.ring.add(node)
+
+        self.logger.info(f"🧩 Cluster members: {', '.join(sorted(live))}")
+
+    # ------------------------------------------------------------------
+    # Leadership
+    # ------------------------------------------------------------------
+
+    def _connect_lock_connection(self):
+        """Dedicated connection for the session-level lock; keepalives bound failover time"""
+        conn = psycopg2.connect(
+            host=self.db_config['host'],
+            port=self.db_config['port'],
+            database=self.db_config['name'],
+            user=self.db_config['user'],
+            password=self.db_config['password'],
+            connect_timeout=5,
+            keepalives=1,
+            keepalives_idle=int(self.heartbeat_interval),
+            keepalives_interval=int(self.heartbeat_interval),
+            keepalives_count=2
+        )
+        conn.autocommit = True
+        return conn
+
+    def _update_leadership(self):
+        was_leader = self._is_leader
+        try:
+            if self._lock_conn is None or self._lock_conn.closed:
+                self._lock_conn = self._connect_lock_connection()
+
+            with self._lock_conn.cursor() as cursor:
+                if was_leader:
+                    # Still holding the lock as long as its connection answers
+                    cursor.execute("SELECT 1")
+                    is_leader = True
+                else:
+                    cursor.execute("SELECT pg_try_advisory_lock(%s)", (LEADER_LOCK_ID,))
+                    is_leader = bool(cursor.fetchone()[0])
+
+        except Exception as e:
+            self.logger.warning(f"Leader lock connection lost: {e}")
+            self._close_lock_connection()
+            is_leader = False
+
+        if is_leader != was_leader:
+            self._set_leader(is_leader)
+
+    def _step_down(self):
+        if self._is_leader and self._lock_conn is not None and not self._lock_conn.closed:
+            try:
+                with self._lock_conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_unlock(%s)", (LEADER_LOCK_ID,))
+            except Exception:
+                pass
+        self._close_lock_connection()
+        if self._is_leader:
+            self._set_leader(False)
+
+    def _close_lock_connection(self):
+        if self._lock_conn is not None:
+            try:
+                self._lock_conn.close()
+            except Exception:
+                pass
+            self._lock_conn = None
+
+    def _set_leader(self, is_leader: bool):
+        self._is_leader = is_leader
+        self.leadership_changes.inc()
+        if is_leader:
+            self.logger.info(f"👑 {self.member_id} is now the cluster leader")
+        else:
+            self.logger.warning(f"{self.member_id} is no longer the cluster leader")
+
+        if self.on_leadership_change:
+            try:
+                self.on_leadership_change(is_leader)
+            except Exception as e:
+                self.logger.error(f"Leadership change handler failed: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'enabled': self.enabled,
+            'member_id': self.member_id,
+            'is_leader': self._is_leader,
+            'members': self.members,
+            'leadership_changes': self.leadership_changes.value,
+            'heartbeat_errors': self.heartbeat_errors.value
+        }
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT-MINE EVENTS
+NOTIFY payloads the engine publishes for dashboards. Events are sent with the cursor that
+wrote the change, so listeners only see committed state.
+
+Every event is JSON on ENGINE_EVENTS_CHANNEL with an 'event' key:
+    session  - sessions recorded or completed; 'totals' carries running-total deltas
+    mint     - minting transactions recorded or settled; 'totals' carries running-total deltas
+    prices   - latest price per symbol from a stored batch
+    rollups  - new rollup buckets were written
+"""
+
+import json
+from typing import Any, Dict
+
+ENGINE_EVENTS_CHANNEL = 'azora_mint_mine_events'
+
+# Postgres rejects NOTIFY payloads of 8000 bytes or more
+MAX_PAYLOAD_BYTES = 7900
+
+
+def encode_event(event: str, **fields) -> str:
+    """JSON payload for one event; oversized detail is dropped so listeners re-query instead"""
+    payload = json.dumps({'event': event, **fields}, default=str)
+    if len(payload.encode('utf-8')) <= MAX_PAYLOAD_BYTES:
+        return payload
+
+    compact: Dict[str, Any] = {'event': event, 'truncated': True}
+    if 'totals' in fields:
+        compact['totals'] = fields['totals']
+    return json.dumps(compact, default=str)
+
+
+def notify(cursor, event: str, **fields):
+    """Queue an event; Postgres delivers it when the cursor's transaction commits"""
+    cursor.execute("SELECT pg_notify(%s, %s)", (ENGINE_EVENTS_CHANNEL, encode_event(event, **fields)))
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT-MINE HTTP API
+Read-only engine endpoints for dashboards and monitoring:
+    /stats    - latest stats snapshot (JSON)
+    /health   - component health from the same snapshot (503 when unhealthy or stale)
+    /metrics  - Prometheus text exposition
+Requests never touch the database or the engine's locks: workers publish a new snapshot
+and handlers serve whichever one is current.
+"""
+
+import json
+import time
+import threading
+import logging
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from mint_mine_metrics import LatencyStats
+
+
+class StatsSnapshot:
+    """Copy-on-write holder: publish() swaps in a new immutable snapshot, readers never block"""
+
+    def __init__(self):
+        self._current: Tuple[Dict[str, Any], bytes, float] = ({}, b'{}', 0.0)
+
+    def publish(self, stats: Dict[str, Any]):
+        # Serialised once here so requests only copy bytes
+        body = json.dumps(stats, default=str).encode()
+        self._current = (stats, body, time.monotonic())
+
+    def get(self) -> Tuple[Dict[str, Any], bytes, float]:
+        return self._current
+
+    @property
+    def age_seconds(self) -> Optional[float]:
+        published_at = self._current[2]
+        return time.monotonic() - published_at if published_at else None
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value))
+
+
+class PrometheusText:
+    """Builder for the Prometheus text exposition format.
+
+    Samples are kept per metric family and rendered family by family, so callers may emit
+    a family's samples in any order (e.g. per buffer or per endpoint) and each family still
+    comes out as the one contiguous group the format requires.
+    """
+
+    def __init__(self):
+        self._families: Dict[str, List[str]] = {}
+
+    def _family(self, name: str, kind: str, help_text: str) -> List[str]:
+        lines = self._families.get(name)
+        if lines is None:
+            lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            self._families[name] = lines
+        return lines
+
+    @staticmethod
+    def _labels(labels: Dict[str, Any]) -> str:
+        if not labels:
+            return ''
+        return '{' + ','.join(f'{key}="{_escape_label(value)}"' for key, value in labels.items()) + '}'
+
+    def gauge(self, name: str, value: Optional[float], help_text: str, **labels):
+        lines = self._family(name, 'gauge', help_text)
+        if value is not None:
+            lines.append(f"{name}{self._labels(labels)} {_format_value(value)}")
+
+    def counter(self, name: str, value: Optional[float], help_text: str, **labels):
+        lines = self._family(name, 'counter', help_text)
+        if value is not None:
+            lines.append(f"{name}{self._labels(labels)} {_format_value(value)}")
+
+    def histogram(self, name: str, stats: LatencyStats, help_text: str, **labels):
+        """Histogram from a LatencyStats series (its bucket counts are already cumulative)"""
+        lines = self._family(name, 'histogram', help_text)
+        snapshot = stats.snapshot()
+        for bound, count in snapshot['buckets'].items():
+            lines.append(f"{name}_bucket{self._labels(dict(labels, le=_format_value(bound)))} {count}")
+        lines.append(f"{name}_bucket{self._labels(dict(labels, le='+Inf'))} {snapshot['count']}")
+        lines.append(f"{name}_sum{self._labels(labels)} {_format_value(snapshot['sum_seconds'])}")
+        lines.append(f"{name}_count{self._labels(labels)} {snapshot['count']}")
+
+    def render(self) -> bytes:
+        return ('\n'.join(line for lines in self._families.values() for line in lines) + '\n').encode()
+
+
+class EngineApiServer:
+    """Threaded HTTP server for the engine's stats, health and metrics"""
+
+    def __init__(self, snapshot: StatsSnapshot, render_metrics: Callable[[], bytes],
+                 host: str = '127.0.0.1', port: int = 8790, max_snapshot_age: float = 120.0,
+                 logger: Optional[logging.Logger] = None):
+        self.snapshot = snapshot
+        self.render_metrics = render_metrics
+        self.host = host
+        self.port = port
+        self.max_snapshot_age = max_snapshot_age
+        self.logger = logger or logging.getLogger('AzoraEngineApi')
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def health(self) -> Tuple[int, Dict[str, Any]]:
+        stats, _, _ = self.snapshot.get()
+        age = self.snapshot.age_seconds
+        health = dict(stats.get('health') or {'healthy': False, 'components': {}})
+        health['snapshot_age_seconds'] = round(age, 3) if age is not None else None
+
+        if age is None or age > self.max_snapshot_age:
+            # Workers stopped publishing: the engine is wedged even if components look fine
+            health['healthy'] = False
+            health['stale'] = True
+        return (200 if health.get('healthy') else 503), health
+
+    def start(self):
+        api = self
+
+        class EngineApiHandler(BaseHTTPRequestHandler):
+            def _send(self, status: int, body: bytes, content_type: str):
+                self.send_response(status)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                path = self.path.split('?', 1)[0].rstrip('/')
+                try:
+                    if path == '/stats':
+                        self._send(200, api.snapshot.get()[1], 'application/json')
+                    elif path == '/health':
+                        status, health = api.health()
+                        self._send(status, json.dumps(health, default=str).encode(), 'application/json')
+                    elif path == '/metrics':
+                        self._send(200, api.render_metrics(), 'text/plain; version=0.0.4; charset=utf-8')
+                    else:
+                        self.send_error(404)
+                except Exception as e:
+                    api.logger.error(f"Engine API {path} failed: {e}")
+                    self.send_error(500)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), EngineApiHandler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name='engine-api-http', daemon=True).start()
+        self.logger.info(f"✅ Engine API listening on http://{self.host}:{self.port} (/stats, /health, /metrics)")
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT-MINE METRICS
+Lightweight thread-safe counters and latency trackers shared by the engine components
+"""
+
+import threading
+from typing import Dict, Any, Tuple
+
+# Upper bounds (seconds) for latency histogram buckets
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class LatencyStats:
+    """Running count/sum/max plus a cumulative histogram for one latency series"""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self._lock = threading.Lock()
+        self.buckets = tuple(sorted(buckets))
+        self._bucket_counts = [0] * len(self.buckets)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        """Record one observation"""
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            if seconds > self.max:
+                self.max = seconds
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    self._bucket_counts[i] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a consistent copy of the series"""
+        with self._lock:
+            return {
+                'count': self.count,
+                'sum_seconds': round(self.total, 6),
+                'avg_seconds': round(self.total / self.count, 6) if self.count else 0.0,
+                'max_seconds': round(self.max, 6),
+                'buckets': dict(zip(self.buckets, self._bucket_counts))
+            }
+
+
+class Counter:
+    """Monotonic thread-safe counter"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
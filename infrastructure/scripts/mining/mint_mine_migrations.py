@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT-MINE SCHEMA MIGRATIONS
+Versioned schema changes, each applied once in its own transaction and recorded in schema_migrations
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Any
+
+import running_totals
+import telemetry_partitions
+from mint_mine_rollups import ROLLUP_TABLES_SQL
+from mint_outbox import MINT_OUTBOX_TABLE_SQL
+from mint_mine_cluster import CLUSTER_MEMBERS_TABLE_SQL
+from write_journal import JOURNAL_SEGMENTS_TABLE_SQL
+from pool_checkpoints import POOL_CHECKPOINTS_TABLE_SQL
+from pool_history_backfill import BACKFILL_PROGRESS_TABLE_SQL
+
+# Serialises migrations across engine processes starting at the same time
+MIGRATION_LOCK_ID = 0x415A524D  # 'AZRM'
+
+SCHEMA_MIGRATIONS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INTEGER PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[Any, Dict[str, Dict[str, Any]]], None]
+
+
+def _baseline_schema(cursor, partition_settings):
+    """Tables as created by earlier engine versions (idempotent so existing databases adopt it)"""
+    # Mining sessions table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS mining_sessions (
+            id SERIAL PRIMARY KEY,
+            session_id VARCHAR(255) UNIQUE,
+            start_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            end_time TIMESTAMP,
+            algorithm VARCHAR(100),
+            total_hashrate_mhs DECIMAL(10,2),
+            total_earnings_usd DECIMAL(20,8),
+            azr_minted DECIMAL(30,8),
+            status VARCHAR(50) DEFAULT 'active',
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Batched mint that covered each session
+    cursor.execute("ALTER TABLE mining_sessions ADD COLUMN IF NOT EXISTS mint_tx_hash VARCHAR(255)")
+
+    # Minting transactions table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS minting_transactions (
+            id SERIAL PRIMARY KEY,
+            tx_hash VARCHAR(255) UNIQUE,
+            amount_azr DECIMAL(30,8),
+            amount_usd DECIMAL(20,8),
+            recipient_address VARCHAR(255),
+            gas_used BIGINT,
+            gas_price_wei DECIMAL(30,0),
+            blockchain_status VARCHAR(50) DEFAULT 'pending',
+            mining_session_id INTEGER REFERENCES mining_sessions(id),
+            reason TEXT,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            confirmed_at TIMESTAMP
+        )
+    """)
+
+    # Block the mint settled in, recorded by the receipt tracker
+    cursor.execute("ALTER TABLE minting_transactions ADD COLUMN IF NOT EXISTS block_number BIGINT")
+
+    # Mining statistics table
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS mining_statistics (
+            id SERIAL PRIMARY KEY,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            algorithm VARCHAR(100),
+            hashrate_mhs DECIMAL(10,2),
+            pool VARCHAR(255),
+            earnings_usd DECIMAL(20,8),
+            power_consumption_watts INTEGER,
+            temperature_celsius DECIMAL(5,2),
+            shares_accepted INTEGER,
+            shares_rejected INTEGER
+        )
+    """)
+
+    # Price data table for oracle
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS crypto_prices (
+            id SERIAL PRIMARY KEY,
+            symbol VARCHAR(10),
+            price_usd DECIMAL(20,8),
+            market_cap_usd DECIMAL(30,2),
+            volume_24h_usd DECIMAL(30,2),
+            price_change_24h DECIMAL(10,4),
+            source VARCHAR(50),
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    """)
+
+    # Totals maintained alongside session and mint writes
+    cursor.execute(running_totals.RUNNING_TOTALS_TABLE_SQL)
+
+
+# Column definitions of the partitioned telemetry tables (partition key must be in the primary key)
+PARTITIONED_TABLE_COLUMNS = {
+    'mining_statistics': """
+        id BIGSERIAL,
+        timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        algorithm VARCHAR(100),
+        hashrate_mhs DECIMAL(10,2),
+        pool VARCHAR(255),
+        earnings_usd DECIMAL(20,8),
+        power_consumption_watts INTEGER,
+        temperature_celsius DECIMAL(5,2),
+        shares_accepted INTEGER,
+        shares_rejected INTEGER,
+        PRIMARY KEY (id, timestamp)
+    """,
+    'crypto_prices': """
+        id BIGSERIAL,
+        symbol VARCHAR(50),
+        price_usd DECIMAL(20,8),
+        market_cap_usd DECIMAL(30,2),
+        volume_24h_usd DECIMAL(30,2),
+        price_change_24h DECIMAL(10,4),
+        source VARCHAR(50),
+        timestamp TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (id, timestamp)
+    """
+}
+
+
+def _partition_telemetry(cursor, partition_settings):
+    """Rebuild mining_statistics and crypto_prices as range-partitioned tables.
+
+    Rows older than the current period move into one archive partition, which is
+    dropped as a whole once its newest row passes the retention window.
+    """
+    now = datetime.now()
+    for table, columns in PARTITIONED_TABLE_COLUMNS.items():
+        if telemetry_partitions.is_partitioned(cursor, table):
+            continue
+
+        settings = partition_settings[table]
+        legacy = f"{table}_legacy"
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+        cursor.execute(f"ALTER TABLE {legacy} RENAME CONSTRAINT {table}_pkey TO {legacy}_pkey")
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id')", (legacy,))
+        legacy_sequence = cursor.fetchone()[0]
+        if legacy_sequence:
+            cursor.execute(f"ALTER SEQUENCE {legacy_sequence} RENAME TO {legacy}_id_seq")
+
+        cursor.execute(f"CREATE TABLE {table} ({columns}) PARTITION BY RANGE (timestamp)")
+
+        current_start = telemetry_partitions.period_start(now, settings['interval'])
+        cursor.execute(f"SELECT MIN(timestamp), MAX(timestamp), MAX(id), BOOL_OR(timestamp IS NULL) FROM {legacy}")
+        oldest, newest, max_id, has_null = cursor.fetchone()
+
+        if has_null or (oldest is not None and oldest < current_start):
+            cursor.execute(
+                f"CREATE TABLE {table}_archive PARTITION OF {table} FOR VALUES FROM (MINVALUE) TO (%s)",
+                (current_start,)
+            )
+        telemetry_partitions.ensure_partitions(cursor, table, settings['interval'], settings['premake'],
+                                               now=now, until=newest)
+
+        column_names = [line.split()[0] for line in columns.strip().splitlines()
+                        if not line.strip().startswith('PRIMARY KEY')]
+        column_list = ', '.join(column_names)
+        select_list = ', '.join(
+            "COALESCE(timestamp, '-infinity'::timestamp)" if name == 'timestamp' else name
+            for name in column_names
+        )
+        cursor.execute(f"INSERT INTO {table} ({column_list}) SELECT {select_list} FROM {legacy}")
+
+        if max_id:
+            cursor.execute("SELECT setval(pg_get_serial_sequence(%s, 'id'), %s)", (table, max_id))
+        cursor.execute(f"DROP TABLE {legacy}")
+
+
+def _telemetry_indexes(cursor, partition_settings):
+    """Indexes for time-range reads, latest-price lookups and mint status scans"""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mining_statistics_timestamp_brin ON mining_statistics USING BRIN (timestamp)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_crypto_prices_timestamp_brin ON crypto_prices USING BRIN (timestamp)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_crypto_prices_symbol_timestamp ON crypto_prices (symbol, timestamp)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_minting_transactions_created_at ON minting_transactions (created_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_minting_transactions_status ON minting_transactions (blockchain_status)")
+
+
+def _telemetry_rollups(cursor, partition_settings):
+    """1m/1h/1d rollup tables, their watermarks, and the session time index they scan by"""
+    for statement in ROLLUP_TABLES_SQL:
+        cursor.execute(statement)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mining_sessions_created_at ON mining_sessions (created_at)")
+
+
+def _mint_outbox(cursor, partition_settings):
+    """Durable mint intents and the link from each session to the intent that mints it"""
+    cursor.execute(MINT_OUTBOX_TABLE_SQL)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_mint_outbox_open ON mint_outbox (id) WHERE status IN ('pending', 'claimed', 'signed')")
+    cursor.execute("ALTER TABLE mining_sessions ADD COLUMN IF NOT EXISTS mint_intent_id BIGINT")
+
+
+def _cluster_members(cursor, partition_settings):
+    """Heartbeat rows of clustered engine instances"""
+    cursor.execute(CLUSTER_MEMBERS_TABLE_SQL)
+
+
+def _write_journal(cursor, partition_settings):
+    """Ids of replayed journal segments, so a segment is applied at most once"""
+    cursor.execute(JOURNAL_SEGMENTS_TABLE_SQL)
+
+
+def _pool_balance_checkpoints(cursor, partition_settings):
+    """Persisted pool balance baselines for delta tracking across restarts"""
+    cursor.execute(POOL_CHECKPOINTS_TABLE_SQL)
+
+
+def _pool_history_backfill(cursor, partition_settings):
+    """Backfill progress per pool wallet, and when each wallet's live delta tracking began"""
+    cursor.execute(BACKFILL_PROGRESS_TABLE_SQL)
+    cursor.execute("ALTER TABLE pool_balance_checkpoints ADD COLUMN IF NOT EXISTS created_at TIMESTAMP")
+    # Existing baselines are older than their latest observation; the first engine session bounds them
+    cursor.execute("""
+        UPDATE pool_balance_checkpoints
+        SET created_at = LEAST(observed_at, COALESCE((SELECT MIN(start_time) FROM mining_sessions), observed_at))
+        WHERE created_at IS NULL
+    """)
+    cursor.execute("ALTER TABLE pool_balance_checkpoints ALTER COLUMN created_at SET DEFAULT CURRENT_TIMESTAMP")
+    cursor.execute("ALTER TABLE pool_balance_checkpoints ALTER COLUMN created_at SET NOT NULL")
+
+
+def _crypto_price_symbols(cursor, partition_settings):
+    """Room for full CoinGecko ids ('conflux-token') in crypto_prices.symbol, as in its rollup"""
+    cursor.execute("ALTER TABLE crypto_prices ALTER COLUMN symbol TYPE VARCHAR(50)")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, 'baseline_schema', _baseline_schema),
+    Migration(2, 'partition_telemetry', _partition_telemetry),
+    Migration(3, 'telemetry_indexes', _telemetry_indexes),
+    Migration(4, 'telemetry_rollups', _telemetry_rollups),
+    Migration(5, 'mint_outbox', _mint_outbox),
+    Migration(6, 'cluster_members', _cluster_members),
+    Migration(7, 'write_journal', _write_journal),
+    Migration(8, 'pool_balance_checkpoints', _pool_balance_checkpoints),
+    Migration(9, 'pool_history_backfill', _pool_history_backfill),
+    Migration(10, 'crypto_price_symbols', _crypto_price_symbols)
+]
+
+
+def applied_versions(storage) -> List[int]:
+    with storage.cursor() as cursor:
+        cursor.execute(SCHEMA_MIGRATIONS_TABLE_SQL)
+        cursor.execute("SELECT version FROM schema_migrations ORDER BY version")
+        return [row[0] for row in cursor.fetchall()]
+
+
+def run_migrations(storage, partition_settings: Dict[str, Dict[str, Any]],
+                   logger: Optional[logging.Logger] = None) -> List[int]:
+    """Apply every pending migration in order; returns the versions applied"""
+    logger = logger or logging.getLogger('AzoraMigrations')
+    applied = set(applied_versions(storage))
+    newly_applied = []
+
+    for migration in MIGRATIONS:
+        if migration.version in applied:
+            continue
+
+        with storage.cursor() as cursor:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (MIGRATION_LOCK_ID,))
+            # Another process may have applied it while we waited for the lock
+            cursor.execute("SELECT 1 FROM schema_migrations WHERE version = %s", (migration.version,))
+            if cursor.fetchone():
+                continue
+
+            # Data-moving migrations can outlast the pool's statement timeout
+            cursor.execute("SET LOCAL statement_timeout = 0")
+            migration.apply(cursor, partition_settings)
+            cursor.execute(
+                "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                (migration.version, migration.name)
+            )
+
+        newly_applied.append(migration.version)
+        logger.info(f"✅ Applied migration {migration.version}: {migration.name}")
+
+    return newly_applied
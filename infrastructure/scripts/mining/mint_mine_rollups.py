@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+AZORA TELEMETRY ROLLUPS
+Incremental 1m / 1h / 1d rollups of mining statistics, prices and session earnings.
+1m buckets are built from raw rows, 1h from 1m and 1d from 1h, so hourly and daily
+history outlives raw-row retention.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Any
+
+ROLLUP_TABLES_SQL = [
+    """
+    CREATE TABLE IF NOT EXISTS mining_statistics_rollup (
+        resolution VARCHAR(4) NOT NULL,
+        bucket TIMESTAMP NOT NULL,
+        samples INTEGER NOT NULL,
+        hashrate_min DECIMAL(10,2),
+        hashrate_max DECIMAL(10,2),
+        hashrate_sum DECIMAL(20,2),
+        shares_accepted_min INTEGER,
+        shares_accepted_max INTEGER,
+        shares_accepted_sum BIGINT,
+        shares_rejected_min INTEGER,
+        shares_rejected_max INTEGER,
+        shares_rejected_sum BIGINT,
+        temperature_min DECIMAL(5,2),
+        temperature_max DECIMAL(5,2),
+        temperature_sum DECIMAL(20,2),
+        earnings_usd_sum DECIMAL(30,8),
+        PRIMARY KEY (resolution, bucket)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS crypto_prices_rollup (
+        resolution VARCHAR(4) NOT NULL,
+        symbol VARCHAR(50) NOT NULL,
+        bucket TIMESTAMP NOT NULL,
+        open_usd DECIMAL(20,8),
+        high_usd DECIMAL(20,8),
+        low_usd DECIMAL(20,8),
+        close_usd DECIMAL(20,8),
+        samples INTEGER NOT NULL,
+        PRIMARY KEY (resolution, symbol, bucket)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS mining_sessions_rollup (
+        resolution VARCHAR(4) NOT NULL,
+        bucket TIMESTAMP NOT NULL,
+        sessions INTEGER NOT NULL,
+        earnings_usd DECIMAL(30,8),
+        azr_minted DECIMAL(30,8),
+        PRIMARY KEY (resolution, bucket)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS rollup_watermarks (
+        rollup VARCHAR(100) NOT NULL,
+        resolution VARCHAR(4) NOT NULL,
+        rolled_until TIMESTAMP NOT NULL,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (rollup, resolution)
+    )
+    """
+]
+
+# resolution -> (date_trunc unit, bucket width, resolution it is built from)
+RESOLUTIONS = {
+    '1m': ('minute', timedelta(minutes=1), None),
+    '1h': ('hour', timedelta(hours=1), '1m'),
+    '1d': ('day', timedelta(days=1), '1h')
+}
+
+# Largest time span recomputed per transaction while catching up
+MAX_SPAN = {
+    '1m': timedelta(hours=6),
+    '1h': timedelta(days=7),
+    '1d': timedelta(days=90)
+}
+
+# Each rollup: its source table/time column and the aggregate SQL from raw rows and from a finer rollup.
+# Queries take (resolution, start, end) or (resolution, source_resolution, start, end) and recompute whole buckets.
+ROLLUPS = {
+    'mining_statistics': {
+        'table': 'mining_statistics_rollup',
+        'source_table': 'mining_statistics',
+        'time_column': 'timestamp',
+        'conflict': '(resolution, bucket)',
+        'update_columns': [
+            'samples', 'hashrate_min', 'hashrate_max', 'hashrate_sum',
+            'shares_accepted_min', 'shares_accepted_max', 'shares_accepted_sum',
+            'shares_rejected_min', 'shares_rejected_max', 'shares_rejected_sum',
+            'temperature_min', 'temperature_max', 'temperature_sum', 'earnings_usd_sum'
+        ],
+        'from_raw': """
+            SELECT %(resolution)s, date_trunc(%(unit)s, timestamp), COUNT(*),
+                   MIN(hashrate_mhs), MAX(hashrate_mhs), SUM(hashrate_mhs),
+                   MIN(shares_accepted), MAX(shares_accepted), SUM(shares_accepted),
+                   MIN(shares_rejected), MAX(shares_rejected), SUM(shares_rejected),
+                   MIN(temperature_celsius), MAX(temperature_celsius), SUM(temperature_celsius),
+                   SUM(earnings_usd)
+            FROM mining_statistics
+            WHERE timestamp >= %(start)s AND timestamp < %(end)s
+            GROUP BY 2
+        """,
+        'from_rollup': """
+            SELECT %(resolution)s, date_trunc(%(unit)s, bucket), SUM(samples),
+                   MIN(hashrate_min), MAX(hashrate_max), SUM(hashrate_sum),
+                   MIN(shares_accepted_min), MAX(shares_accepted_max), SUM(shares_accepted_sum),
+                   MIN(shares_rejected_min), MAX(shares_rejected_max), SUM(shares_rejected_sum),
+                   MIN(temperature_min), MAX(temperature_max), SUM(temperature_sum),
+                   SUM(earnings_usd_sum)
+            FROM mining_statistics_rollup
+            WHERE resolution = %(source_resolution)s AND bucket >= %(start)s AND bucket < %(end)s
+            GROUP BY 2
+        """
+    },
+    'crypto_prices': {
+        'table': 'crypto_prices_rollup',
+        'source_table': 'crypto_prices',
+        'time_column': 'timestamp',
+        'conflict': '(resolution, symbol, bucket)',
+        'update_columns': ['open_usd', 'high_usd', 'low_usd', 'close_usd', 'samples'],
+        'from_raw': """
+            SELECT %(resolution)s, symbol, date_trunc(%(unit)s, timestamp),
+                   (ARRAY_AGG(price_usd ORDER BY timestamp))[1],
+                   MAX(price_usd), MIN(price_usd),
+                   (ARRAY_AGG(price_usd ORDER BY timestamp DESC))[1],
+                   COUNT(*)
+            FROM crypto_prices
+            WHERE timestamp >= %(start)s AND timestamp < %(end)s AND symbol IS NOT NULL
+            GROUP BY 2, 3
+        """,
+        'from_rollup': """
+            SELECT %(resolution)s, symbol, date_trunc(%(unit)s, bucket),
+                   (ARRAY_AGG(open_usd ORDER BY bucket))[1],
+                   MAX(high_usd), MIN(low_usd),
+                   (ARRAY_AGG(close_usd ORDER BY bucket DESC))[1],
+                   SUM(samples)
+            FROM crypto_prices_rollup
+            WHERE resolution = %(source_resolution)s AND bucket >= %(start)s AND bucket < %(end)s
+            GROUP BY 2, 3
+        """
+    },
+    'mining_sessions': {
+        # Earnings are attributed to the bucket they were detected in, whatever the mint status
+        'table': 'mining_sessions_rollup',
+        'source_table': 'mining_sessions',
+        'time_column': 'created_at',
+        'conflict': '(resolution, bucket)',
+        'update_columns': ['sessions', 'earnings_usd', 'azr_minted'],
+        'from_raw': """
+            SELECT %(resolution)s, date_trunc(%(unit)s, created_at), COUNT(*),
+                   SUM(total_earnings_usd), SUM(azr_minted)
+            FROM mining_sessions
+            WHERE created_at >= %(start)s AND created_at < %(end)s
+            GROUP BY 2
+        """,
+        'from_rollup': """
+            SELECT %(resolution)s, date_trunc(%(unit)s, bucket), SUM(sessions),
+                   SUM(earnings_usd), SUM(azr_minted)
+            FROM mining_sessions_rollup
+            WHERE resolution = %(source_resolution)s AND bucket >= %(start)s AND bucket < %(end)s
+            GROUP BY 2
+        """
+    }
+}
+
+
+def bucket_floor(timestamp: datetime, resolution: str) -> datetime:
+    if resolution == '1m':
+        return timestamp.replace(second=0, microsecond=0)
+    if resolution == '1h':
+        return timestamp.replace(minute=0, second=0, microsecond=0)
+    return timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def rewind_watermarks(cursor, rollup: str, since: datetime) -> int:
+    """Move a rollup's watermarks back so rows written behind them (backfills) are rolled up again"""
+    rewound = 0
+    for resolution in RESOLUTIONS:
+        cursor.execute("""
+            UPDATE rollup_watermarks SET rolled_until = %s, updated_at = CURRENT_TIMESTAMP
+            WHERE rollup = %s AND resolution = %s AND rolled_until > %s
+        """, (bucket_floor(since, resolution), rollup, resolution, bucket_floor(since, resolution)))
+        rewound += cursor.rowcount
+    return rewound
+
+
+class TelemetryRollups:
+    """Watermarked rollup job; each run recomputes only buckets closed since the last run"""
+
+    def __init__(self, storage, settle_seconds: float = 120.0, minute_retention_days: float = 14.0,
+                 logger: Optional[logging.Logger] = None):
+        self.storage = storage
+        # Raw rows may arrive this late (write-behind buffering) and still land in their bucket
+        self.settle_seconds = settle_seconds
+        self.minute_retention_days = minute_retention_days
+        self.logger = logger or logging.getLogger('AzoraRollups')
+
+        self.stats = {'runs': 0, 'buckets_written': 0, 'errors': 0}
+
+    def _watermark(self, cursor, rollup: str, resolution: str) -> Optional[datetime]:
+        cursor.execute(
+            "SELECT rolled_until FROM rollup_watermarks WHERE rollup = %s AND resolution = %s",
+            (rollup, resolution)
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def _first_source_time(self, cursor, rollup: str, resolution: str) -> Optional[datetime]:
+        definition = ROLLUPS[rollup]
+        source_resolution = RESOLUTIONS[resolution][2]
+        if source_resolution is None:
+            # Legacy rows without a timestamp sit at -infinity
+            time_column = definition['time_column']
+            cursor.execute(f"SELECT MIN({time_column}) FROM {definition['source_table']} WHERE isfinite({time_column})")
+        else:
+            cursor.execute(f"SELECT MIN(bucket) FROM {definition['table']} WHERE resolution = %s",
+                           (source_resolution,))
+        return cursor.fetchone()[0]
+
+    def _ready_until(self, cursor, rollup: str, resolution: str, now: datetime) -> Optional[datetime]:
+        """End of the last bucket whose inputs are complete"""
+        source_resolution = RESOLUTIONS[resolution][2]
+        if source_resolution is None:
+            return bucket_floor(now - timedelta(seconds=self.settle_seconds), resolution)
+
+        source_watermark = self._watermark(cursor, rollup, source_resolution)
+        return bucket_floor(source_watermark, resolution) if source_watermark else None
+
+    def _roll(self, rollup: str, resolution: str, now: datetime) -> int:
+        definition = ROLLUPS[rollup]
+        unit, _, source_resolution = RESOLUTIONS[resolution]
+        columns = definition['update_columns']
+        key_columns = definition['conflict'].strip('()')
+        written = 0
+
+        while True:
+            with self.storage.cursor() as cursor:
+                ready_until = self._ready_until(cursor, rollup, resolution, now)
+                start = self._watermark(cursor, rollup, resolution)
+                if start is None:
+                    first = self._first_source_time(cursor, rollup, resolution)
+                    if first is None or ready_until is None:
+                        return written
+                    start = bucket_floor(first, resolution)
+
+                if ready_until is None or start >= ready_until:
+                    return written
+                end = min(ready_until, start + MAX_SPAN[resolution])
+
+                query = definition['from_rollup'] if source_resolution else definition['from_raw']
+                cursor.execute(f"""
+                    INSERT INTO {definition['table']} ({key_columns}, {', '.join(columns)})
+                    {query}
+                    ON CONFLICT {definition['conflict']} DO UPDATE SET
+                    {', '.join(f'{column} = EXCLUDED.{column}' for column in columns)}
+                """, {
+                    'resolution': resolution,
+                    'source_resolution': source_resolution,
+                    'unit': unit,
+                    'start': start,
+                    'end': end
+                })
+                written += cursor.rowcount
+
+                cursor.execute("""
+                    INSERT INTO rollup_watermarks (rollup, resolution, rolled_until)
+                    VALUES (%s, %s, %s)
+                    ON CONFLICT (rollup, resolution) DO UPDATE
+                    SET rolled_until = EXCLUDED.rolled_until, updated_at = CURRENT_TIMESTAMP
+                """, (rollup, resolution, end))
+
+    def prune(self, now: Optional[datetime] = None):
+        """Drop 1m buckets past their retention; hourly and daily buckets are kept"""
+        cutoff = (now or datetime.now()) - timedelta(days=self.minute_retention_days)
+        with self.storage.cursor() as cursor:
+            for definition in ROLLUPS.values():
+                cursor.execute(
+                    f"DELETE FROM {definition['table']} WHERE resolution = '1m' AND bucket < %s",
+                    (cutoff,)
+                )
+
+    def run(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Roll every source forward to its latest closed bucket"""
+        now = now or datetime.now()
+        report = {}
+        for rollup in ROLLUPS:
+            written = 0
+            for resolution in RESOLUTIONS:
+                try:
+                    written += self._roll(rollup, resolution, now)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    self.logger.error(f"Rollup {rollup} {resolution} failed: {e}")
+                    break
+            report[rollup] = written
+            self.stats['buckets_written'] += written
+
+        self.prune(now)
+        self.stats['runs'] += 1
+        return report
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats)
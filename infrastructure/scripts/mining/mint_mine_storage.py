@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT-MINE STORAGE
+Bounded, thread-safe PostgreSQL connection pool for the mint-mine engine workers
+"""
+
+import time
+import threading
+import logging
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Iterator
+
+import psycopg2
+from psycopg2 import pool as pg_pool
+
+from mint_mine_metrics import LatencyStats, Counter
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no pooled connection becomes available in time"""
+
+
+def is_unavailable_error(error: BaseException) -> bool:
+    """Whether an error means the database could not be reached (as opposed to a bad statement)"""
+    return isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError, PoolTimeoutError))
+
+
+class EngineStorage:
+    """Pooled PostgreSQL access with per-thread checkout and automatic reconnect"""
+
+    def __init__(self, db_config: Dict[str, Any], min_connections: int = 1, max_connections: int = 8,
+                 statement_timeout_ms: int = 5000, checkout_timeout: float = 10.0,
+                 logger: Optional[logging.Logger] = None):
+        self.db_config = db_config
+        self.min_connections = min_connections
+        self.max_connections = max_connections
+        self.statement_timeout_ms = statement_timeout_ms
+        self.checkout_timeout = checkout_timeout
+        self.logger = logger or logging.getLogger('AzoraMintMineStorage')
+
+        self._pool = None
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._local = threading.local()
+
+        # Metrics
+        self.pool_wait = LatencyStats()
+        self.query_latency = LatencyStats()
+        self.reconnects = Counter()
+        self.checkout_timeouts = Counter()
+        self.query_errors = Counter()
+
+    def connect(self):
+        """Create the connection pool and verify one connection"""
+        self._pool = pg_pool.ThreadedConnectionPool(
+            self.min_connections,
+            self.max_connections,
+            host=self.db_config['host'],
+            port=self.db_config['port'],
+            database=self.db_config['name'],
+            user=self.db_config['user'],
+            password=self.db_config['password'],
+            options=f"-c statement_timeout={int(self.statement_timeout_ms)}"
+        )
+
+        with self.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+    @property
+    def closed(self) -> bool:
+        return self._pool is None or self._pool.closed
+
+    def is_healthy(self) -> bool:
+        """Check that a connection can be checked out and used"""
+        if self.closed:
+            return False
+        try:
+            with self.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return True
+        except Exception:
+            return False
+
+    def _checkout(self):
+        """Take a live connection from the pool, waiting for a free slot"""
+        wait_started = time.monotonic()
+        acquired = self._slots.acquire(timeout=self.checkout_timeout)
+        self.pool_wait.observe(time.monotonic() - wait_started)
+
+        if not acquired:
+            self.checkout_timeouts.inc()
+            raise PoolTimeoutError(f"No database connection available after {self.checkout_timeout}s")
+
+        try:
+            conn = self._pool.getconn()
+            if conn.closed:
+                # Server restarted or socket dropped - replace the connection
+                self._pool.putconn(conn, close=True)
+                self.reconnects.inc()
+                self.logger.warning("Replacing closed database connection")
+                conn = self._pool.getconn()
+            return conn
+        except Exception:
+            self._slots.release()
+            raise
+
+    def _release(self, conn, discard: bool = False):
+        try:
+            if self._pool and not self._pool.closed:
+                self._pool.putconn(conn, close=discard or bool(conn.closed))
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self) -> Iterator[Any]:
+        """Check out a connection for the current thread as one transaction.
+
+        Nested calls on the same thread reuse the outer connection, so several
+        writes can be grouped into a single commit.
+        """
+        if self.closed:
+            raise psycopg2.InterfaceError("Storage pool is not connected")
+
+        current = getattr(self._local, 'conn', None)
+        if current is not None:
+            yield current
+            return
+
+        conn = self._checkout()
+        self._local.conn = conn
+        discard = False
+        try:
+            yield conn
+            conn.commit()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            discard = True
+            self.query_errors.inc()
+            raise
+        except Exception:
+            self.query_errors.inc()
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            self._local.conn = None
+            self._release(conn, discard)
+
+    @contextmanager
+    def cursor(self, cursor_factory=None) -> Iterator[Any]:
+        """Open a cursor inside a pooled transaction and time its use"""
+        with self.connection() as conn:
+            with conn.cursor(cursor_factory=cursor_factory) as cursor:
+                started = time.monotonic()
+                try:
+                    yield cursor
+                finally:
+                    self.query_latency.observe(time.monotonic() - started)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get pool and query metrics"""
+        return {
+            'max_connections': self.max_connections,
+            'statement_timeout_ms': self.statement_timeout_ms,
+            'pool_wait': self.pool_wait.snapshot(),
+            'query_latency': self.query_latency.snapshot(),
+            'reconnects': self.reconnects.value,
+            'checkout_timeouts': self.checkout_timeouts.value,
+            'query_errors': self.query_errors.value
+        }
+
+    def close(self):
+        """Close every pooled connection"""
+        if self._pool and not self._pool.closed:
+            self._pool.closeall()
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT-MINE WRITE-BEHIND BUFFER
+Bounded in-memory buffer that batches append-only telemetry inserts off the worker hot paths.
+A batch that fails because the database is unreachable is spilled or retried; one the
+database rejects is bisected so only the offending rows are dropped.
+"""
+
+import time
+import threading
+import logging
+from collections import deque
+from typing import Callable, Dict, List, Any, Optional, Sequence, Tuple
+
+from psycopg2.extras import execute_values
+
+from mint_mine_metrics import LatencyStats, Counter
+from mint_mine_storage import is_unavailable_error
+
+
+class WriteBehindBuffer:
+    """Collect rows for one table and flush them as multi-row INSERTs by size or age"""
+
+    def __init__(self, storage, table: str, columns: Sequence[str], max_rows: int = 500,
+                 max_age_seconds: float = 5.0, capacity: int = 10000, put_timeout: float = 0.0,
+                 on_flush: Optional[Callable[[Any, List[Tuple]], None]] = None,
+                 on_flush_error: Optional[Callable[[List[Tuple], Exception], bool]] = None,
+                 logger: Optional[logging.Logger] = None):
+        self.storage = storage
+        self.table = table
+        self.columns = tuple(columns)
+        self.max_rows = max_rows
+        self.max_age_seconds = max_age_seconds
+        self.capacity = capacity
+        self.put_timeout = put_timeout
+        # Runs with the insert's cursor, inside its transaction
+        self.on_flush = on_flush
+        # Gets a batch that failed on an unavailable database before it is requeued;
+        # returning True means it was spilled elsewhere
+        self.on_flush_error = on_flush_error
+        self.logger = logger or logging.getLogger('AzoraWriteBuffer')
+
+        self._rows = deque()
+        self._oldest_at = None
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._running = False
+        self._thread = None
+
+        # Metrics
+        self.flush_latency = LatencyStats()
+        self.rows_written = Counter()
+        self.rows_dropped = Counter()
+        self.flush_failures = Counter()
+        self.rows_spilled = Counter()
+        self.rows_rejected = Counter()
+
+    def start(self):
+        """Start the background flusher"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._flush_loop, name=f"write-buffer-{self.table}", daemon=True)
+        self._thread.start()
+
+    def add(self, row: Tuple) -> bool:
+        """Queue one row; waits at most put_timeout for space when the buffer is full"""
+        if len(row) != len(self.columns):
+            raise ValueError(f"Expected {len(self.columns)} values for {self.table}, got {len(row)}")
+
+        with self._cond:
+            if len(self._rows) >= self.capacity:
+                # Backpressure: wake the flusher and give it a bounded chance to drain
+                self._cond.notify_all()
+                deadline = time.monotonic() + self.put_timeout
+                while len(self._rows) >= self.capacity:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.rows_dropped.inc()
+                        return False
+                    self._cond.wait(remaining)
+
+            if not self._rows:
+                self._oldest_at = time.monotonic()
+            self._rows.append(tuple(row))
+
+            if len(self._rows) >= self.max_rows:
+                self._cond.notify_all()
+        return True
+
+    def depth(self) -> int:
+        return len(self._rows)
+
+    def _flush_due(self) -> bool:
+        if not self._rows:
+            return False
+        if len(self._rows) >= self.max_rows:
+            return True
+        return time.monotonic() - self._oldest_at >= self.max_age_seconds
+
+    def _flush_loop(self):
+        while True:
+            with self._cond:
+                while self._running and not self._flush_due():
+                    if self._rows:
+                        timeout = max(0.0, self.max_age_seconds - (time.monotonic() - self._oldest_at))
+                    else:
+                        timeout = self.max_age_seconds
+                    self._cond.wait(timeout)
+                if not self._running:
+                    return
+
+            try:
+                self.flush()
+            except Exception as e:
+                self.logger.error(f"Write-behind flush for {self.table} failed: {e}")
+                # Avoid a hot retry loop while the database is unavailable
+                time.sleep(min(self.max_age_seconds, 5.0))
+
+    def _take_batch(self) -> List[Tuple]:
+        with self._cond:
+            batch = []
+            while self._rows and len(batch) < self.max_rows:
+                batch.append(self._rows.popleft())
+            self._oldest_at = time.monotonic() if self._rows else None
+            # Space was freed for producers waiting on backpressure
+            self._cond.notify_all()
+            return batch
+
+    def _requeue(self, batch: List[Tuple]):
+        """Put a failed batch back at the front, dropping what no longer fits"""
+        with self._cond:
+            room = max(0, self.capacity - len(self._rows))
+            keep = batch[:room]
+            if len(batch) > room:
+                self.rows_dropped.inc(len(batch) - room)
+            self._rows.extendleft(reversed(keep))
+            if self._rows and self._oldest_at is None:
+                self._oldest_at = time.monotonic()
+
+    def flush(self) -> int:
+        """Write everything currently buffered; returns the number of rows written"""
+        written = 0
+        with self._flush_lock:
+            while True:
+                batch = self._take_batch()
+                if not batch:
+                    return written
+
+                try:
+                    self._write(batch)
+                except Exception as e:
+                    self.flush_failures.inc()
+                    if is_unavailable_error(e):
+                        self._hold(batch, e)
+                        continue
+                    # The database refused the rows themselves; retrying would block the table
+                    written += self._write_around(batch, e)
+                    continue
+
+                written += len(batch)
+                self.rows_written.inc(len(batch))
+
+    def _write(self, batch: List[Tuple]):
+        started = time.monotonic()
+        try:
+            with self.storage.cursor() as cursor:
+                execute_values(
+                    cursor,
+                    f"INSERT INTO {self.table} ({', '.join(self.columns)}) VALUES %s",
+                    batch,
+                    page_size=self.max_rows
+                )
+                if self.on_flush:
+                    self.on_flush(cursor, batch)
+        finally:
+            self.flush_latency.observe(time.monotonic() - started)
+
+    def _hold(self, batch: List[Tuple], error: Exception):
+        """Spill or requeue rows the unavailable database could not take; re-raises unless spilled"""
+        if self.on_flush_error and self._spill(batch, error):
+            return
+        self._requeue(batch)
+        raise error
+
+    def _write_around(self, batch: List[Tuple], error: Exception) -> int:
+        """Bisect a rejected batch, writing every row that goes in on its own; returns rows written"""
+        written = 0
+        pending = [batch]
+        while pending:
+            chunk = pending.pop(0)
+            if chunk is not batch:
+                try:
+                    self._write(chunk)
+                    written += len(chunk)
+                    self.rows_written.inc(len(chunk))
+                    continue
+                except Exception as e:
+                    if is_unavailable_error(e):
+                        self._hold([row for rest in [chunk] + pending for row in rest], e)
+                        return written
+                    error = e
+
+            if len(chunk) == 1:
+                self.rows_rejected.inc()
+                self.logger.error(f"Rejected {self.table} row {chunk[0]!r}: {error}")
+                continue
+            middle = len(chunk) // 2
+            pending[:0] = [chunk[:middle], chunk[middle:]]
+        return written
+
+    def _spill(self, batch: List[Tuple], error: Exception) -> bool:
+        try:
+            spilled = bool(self.on_flush_error(batch, error))
+        except Exception as e:
+            self.logger.error(f"Spilling {len(batch)} {self.table} rows failed: {e}")
+            return False
+        if spilled:
+            self.rows_spilled.inc(len(batch))
+        return spilled
+
+    def stop(self, flush: bool = True):
+        """Stop the flusher and optionally write out what is still buffered"""
+        with self._cond:
+            self._running = False
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+        if flush:
+            try:
+                written = self.flush()
+                if written:
+                    self.logger.info(f"Flushed {written} buffered {self.table} rows on shutdown")
+            except Exception as e:
+                self.logger.error(f"Final flush for {self.table} failed, {self.depth()} rows lost: {e}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get buffer depth and flush metrics"""
+        return {
+            'depth': self.depth(),
+            'capacity': self.capacity,
+            'rows_written': self.rows_written.value,
+            'rows_dropped': self.rows_dropped.value,
+            'flush_failures': self.flush_failures.value,
+            'rows_spilled': self.rows_spilled.value,
+            'rows_rejected': self.rows_rejected.value,
+            'flush_latency': self.flush_latency.snapshot()
+        }
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT OUTBOX
+Durable mint intents: written in the same transaction as the earnings they consume, claimed by
+dispatchers with FOR UPDATE SKIP LOCKED, and marked signed before anything reaches the chain
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from psycopg2.extras import RealDictCursor, execute_values
+
+MINT_OUTBOX_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS mint_outbox (
+        id BIGSERIAL PRIMARY KEY,
+        recipient_address VARCHAR(255) NOT NULL,
+        amount_azr DECIMAL(30,8) NOT NULL,
+        amount_usd DECIMAL(20,8) NOT NULL,
+        session_ids INTEGER[] NOT NULL DEFAULT '{}',
+        reason TEXT,
+        status VARCHAR(20) NOT NULL DEFAULT 'pending',
+        attempts INTEGER NOT NULL DEFAULT 0,
+        claimed_by VARCHAR(255),
+        lease_expires_at TIMESTAMP,
+        nonce BIGINT,
+        fee_cap_wei DECIMAL(30,0),
+        tx_hash VARCHAR(255),
+        raw_tx BYTEA,
+        last_error TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        sent_at TIMESTAMP
+    )
+"""
+
+# Intent lifecycle:
+#   pending -> claimed (a dispatcher holds the lease)
+#           -> signed  (tx hash and raw tx durable; safe to broadcast, and to re-broadcast after a crash)
+#           -> sent    (recorded in minting_transactions)
+#   claimed/signed -> pending on a definite rejection, or failed after max_attempts
+OUTBOX_STATUSES = ('pending', 'claimed', 'signed', 'sent', 'failed')
+
+
+@dataclass
+class MintIntent:
+    id: int
+    recipient_address: str
+    amount_azr: float
+    amount_usd: float
+    session_ids: List[int]
+    reason: str
+    status: str
+    attempts: int
+    nonce: Optional[int] = None
+    fee_cap_wei: Optional[int] = None
+    tx_hash: Optional[str] = None
+    raw_tx: Optional[bytes] = None
+
+    @property
+    def recovering(self) -> bool:
+        """Signed by a dispatcher that never confirmed the send"""
+        return self.status == 'signed'
+
+
+class MintOutbox:
+    """Postgres-backed mint intent queue shared by any number of dispatchers"""
+
+    def __init__(self, storage, lease_seconds: float = 120.0, max_attempts: int = 10,
+                 logger: Optional[logging.Logger] = None):
+        self.storage = storage
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.logger = logger or logging.getLogger('AzoraMintOutbox')
+
+    def enqueue(self, cursor, recipient: str, amount_usd: float, amount_azr: float,
+                session_ids: List[int], reason: str) -> Optional[int]:
+        """Insert an intent and hand its sessions over to it, in the caller's transaction.
+
+        Sessions already taken by another intent (e.g. re-queued by a second engine
+        instance) are left out along with their earnings; returns None if nothing is left.
+        """
+        session_ids = [session_id for session_id in session_ids if session_id is not None]
+        if session_ids:
+            cursor.execute("""
+                SELECT id, total_earnings_usd, azr_minted, status FROM mining_sessions
+                WHERE id = ANY(%s)
+                FOR UPDATE
+            """, (session_ids,))
+            taken = [row for row in cursor.fetchall() if row[3] != 'pending_mint']
+            if taken:
+                amount_usd -= sum(float(row[1] or 0) for row in taken)
+                amount_azr -= sum(float(row[2] or 0) for row in taken)
+                taken_ids = {row[0] for row in taken}
+                session_ids = [session_id for session_id in session_ids if session_id not in taken_ids]
+                self.logger.warning(f"Skipped {len(taken_ids)} sessions already claimed by another mint")
+                if amount_azr <= 1e-9:
+                    return None
+
+        cursor.execute("""
+            INSERT INTO mint_outbox (recipient_address, amount_azr, amount_usd, session_ids, reason)
+            VALUES (%s, %s, %s, %s, %s)
+            RETURNING id
+        """, (recipient, amount_azr, amount_usd, session_ids, reason))
+        intent_id = cursor.fetchone()[0]
+
+        if session_ids:
+            cursor.execute("""
+                UPDATE mining_sessions
+                SET status = 'minting', mint_intent_id = %s
+                WHERE id = ANY(%s)
+            """, (intent_id, session_ids))
+        return intent_id
+
+    def claim(self, worker_id: str, limit: int = 1) -> List[MintIntent]:
+        """Lease the oldest unclaimed intents (and any whose lease has run out)"""
+        with self.storage.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("""
+                WITH next AS (
+                    SELECT id FROM mint_outbox
+                    WHERE status = 'pending'
+                       OR (status IN ('claimed', 'signed') AND lease_expires_at < CURRENT_TIMESTAMP)
+                    ORDER BY id
+                    LIMIT %s
+                    FOR UPDATE SKIP LOCKED
+                )
+                UPDATE mint_outbox AS o
+                SET status = CASE WHEN o.status = 'signed' THEN 'signed' ELSE 'claimed' END,
+                    claimed_by = %s,
+                    lease_expires_at = CURRENT_TIMESTAMP + make_interval(secs => %s),
+                    attempts = o.attempts + 1
+                FROM next
+                WHERE o.id = next.id
+                RETURNING o.*
+            """, (limit, worker_id, self.lease_seconds))
+            rows = cursor.fetchall()
+
+        return [
+            MintIntent(
+                id=row['id'],
+                recipient_address=row['recipient_address'],
+                amount_azr=float(row['amount_azr']),
+                amount_usd=float(row['amount_usd']),
+                session_ids=list(row['session_ids'] or []),
+                reason=row['reason'],
+                status=row['status'],
+                attempts=row['attempts'],
+                nonce=row['nonce'],
+                fee_cap_wei=int(row['fee_cap_wei']) if row['fee_cap_wei'] is not None else None,
+                tx_hash=row['tx_hash'],
+                raw_tx=bytes(row['raw_tx']) if row['raw_tx'] is not None else None
+            )
+            for row in rows
+        ]
+
+    def record_signed(self, intent: MintIntent, worker_id: str, nonce: Optional[int], fee_cap_wei: Optional[int],
+                      tx_hash: str, raw_tx: Optional[bytes]) -> bool:
+        """Persist the signed transaction before it is broadcast; False if the lease was lost"""
+        with self.storage.cursor() as cursor:
+            cursor.execute("""
+                UPDATE mint_outbox
+                SET status = 'signed', nonce = %s, fee_cap_wei = %s, tx_hash = %s, raw_tx = %s
+                WHERE id = %s AND claimed_by = %s AND status = 'claimed'
+            """, (nonce, fee_cap_wei, tx_hash, raw_tx, intent.id, worker_id))
+            updated = cursor.rowcount == 1
+
+        if updated:
+            intent.status, intent.nonce, intent.fee_cap_wei = 'signed', nonce, fee_cap_wei
+            intent.tx_hash, intent.raw_tx = tx_hash, raw_tx
+        return updated
+
+    def mark_sent(self, cursor, intent: MintIntent):
+        """Close the intent, in the same transaction that records the mint"""
+        self.mark_sent_many(cursor, [(intent.id, intent.tx_hash)])
+
+    def mark_sent_many(self, cursor, sent: List[Tuple[int, str]]):
+        """Close (intent id, tx hash) pairs; an intent since re-signed with another hash is left alone"""
+        execute_values(cursor, """
+            UPDATE mint_outbox AS o
+            SET status = 'sent', sent_at = CURRENT_TIMESTAMP, lease_expires_at = NULL, raw_tx = NULL
+            FROM (VALUES %s) AS v(id, tx_hash)
+            WHERE o.id = v.id AND o.tx_hash = v.tx_hash AND o.status <> 'sent'
+        """, sent, template="(%s::bigint, %s)")
+
+    def release(self, intent: MintIntent, error: str):
+        """Return an intent whose transaction was never accepted, clearing any signed transaction"""
+        status = 'failed' if intent.attempts >= self.max_attempts else 'pending'
+        with self.storage.cursor() as cursor:
+            cursor.execute("""
+                UPDATE mint_outbox
+                SET status = %s, claimed_by = NULL, lease_expires_at = NULL,
+                    nonce = NULL, fee_cap_wei = NULL, tx_hash = NULL, raw_tx = NULL, last_error = %s
+                WHERE id = %s
+            """, (status, error[:1000], intent.id))
+
+        if status == 'failed':
+            self.logger.error(f"Mint intent {intent.id} failed after {intent.attempts} attempts: {error}")
+
+    def unclaim(self, intent: MintIntent):
+        """Give back a claimed (unsigned) intent without counting it as an attempt"""
+        with self.storage.cursor() as cursor:
+            cursor.execute("""
+                UPDATE mint_outbox
+                SET status = 'pending', claimed_by = NULL, lease_expires_at = NULL, attempts = attempts - 1
+                WHERE id = %s AND status = 'claimed'
+            """, (intent.id,))
+
+    def depth(self) -> Dict[str, Any]:
+        """Intent counts and AZR per unfinished status"""
+        with self.storage.cursor() as cursor:
+            cursor.execute("""
+                SELECT status, COUNT(*), COALESCE(SUM(amount_azr), 0)
+                FROM mint_outbox
+                WHERE status <> 'sent'
+                GROUP BY status
+            """)
+            return {status: {'intents': count, 'amount_azr': float(amount)} for status, count, amount in cursor.fetchall()}
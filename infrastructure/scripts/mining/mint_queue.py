@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+AZORA MINT COALESCING QUEUE
+Aggregates small mining earnings per recipient into fewer, larger on-chain mints
+"""
+
+import time
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+
+from mint_mine_metrics import LatencyStats, Counter
+
+
+@dataclass
+class PendingMint:
+    """Earnings waiting to be minted to one recipient"""
+    recipient: str
+    amount_usd: float = 0.0
+    amount_azr: float = 0.0
+    session_ids: List[int] = field(default_factory=list)
+    first_queued_at: float = field(default_factory=time.monotonic)
+    # When the batch was first held back for high fees
+    held_since: Optional[float] = None
+
+    @property
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.first_queued_at
+
+
+class MintCoalescingQueue:
+    """Per-recipient earnings accumulator with amount, age, gas-price and fee-percentile flush triggers"""
+
+    def __init__(self, min_batch_azr: float = 1.0, max_age_seconds: float = 3600.0,
+                 max_gas_price_wei: Optional[int] = None, low_gas_price_wei: Optional[int] = None,
+                 fee_hold_max_seconds: Optional[float] = None):
+        self.min_batch_azr = min_batch_azr
+        self.max_age_seconds = max_age_seconds
+        # Above this price only age-expired batches are minted
+        self.max_gas_price_wei = max_gas_price_wei
+        # At or below this price every pending batch is minted
+        self.low_gas_price_wei = low_gas_price_wei
+        # Longest a due batch waits for fees to drop below the oracle's target
+        self.fee_hold_max_seconds = fee_hold_max_seconds
+
+        self._pending: Dict[str, PendingMint] = {}
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.batch_age = LatencyStats(buckets=(30, 60, 300, 900, 1800, 3600, 7200, 21600, 86400))
+        self.flush_latency = LatencyStats()
+        self.earnings_queued = Counter()
+        self.batches_flushed = Counter()
+        self.fee_hold_time = LatencyStats(buckets=(30, 60, 300, 900, 1800, 3600, 7200))
+
+    def add(self, recipient: str, amount_usd: float, amount_azr: float, session_id: Optional[int] = None) -> bool:
+        """Queue newly detected earnings for a recipient; True once its batch reaches the minimum size"""
+        with self._lock:
+            pending = self._pending.get(recipient)
+            if pending is None:
+                pending = PendingMint(recipient)
+                self._pending[recipient] = pending
+            pending.amount_usd += amount_usd
+            pending.amount_azr += amount_azr
+            if session_id is not None:
+                pending.session_ids.append(session_id)
+            full = pending.amount_azr >= self.min_batch_azr
+        self.earnings_queued.inc()
+        return full
+
+    def _flush_reason(self, pending: PendingMint, gas_price_wei: Optional[int], force: bool,
+                      fees_low: Optional[bool]) -> Optional[str]:
+        if force:
+            return 'forced'
+        if pending.age_seconds >= self.max_age_seconds:
+            return 'age'
+        if self.low_gas_price_wei is not None and gas_price_wei is not None and gas_price_wei <= self.low_gas_price_wei:
+            return 'low_gas'
+        if pending.amount_azr >= self.min_batch_azr:
+            if self.max_gas_price_wei is not None and gas_price_wei is not None and gas_price_wei > self.max_gas_price_wei:
+                return None
+            if fees_low is False:
+                # Non-urgent: wait for cheaper blocks unless the hold deadline has passed
+                if pending.held_since is None:
+                    pending.held_since = time.monotonic()
+                if self.fee_hold_max_seconds is not None and time.monotonic() - pending.held_since >= self.fee_hold_max_seconds:
+                    return 'fee_deadline'
+                return None
+            return 'amount'
+        return None
+
+    def take_due(self, gas_price_wei: Optional[int] = None, force: bool = False,
+                 fees_low: Optional[bool] = None) -> List[PendingMint]:
+        """Remove and return every batch whose flush trigger has fired.
+
+        fees_low is the gas oracle's verdict; False holds amount-triggered batches
+        until it turns True or fee_hold_max_seconds passes. None disables the hold.
+        """
+        due = []
+        with self._lock:
+            for recipient, pending in list(self._pending.items()):
+                if self._flush_reason(pending, gas_price_wei, force, fees_low):
+                    due.append(self._pending.pop(recipient))
+        for pending in due:
+            self.batch_age.observe(pending.age_seconds)
+            if pending.held_since is not None:
+                self.fee_hold_time.observe(time.monotonic() - pending.held_since)
+                pending.held_since = None
+        return due
+
+    def requeue(self, pending: PendingMint):
+        """Put a batch back after a failed mint, keeping its original age"""
+        with self._lock:
+            current = self._pending.get(pending.recipient)
+            if current is not None:
+                pending.amount_usd += current.amount_usd
+                pending.amount_azr += current.amount_azr
+                pending.session_ids.extend(current.session_ids)
+            self._pending[pending.recipient] = pending
+
+    def record_flush(self, duration_seconds: float):
+        """Record how long minting one batch took"""
+        self.batches_flushed.inc()
+        self.flush_latency.observe(duration_seconds)
+
+    def depth(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'recipients': len(self._pending),
+                'pending_azr': sum(p.amount_azr for p in self._pending.values()),
+                'pending_sessions': sum(len(p.session_ids) for p in self._pending.values()),
+                'held_for_fees': sum(1 for p in self._pending.values() if p.held_since is not None),
+                'oldest_age_seconds': max((p.age_seconds for p in self._pending.values()), default=0.0)
+            }
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get queue depth and flush metrics"""
+        return {
+            'depth': self.depth(),
+            'earnings_queued': self.earnings_queued.value,
+            'batches_flushed': self.batches_flushed.value,
+            'batch_age': self.batch_age.snapshot(),
+            'flush_latency': self.flush_latency.snapshot(),
+            'fee_hold_time': self.fee_hold_time.snapshot()
+        }
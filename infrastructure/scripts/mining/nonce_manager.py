@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+AZORA NONCE MANAGER
+Hands out account nonces locally so several mint transactions can be in flight at once
+"""
+
+import threading
+import logging
+from typing import Dict, Any, Optional, Set
+
+# Node error fragments that mean our local view of the nonce sequence is wrong
+NONCE_DESYNC_ERRORS = (
+    'nonce too low',
+    'nonce too high',
+    'already known',
+    'replacement transaction underpriced',
+    'invalid nonce'
+)
+
+
+class NonceManager:
+    """Local nonce allocator for one sending account, synced from the chain on demand"""
+
+    def __init__(self, web3, address: str, logger: Optional[logging.Logger] = None):
+        self.web3 = web3
+        self.address = address
+        self.logger = logger or logging.getLogger('AzoraNonceManager')
+
+        self._lock = threading.Lock()
+        self._next_nonce: Optional[int] = None
+        self._reserved: Set[int] = set()
+        self._needs_resync = True
+
+        self.stats = {'syncs': 0, 'reserved': 0, 'gaps_detected': 0, 'rollbacks': 0}
+
+    def _sync_locked(self):
+        # 'pending' includes transactions already sitting in the node's mempool
+        self._next_nonce = self.web3.eth.get_transaction_count(self.address, 'pending')
+        self._needs_resync = False
+        self.stats['syncs'] += 1
+        self.logger.info(f"Nonce synced from chain: next nonce {self._next_nonce}")
+
+    def sync(self):
+        """Re-read the next nonce from the chain"""
+        with self._lock:
+            self._sync_locked()
+
+    def reserve(self) -> int:
+        """Allocate the next nonce for a transaction about to be sent"""
+        with self._lock:
+            if self._needs_resync and not self._reserved:
+                self._sync_locked()
+            elif self._next_nonce is None:
+                self._sync_locked()
+
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            self._reserved.add(nonce)
+            self.stats['reserved'] += 1
+            return nonce
+
+    def confirm(self, nonce: int):
+        """The node accepted the transaction using this nonce"""
+        with self._lock:
+            self._reserved.discard(nonce)
+
+    def release(self, nonce: int, error: Optional[Exception] = None):
+        """The transaction using this nonce was never accepted by the node"""
+        with self._lock:
+            self._reserved.discard(nonce)
+
+            desync = error is not None and any(fragment in str(error).lower() for fragment in NONCE_DESYNC_ERRORS)
+            if not desync and nonce == self._next_nonce - 1:
+                # Nothing was handed out after it - simply reuse the nonce
+                self._next_nonce = nonce
+                self.stats['rollbacks'] += 1
+                return
+
+            # Later nonces are already out (or the node disagrees): the sequence has a gap
+            self.stats['gaps_detected'] += 1
+            self._needs_resync = True
+            self.logger.warning(f"Nonce gap at {nonce} - will resync from chain once in-flight sends settle")
+
+    def verify(self) -> bool:
+        """Compare the local sequence with the chain while nothing is being sent; resync on mismatch"""
+        with self._lock:
+            if self._reserved or self._next_nonce is None:
+                return True
+            try:
+                chain_next = self.web3.eth.get_transaction_count(self.address, 'pending')
+            except Exception as e:
+                self.logger.warning(f"Nonce verification failed: {e}")
+                return True
+            if chain_next != self._next_nonce:
+                self.stats['gaps_detected'] += 1
+                self.logger.warning(f"Local nonce {self._next_nonce} != chain pending nonce {chain_next} - resyncing")
+                self._sync_locked()
+                return False
+            return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return dict(self.stats, next_nonce=self._next_nonce, in_flight_sends=len(self._reserved))
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+AZORA POOL BALANCE CHECKPOINTS
+Persisted delta-tracking state for mining pool balances (unpaid balance, last payout id,
+observed-at) per pool and wallet. Checkpoints are written in the same transaction as the
+earnings they account for, with a version check, so a restarted engine or a new cluster
+leader resumes from the last counted observation instead of re-learning a baseline, and
+two instances can never count the same delta. created_at is the first observation, so
+earnings before it are the ones a history backfill may still record.
+"""
+
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from psycopg2.extras import execute_values
+
+POOL_CHECKPOINTS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS pool_balance_checkpoints (
+        pool VARCHAR(50) NOT NULL,
+        wallet VARCHAR(255) NOT NULL,
+        unpaid_balance DECIMAL(30,12) NOT NULL,
+        last_payout_id VARCHAR(255),
+        observed_at TIMESTAMP NOT NULL,
+        version BIGINT NOT NULL DEFAULT 1,
+        created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (pool, wallet)
+    )
+"""
+
+
+class CheckpointConflict(Exception):
+    """Another instance advanced a checkpoint since this one read it"""
+
+
+@dataclass
+class PoolCheckpoint:
+    pool: str
+    wallet: str
+    unpaid_balance: float
+    last_payout_id: Optional[str]
+    observed_at: datetime
+    # Version stored in the database (0 = not stored yet); a save only succeeds against it
+    version: int = 0
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.pool, self.wallet
+
+    def to_row(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_row(cls, row: Dict[str, Any]) -> 'PoolCheckpoint':
+        return cls(row['pool'], row['wallet'], float(row['unpaid_balance']), row['last_payout_id'],
+                   row['observed_at'], int(row.get('version') or 0))
+
+
+def earnings_since(checkpoint: Optional[PoolCheckpoint], unpaid_balance: float,
+                   payouts: Sequence[Tuple[str, float]] = ()) -> float:
+    """Earnings between a checkpoint and a new unpaid-balance observation.
+
+    payouts are (payout id, amount) pairs, newest first. Payouts made after the checkpoint
+    are added back, so earnings straddling a payout are counted once. A balance drop the
+    payouts cannot explain is treated as a payout of unknown size and counts nothing.
+    """
+    if checkpoint is None:
+        # First observation ever - it only sets the baseline
+        return 0.0
+
+    paid_out: Optional[float] = 0.0
+    if payouts:
+        paid_out = None
+        if checkpoint.last_payout_id is not None:
+            paid_out = 0.0
+            for payout_id, amount in payouts:
+                if payout_id == checkpoint.last_payout_id:
+                    break
+                paid_out += amount
+            else:
+                # The checkpoint's payout has dropped off the list, so the new ones cannot be sized
+                paid_out = None
+
+    if paid_out is None:
+        return max(0.0, unpaid_balance - checkpoint.unpaid_balance)
+    return max(0.0, unpaid_balance + paid_out - checkpoint.unpaid_balance)
+
+
+def load(cursor, pool: Optional[str] = None, wallet: Optional[str] = None) -> Dict[Tuple[str, str], PoolCheckpoint]:
+    """Stored checkpoints, optionally for one pool or one pool wallet"""
+    cursor.execute("""
+        SELECT pool, wallet, unpaid_balance, last_payout_id, observed_at, version
+        FROM pool_balance_checkpoints
+        WHERE (%(pool)s IS NULL OR pool = %(pool)s) AND (%(wallet)s IS NULL OR wallet = %(wallet)s)
+    """, {'pool': pool, 'wallet': wallet})
+    checkpoints = {}
+    for pool_name, wallet_address, unpaid_balance, last_payout_id, observed_at, version in cursor.fetchall():
+        checkpoint = PoolCheckpoint(pool_name, wallet_address, float(unpaid_balance), last_payout_id,
+                                    observed_at, version)
+        checkpoints[checkpoint.key] = checkpoint
+    return checkpoints
+
+
+def save(cursor, checkpoints: Iterable[PoolCheckpoint]):
+    """Write checkpoints if their stored versions are unchanged; raises CheckpointConflict otherwise.
+
+    Run it in the transaction that records the matching earnings, so a conflict rolls
+    those back too. Callers bump their in-memory versions once the transaction commits.
+    """
+    for checkpoint in checkpoints:
+        if checkpoint.version == 0:
+            cursor.execute("""
+                INSERT INTO pool_balance_checkpoints
+                (pool, wallet, unpaid_balance, last_payout_id, observed_at, created_at)
+                VALUES (%s, %s, %s, %s, %s, %s)
+                ON CONFLICT (pool, wallet) DO NOTHING
+                RETURNING version
+            """, (checkpoint.pool, checkpoint.wallet, checkpoint.unpaid_balance, checkpoint.last_payout_id,
+                  checkpoint.observed_at, checkpoint.observed_at))
+        else:
+            cursor.execute("""
+                UPDATE pool_balance_checkpoints
+                SET unpaid_balance = %s, last_payout_id = %s, observed_at = %s,
+                    version = version + 1, updated_at = CURRENT_TIMESTAMP
+                WHERE pool = %s AND wallet = %s AND version = %s
+                RETURNING version
+            """, (checkpoint.unpaid_balance, checkpoint.last_payout_id, checkpoint.observed_at,
+                  checkpoint.pool, checkpoint.wallet, checkpoint.version))
+        if cursor.fetchone() is None:
+            raise CheckpointConflict(f"Checkpoint for {checkpoint.pool}/{checkpoint.wallet} changed underneath us")
+
+
+def merge(cursor, checkpoints: List[PoolCheckpoint]) -> int:
+    """Apply journaled checkpoints, keeping whichever observation is newer; returns rows written"""
+    if not checkpoints:
+        return 0
+    ordered = sorted(checkpoints, key=lambda c: c.observed_at)
+    # One row per key per statement; the newest observation of each wins, the oldest is its baseline
+    newest = {c.key: c for c in ordered}
+    oldest = {c.key: c for c in reversed(ordered)}
+    rows = execute_values(cursor, """
+        INSERT INTO pool_balance_checkpoints AS c
+        (pool, wallet, unpaid_balance, last_payout_id, observed_at, created_at)
+        VALUES %s
+        ON CONFLICT (pool, wallet) DO UPDATE
+        SET unpaid_balance = EXCLUDED.unpaid_balance, last_payout_id = EXCLUDED.last_payout_id,
+            observed_at = EXCLUDED.observed_at, version = c.version + 1, updated_at = CURRENT_TIMESTAMP
+        WHERE c.observed_at < EXCLUDED.observed_at
+        RETURNING pool
+    """, [
+        (checkpoint.pool, checkpoint.wallet, checkpoint.unpaid_balance, checkpoint.last_payout_id,
+         checkpoint.observed_at, oldest[key].observed_at)
+        for key, checkpoint in newest.items()
+    ], template="(%s, %s, %s, %s, %s::timestamp, %s::timestamp)", fetch=True)
+    return len(rows)
+
+
+def baseline_time(cursor, pool: str, wallet: str) -> Optional[datetime]:
+    """When delta tracking of a pool wallet began (its first stored observation), if it has"""
+    cursor.execute("SELECT created_at FROM pool_balance_checkpoints WHERE pool = %s AND wallet = %s",
+                   (pool, wallet))
+    row = cursor.fetchone()
+    return row[0] if row else None
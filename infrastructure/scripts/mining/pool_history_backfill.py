@@ -0,0 +1,409 @@
+#!/usr/bin/env python3
+"""
+AZORA POOL HISTORY BACKFILL
+Loads a pool wallet's history from before the engine started tracking it: credited rewards
+become completed mining sessions (nothing is minted for them) and hashrate samples become
+mining_statistics rows. Pages are fetched newest first and written with COPY in large
+batches; each batch commits together with the wallet's progress cursor, so an interrupted
+run resumes where it stopped. Running totals are rebuilt once at the end, and rollup
+watermarks are moved back so the backfilled range is rolled up again.
+
+The live engine counts a wallet's earnings from its first pool balance checkpoint, so the
+backfill stops there. A wallet the engine has never seen gets its checkpoint from the
+backfill, taken from the pool's current wallet payload.
+
+    python3 pool_history_backfill.py run [--since 2026-01-01] [--api http://127.0.0.1:8766]
+    python3 pool_history_backfill.py status
+
+stand_in_services.py pool serves synthetic wallet history to try a backfill against.
+"""
+
+import os
+import time
+import argparse
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import running_totals
+import pool_checkpoints
+import telemetry_partitions
+import mint_mine_events
+from pool_checkpoints import PoolCheckpoint, CheckpointConflict
+from earnings_sources import PoolSource, load_sources, pool_payouts
+from mint_mine_rollups import rewind_watermarks
+from resilient_http import get_http_client
+from write_journal import copy_rows
+from mining_logging import configure_logging
+
+BACKFILL_PROGRESS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS pool_backfill_progress (
+        source VARCHAR(255) NOT NULL,
+        history VARCHAR(20) NOT NULL,
+        cutoff TIMESTAMP NOT NULL,
+        cursor_at TIMESTAMP,
+        rows_written BIGINT NOT NULL DEFAULT 0,
+        completed_at TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        PRIMARY KEY (source, history)
+    )
+"""
+
+# History kinds, in the order they are backfilled
+HISTORIES = ('rewards', 'hashrate')
+
+SESSION_COLUMNS = ('session_id', 'start_time', 'end_time', 'algorithm', 'total_hashrate_mhs',
+                   'total_earnings_usd', 'azr_minted', 'status', 'created_at')
+STATISTICS_COLUMNS = ('timestamp', 'algorithm', 'hashrate_mhs', 'pool', 'earnings_usd',
+                      'shares_accepted', 'shares_rejected')
+
+COIN_ALGORITHMS = {
+    'iron': 'FishHash (IRON)',
+    'erg': 'Autolykos2 (ERG)',
+    'cfx': 'Octopus (CFX)'
+}
+
+
+@dataclass
+class BackfillProgress:
+    source: str
+    history: str
+    # History at or after the cutoff belongs to the live engine
+    cutoff: datetime
+    # Oldest point written so far; the next page is fetched from here
+    cursor_at: Optional[datetime] = None
+    rows_written: int = 0
+    completed_at: Optional[datetime] = None
+
+
+def load_progress(cursor, sources: Optional[Sequence[str]] = None) -> Dict[Tuple[str, str], BackfillProgress]:
+    cursor.execute("""
+        SELECT source, history, cutoff, cursor_at, rows_written, completed_at
+        FROM pool_backfill_progress
+        WHERE %(sources)s IS NULL OR source = ANY(%(sources)s)
+        ORDER BY source, history
+    """, {'sources': list(sources) if sources is not None else None})
+    return {(row[0], row[1]): BackfillProgress(*row) for row in cursor.fetchall()}
+
+
+def save_progress(cursor, progress: BackfillProgress):
+    cursor.execute("""
+        INSERT INTO pool_backfill_progress (source, history, cutoff, cursor_at, rows_written, completed_at)
+        VALUES (%s, %s, %s, %s, %s, %s)
+        ON CONFLICT (source, history) DO UPDATE
+        SET cursor_at = EXCLUDED.cursor_at, rows_written = EXCLUDED.rows_written,
+            completed_at = EXCLUDED.completed_at, updated_at = CURRENT_TIMESTAMP
+    """, (progress.source, progress.history, progress.cutoff, progress.cursor_at, progress.rows_written,
+          progress.completed_at))
+
+
+class PoolHistoryBackfill:
+    """Pages pool wallet history into mining_sessions and mining_statistics"""
+
+    def __init__(self, storage, apis: Dict[str, str], since: Optional[datetime] = None,
+                 page_size: int = 1000, batch_rows: int = 50000, stats_retention_days: float = 30.0,
+                 stats_partition_interval: str = 'day', retries: int = 3,
+                 logger: Optional[logging.Logger] = None):
+        self.storage = storage
+        self.apis = apis
+        self.since = since
+        self.page_size = page_size
+        self.batch_rows = batch_rows
+        # Statistics older than retention would be dropped with their partitions straight away
+        self.stats_retention_days = stats_retention_days
+        self.stats_partition_interval = stats_partition_interval
+        self.retries = retries
+        self.logger = logger or logging.getLogger('AzoraPoolBackfill')
+
+        self.http = get_http_client()
+        # Oldest backfilled point per rollup, for rewinding its watermarks
+        self.oldest_written: Dict[str, datetime] = {}
+        self.stats = {'pages': 0, 'sessions': 0, 'duplicate_sessions': 0, 'statistics': 0, 'failed_sources': 0}
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    def run(self, sources: Sequence[PoolSource]) -> Dict[str, Any]:
+        """Backfill every source, then rebuild running totals and rewind rollups once"""
+        started = time.monotonic()
+        for source in sources:
+            try:
+                self.backfill_source(source)
+            except Exception as e:
+                # Committed batches stay; the next run resumes this source from its cursor
+                self.stats['failed_sources'] += 1
+                self.logger.error(f"Backfill of {source.key} stopped: {e}")
+
+        report = dict(self.stats)
+        if self.stats['sessions'] or self.stats['statistics']:
+            report['totals'] = self.finish()
+        report['seconds'] = round(time.monotonic() - started, 1)
+        return report
+
+    def backfill_source(self, source: PoolSource):
+        with self.storage.cursor() as cursor:
+            progress = load_progress(cursor, [source.key])
+
+        missing = [history for history in HISTORIES if (source.key, history) not in progress]
+        if missing:
+            cutoff = self.cutoff(source)
+            with self.storage.cursor() as cursor:
+                for history in missing:
+                    progress[(source.key, history)] = BackfillProgress(source.key, history, cutoff)
+                    save_progress(cursor, progress[(source.key, history)])
+
+        for history in HISTORIES:
+            entry = progress[(source.key, history)]
+            if entry.completed_at is None:
+                self.backfill_history(source, entry)
+
+    def cutoff(self, source: PoolSource) -> datetime:
+        """When live tracking of a wallet began, starting it now if the engine never has"""
+        with self.storage.cursor() as cursor:
+            baseline = pool_checkpoints.baseline_time(cursor, source.checkpoint_pool, source.wallet)
+        if baseline is not None:
+            return baseline
+
+        data = self.fetch_json(source.url(self.apis), source)
+        payouts = pool_payouts(data)
+        checkpoint = PoolCheckpoint(source.checkpoint_pool, source.wallet,
+                                    float(data.get('balance', {}).get('unpaid', 0.0)),
+                                    payouts[0][0] if payouts else None, datetime.now())
+        try:
+            with self.storage.cursor() as cursor:
+                pool_checkpoints.save(cursor, [checkpoint])
+            self.logger.info(f"Started delta tracking for {source.key} at ${checkpoint.unpaid_balance:.4f} unpaid")
+            return checkpoint.observed_at
+        except CheckpointConflict:
+            # The engine took its first observation in the meantime
+            with self.storage.cursor() as cursor:
+                return pool_checkpoints.baseline_time(cursor, source.checkpoint_pool, source.wallet)
+
+    def backfill_history(self, source: PoolSource, progress: BackfillProgress):
+        """Page one history of a source back to `since`, committing every batch_rows rows"""
+        floor = self.since
+        if progress.history == 'hashrate':
+            retained_from = datetime.now() - timedelta(days=self.stats_retention_days)
+            floor = max(floor, retained_from) if floor else retained_from
+
+        cursor_at = progress.cursor_at or progress.cutoff
+        rows: List[Tuple] = []
+        done = False
+        while not done:
+            page = self.fetch_page(source, progress.history, cursor_at)
+            self.stats['pages'] += 1
+            times = [datetime.fromtimestamp(item['time']) for item in page]
+
+            for item, observed_at in zip(page, times):
+                if floor and observed_at < floor:
+                    continue
+                if progress.history == 'rewards':
+                    # `to` is inclusive; rewards straddling a page boundary dedupe on session_id
+                    if observed_at < progress.cutoff:
+                        rows.append(self.session_row(source, item, observed_at))
+                elif observed_at < cursor_at:
+                    rows.append(self.statistics_row(source, item, observed_at))
+
+            oldest = min(times) if times else cursor_at
+            done = len(page) < self.page_size or (floor is not None and oldest < floor)
+            # A full page of one timestamp would otherwise be fetched forever
+            cursor_at = oldest if oldest < cursor_at else cursor_at - timedelta(seconds=1)
+
+            if done or len(rows) >= self.batch_rows:
+                progress.cursor_at = cursor_at
+                progress.completed_at = datetime.now() if done else None
+                self.write_batch(source, progress, rows)
+                rows = []
+
+        self.logger.info(f"✅ Backfilled {progress.rows_written} {progress.history} rows for {source.key}")
+
+    # ------------------------------------------------------------------
+    # Pool API
+    # ------------------------------------------------------------------
+
+    def fetch_json(self, url: str, source: PoolSource, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        for attempt in range(self.retries):
+            try:
+                # Same breaker as the engine's polling of this pool
+                response = self.http.get(url, endpoint=source.pool, params=params, timeout=30)
+                response.raise_for_status()
+                return response.json()
+            except Exception as e:
+                if attempt + 1 >= self.retries:
+                    raise
+                wait = max(2.0 ** attempt, self.http.breaker(source.pool).get_stats()['retry_in_seconds'])
+                self.logger.warning(f"Pool history request for {source.key} failed ({e}) - retrying in {wait:.0f}s")
+                time.sleep(wait)
+
+    def fetch_page(self, source: PoolSource, history: str, to: datetime) -> List[Dict[str, Any]]:
+        """Up to page_size entries at or before `to`, newest first"""
+        data = self.fetch_json(source.history_url(self.apis, history), source,
+                               {'to': int(to.timestamp()), 'limit': self.page_size})
+        return data.get(history) or []
+
+    # ------------------------------------------------------------------
+    # Rows
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def session_row(source: PoolSource, reward: Dict[str, Any], credited_at: datetime) -> Tuple:
+        # Completed with nothing minted, so neither the mint queue nor the outbox ever picks it up
+        return (f"backfill:{source.pool}/{source.coin}/{source.wallet}:{reward['id']}", credited_at, credited_at,
+                COIN_ALGORITHMS.get(source.coin, source.coin.upper()), None, float(reward['amount']), 0,
+                'completed', credited_at)
+
+    @staticmethod
+    def statistics_row(source: PoolSource, sample: Dict[str, Any], observed_at: datetime) -> Tuple:
+        return (observed_at, COIN_ALGORITHMS.get(source.coin, source.coin.upper()),
+                float(sample.get('hashrate', 0.0)) / 1e6, source.checkpoint_pool, None,
+                sample.get('validShares'), sample.get('invalidShares'))
+
+    def write_batch(self, source: PoolSource, progress: BackfillProgress, rows: List[Tuple]):
+        """COPY one batch and advance the progress cursor in the same transaction"""
+        with self.storage.cursor() as cursor:
+            if progress.history == 'rewards':
+                written = self.copy_sessions(cursor, rows)
+                self.stats['duplicate_sessions'] += len(rows) - written
+                self.stats['sessions'] += written
+                rollup, time_index = 'mining_sessions', 1
+            else:
+                written = self.copy_statistics(cursor, rows)
+                self.stats['statistics'] += written
+                rollup, time_index = 'mining_statistics', 0
+
+            progress.rows_written += written
+            save_progress(cursor, progress)
+
+        if rows:
+            oldest = min(row[time_index] for row in rows)
+            self.oldest_written[rollup] = min(oldest, self.oldest_written.get(rollup, oldest))
+        self.logger.info(f"📥 {source.key} {progress.history}: {written} rows written, "
+                         f"back to {progress.cursor_at:%Y-%m-%d %H:%M}")
+
+    def copy_sessions(self, cursor, rows: List[Tuple]) -> int:
+        if not rows:
+            return 0
+        cursor.execute("""
+            CREATE TEMP TABLE backfill_mining_sessions
+            (LIKE mining_sessions INCLUDING DEFAULTS) ON COMMIT DROP
+        """)
+        copy_rows(cursor, 'backfill_mining_sessions', SESSION_COLUMNS, rows)
+        cursor.execute(f"""
+            INSERT INTO mining_sessions ({', '.join(SESSION_COLUMNS)})
+            SELECT {', '.join(SESSION_COLUMNS)} FROM backfill_mining_sessions
+            ON CONFLICT (session_id) DO NOTHING
+        """)
+        return cursor.rowcount
+
+    def copy_statistics(self, cursor, rows: List[Tuple]) -> int:
+        if not rows:
+            return 0
+        if telemetry_partitions.is_partitioned(cursor, 'mining_statistics'):
+            # Past periods normally have no partition yet
+            telemetry_partitions.ensure_partitions(
+                cursor, 'mining_statistics', self.stats_partition_interval, 0,
+                now=min(row[0] for row in rows), until=max(row[0] for row in rows)
+            )
+        copy_rows(cursor, 'mining_statistics', STATISTICS_COLUMNS, rows)
+        return len(rows)
+
+    def finish(self) -> Dict[str, float]:
+        """Rebuild running totals once, publish the change and let rollups redo the backfilled range"""
+        with self.storage.cursor() as cursor:
+            # Hold off live writers between reading the old totals and rebuilding them
+            cursor.execute("LOCK TABLE engine_running_totals IN EXCLUSIVE MODE")
+            before = running_totals.read_totals(cursor)
+            after = running_totals.rebuild(cursor)
+            deltas = {metric: after[metric] - before.get(metric, 0.0) for metric in after
+                      if after[metric] != before.get(metric, 0.0)}
+            mint_mine_events.notify(cursor, 'session', backfill=True, totals=deltas)
+
+            for rollup, since in self.oldest_written.items():
+                if rewind_watermarks(cursor, rollup, since):
+                    self.logger.info(f"⏪ {rollup} rollups will be rebuilt from {since:%Y-%m-%d %H:%M}")
+        return after
+
+
+def main():
+    """Backfill pool history or show its progress"""
+    from mint_mine_storage import EngineStorage
+    from mint_mine_migrations import run_migrations
+
+    parser = argparse.ArgumentParser(description='AZORA pool history backfill')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='backfill every configured pool wallet')
+    run.add_argument('--api', default=os.getenv('WOOLYPOOLY_API', 'https://api.woolypooly.com'),
+                     help='woolypooly API base URL')
+    run.add_argument('--sources-file', default=os.getenv('EARNINGS_SOURCES_FILE'))
+    run.add_argument('--wallet', default=os.getenv('MINTER_ADDRESS'), help='wallet when no sources are configured')
+    run.add_argument('--since', type=datetime.fromisoformat, help='oldest history to load (default: all)')
+    run.add_argument('--page-size', type=int, default=1000)
+    run.add_argument('--batch-rows', type=int, default=50000)
+
+    commands.add_parser('status', help='show backfill progress')
+
+    args = parser.parse_args()
+
+    logger = configure_logging('pool_history_backfill')
+
+    storage = EngineStorage({
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': int(os.getenv('DB_PORT', '5432')),
+        'name': os.getenv('DB_NAME', 'azora_os'),
+        'user': os.getenv('DB_USER', 'azora'),
+        'password': os.getenv('DB_PASSWORD', '')
+    }, statement_timeout_ms=0)
+    storage.connect()
+
+    partition_settings = {
+        'mining_statistics': {
+            'interval': os.getenv('STATS_PARTITION_INTERVAL', 'day'),
+            'premake': int(os.getenv('STATS_PARTITION_PREMAKE', '7')),
+            'retention_days': float(os.getenv('STATS_RETENTION_DAYS', '30'))
+        },
+        'crypto_prices': {
+            'interval': os.getenv('PRICES_PARTITION_INTERVAL', 'week'),
+            'premake': int(os.getenv('PRICES_PARTITION_PREMAKE', '2')),
+            'retention_days': float(os.getenv('PRICES_RETENTION_DAYS', '30'))
+        }
+    }
+
+    try:
+        run_migrations(storage, partition_settings, logger)
+
+        if args.command == 'status':
+            with storage.cursor() as cursor:
+                progress = load_progress(cursor)
+            if not progress:
+                print("No backfills recorded")
+            for entry in progress.values():
+                state = f"done {entry.completed_at:%Y-%m-%d %H:%M}" if entry.completed_at else "in progress"
+                reached = f"{entry.cursor_at:%Y-%m-%d %H:%M}" if entry.cursor_at else '-'
+                print(f"   {entry.source} {entry.history}: {entry.rows_written:,} rows, "
+                      f"back to {reached} (cutoff {entry.cutoff:%Y-%m-%d %H:%M}), {state}")
+            return
+
+        sources, _ = load_sources(args.wallet, args.sources_file)
+        if not sources:
+            print("❌ No pool wallets configured (EARNINGS_SOURCES_FILE, POOL_WALLETS or MINTER_ADDRESS)")
+            return
+
+        backfill = PoolHistoryBackfill(
+            storage, {'woolypooly': args.api}, since=args.since, page_size=args.page_size,
+            batch_rows=args.batch_rows,
+            stats_retention_days=partition_settings['mining_statistics']['retention_days'],
+            stats_partition_interval=partition_settings['mining_statistics']['interval'], logger=logger
+        )
+        report = backfill.run(sources)
+        print(f"✅ {report['sessions']:,} sessions and {report['statistics']:,} statistics rows backfilled "
+              f"from {report['pages']:,} pages in {report['seconds']}s")
+        if report['failed_sources']:
+            print(f"⚠️ {report['failed_sources']} sources stopped early - run again to resume them")
+    finally:
+        storage.close()
+
+if __name__ == '__main__':
+    main()
@@ -6,12 +6,13 @@ Advanced parallel processing for maximum cryptocurrency profits
 
 import json
 import time
-import requests
 import threading
 import concurrent.futures
 from datetime import datetime
 from typing import Dict, List, Tuple
 
+from market_price_service import get_price_service
+
 class QuantumMiningOptimizer:
     def __init__(self):
         self.coins_data = {}
@@ -22,11 +23,9 @@ class QuantumMiningOptimizer:
     def fetch_market_data(self) -> Dict:
         """Fetch real-time cryptocurrency market data"""
         try:
-            # CoinGecko API for prices
+            # CoinGecko prices via the shared, cached price service
             coins = ['ergo', 'conflux-token', 'monero', 'ravencoin', 'kaspa', 'iron-fish', 'alephium']
-            ids = ','.join(coins)
-            response = requests.get(f'https://api.coingecko.com/api/v3/simple/price?ids={ids}&vs_currencies=usd', timeout=10)
-            prices = response.json()
+            prices = get_price_service().get_prices(coins)
 
             return {
                 'ERG': prices.get('ergo', {}).get('usd', 0.6857),
@@ -6,14 +6,23 @@ Real-time cryptocurrency mining dashboard and control center
 
 import json
 import time
-import requests
+import logging
 import psutil
 import os
 from datetime import datetime
 from flask import Flask, render_template_string, jsonify
 import threading
+import requests
+
+from miner_api_client import get_miner_client
+from resilient_http import get_http_client
+from mining_logging import configure_logging
 
 app = Flask(__name__)
+logger = logging.getLogger('real_mining_dashboard')
+
+# Mint-mine engine's embedded stats API
+ENGINE_API_URL = os.getenv('ENGINE_API_URL', 'http://127.0.0.1:8790')
 
 # Global mining data
 mining_data = {
@@ -35,50 +44,31 @@ def get_lolminer_stats():
     """Get stats from lolMiner API"""
     global mining_data
 
-    # Try different API ports (we set them to 4444-4447)
-    ports = [4444, 4445, 4446, 4447]
+    # Shared client probes API ports 4444-4447 in parallel and caches the live one
+    data = get_miner_client().get_summary()
+    if data:
+        # Parse lolMiner API response
+        mining_data['status'] = 'active'
+        mining_data['algorithm'] = data.get('Algorithm', 'Unknown')
 
-    for port in ports:
-        try:
-            response = requests.get(f'http://127.0.0.1:{port}/summary', timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-
-                # Parse lolMiner API response
-                mining_data['status'] = 'active'
-                mining_data['algorithm'] = data.get('Algorithm', 'Unknown')
-
-                # Get hashrate
-                workers = data.get('Workers', [])
-                if workers:
-                    hashrate_str = workers[0].get('Hashrate', '0')
-                    # Convert hashrate string to number
-                    if 'KH/s' in hashrate_str:
-                        mining_data['hashrate'] = float(hashrate_str.replace(' KH/s', '')) * 1000
-                    elif 'MH/s' in hashrate_str:
-                        mining_data['hashrate'] = float(hashrate_str.replace(' MH/s', '')) * 1000000
-                    elif 'GH/s' in hashrate_str:
-                        mining_data['hashrate'] = float(hashrate_str.replace(' GH/s', '')) * 1000000000
-                    else:
-                        mining_data['hashrate'] = float(hashrate_str.replace(' H/s', ''))
-
-                # Get shares
-                mining_data['shares']['accepted'] = data.get('Shares_Accepted', 0)
-                mining_data['shares']['rejected'] = data.get('Shares_Rejected', 0)
-
-                # Get pool info
-                mining_data['pool'] = data.get('Current_Pool', 'Unknown')
-
-                # Calculate uptime (approximate)
-                mining_data['uptime'] = data.get('Uptime', 0)
-
-                # Calculate profitability based on algorithm and hashrate
-                calculate_profitability()
-
-                return True
-
-        except:
-            continue
+        # Hashrate already converted to H/s by the client
+        if data.get('Workers'):
+            mining_data['hashrate'] = data['hashrate_hs']
+
+        # Get shares
+        mining_data['shares']['accepted'] = data.get('Shares_Accepted', 0)
+        mining_data['shares']['rejected'] = data.get('Shares_Rejected', 0)
+
+        # Get pool info
+        mining_data['pool'] = data.get('Current_Pool', 'Unknown')
+
+        # Calculate uptime (approximate)
+        mining_data['uptime'] = data.get('Uptime', 0)
+
+        # Calculate profitability based on algorithm and hashrate
+        calculate_profitability()
+
+        return True
 
     # No active miner found
     mining_data['status'] = 'stopped'
@@ -726,35 +716,25 @@ def get_azr_minting_stats():
     }
 
     try:
-        # Check mint-mine integration data
-        integration_file = '/tmp/azr_mint_mine_data.json'
-        if os.path.exists(integration_file):
-            with open(integration_file, 'r') as f:
-                integration_data = json.load(f)
-                azr_data.update({
-                    'total_azr_minted': integration_data.get('total_azr_minted', 0.0),
-                    'total_mined_usd': integration_data.get('total_mined_usd', 0.0),
-                    'conversion_rate': integration_data.get('conversion_rate', 100.0),
-                    'integration_status': 'active'
-                })
-
-        # Check if minting process is running
-        if os.path.exists('/tmp/mint_mine_pid'):
-            with open('/tmp/mint_mine_pid', 'r') as f:
-                pid = f.read().strip()
-                try:
-                    os.kill(int(pid), 0)
-                    azr_data['minting_active'] = True
-                except (OSError, ValueError):
-                    azr_data['minting_active'] = False
-
-        # Get last minting transaction
-        transactions_file = '/tmp/azr_minting_transactions.json'
-        if os.path.exists(transactions_file):
-            with open(transactions_file, 'r') as f:
-                transactions = json.load(f)
-                if transactions:
-                    azr_data['last_mint_tx'] = transactions[-1]
+        # Live totals and engine status from the mint-mine engine's stats API
+        try:
+            # Hedged: a second read goes out if the engine is slow, and a down engine fails fast
+            response = get_http_client().get(f"{ENGINE_API_URL}/stats", endpoint='engine_api', hedge=True, timeout=2)
+            response.raise_for_status()
+            engine_stats = response.json()
+        except (requests.RequestException, ValueError):
+            engine_stats = None
+
+        if engine_stats:
+            mining = engine_stats.get('mining', {})
+            azr_data.update({
+                'total_azr_minted': mining.get('total_azr_minted', 0.0),
+                'total_mined_usd': mining.get('total_mined_usd', 0.0),
+                'conversion_rate': mining.get('conversion_rate', 100.0),
+                'minting_active': bool(engine_stats.get('system', {}).get('monitoring_active')),
+                'last_mint_tx': engine_stats.get('blockchain', {}).get('last_tx'),
+                'integration_status': 'active'
+            })
 
         # Get mining projections
         projections_file = '/tmp/mining_projections.json'
@@ -765,7 +745,7 @@ def get_azr_minting_stats():
                 azr_data['projected_daily_azr'] = projections.get('daily_usd', 0) * azr_data['conversion_rate']
 
     except Exception as e:
-        print(f"AZR stats error: {e}")
+        logger.error(f"AZR stats error: {e}")
 
     return azr_data
 
@@ -870,15 +850,16 @@ def stop_mining():
         })
 
 if __name__ == '__main__':
+    configure_logging('real_mining_dashboard')
+
     # Start background monitoring
     monitor_thread = threading.Thread(target=background_monitor, daemon=True)
     monitor_thread.start()
 
-    print("🚀 Starting AZORA MINT-MINE ENGINE...")
-    print("📊 Dashboard: http://localhost:5001")
-    print("🔄 Auto-updates every 1 second")
-    print("🎯 Monitoring actual mining performance")
-    print("⚠️  REAL MONEY: Ensure wallets are configured!")
-    print("")
+    logger.info("🚀 Starting AZORA MINT-MINE ENGINE...")
+    logger.info("📊 Dashboard: http://localhost:5001")
+    logger.info("🔄 Auto-updates every 1 second")
+    logger.info("🎯 Monitoring actual mining performance")
+    logger.warning("⚠️  REAL MONEY: Ensure wallets are configured!")
 
     app.run(host='0.0.0.0', port=5001, debug=False)
\ No newline at end of file
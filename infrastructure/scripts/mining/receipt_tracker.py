@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+AZORA RECEIPT TRACKER
+One tracker for every submitted transaction, polled by the engine's scheduler: batched receipt
+checks once per new block, confirmation depth and reorg handling
+"""
+
+import time
+import threading
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any
+
+from json_rpc import JsonRpcBatchClient, JsonRpcError, hex_to_int
+
+
+@dataclass
+class TrackedTransaction:
+    tx_hash: str
+    submitted_at: float
+    block_number: Optional[int] = None
+    block_hash: Optional[str] = None
+    receipt: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class FinalizedTransaction:
+    tx_hash: str
+    status: str  # 'confirmed', 'failed' or 'timeout'
+    gas_used: int = 0
+    effective_gas_price: int = 0
+    block_number: Optional[int] = None
+
+
+class ReceiptTracker:
+    """Watch a set of pending transactions until they reach the required confirmation depth"""
+
+    def __init__(self, rpc: JsonRpcBatchClient, on_finalized: Callable[[List[FinalizedTransaction]], None],
+                 confirmations: int = 1, max_wait_seconds: float = 1800.0,
+                 logger: Optional[logging.Logger] = None):
+        self.rpc = rpc
+        self.on_finalized = on_finalized
+        self.confirmations = max(1, confirmations)
+        self.max_wait_seconds = max_wait_seconds
+        self.logger = logger or logging.getLogger('AzoraReceiptTracker')
+
+        self._pending: Dict[str, TrackedTransaction] = {}
+        self._lock = threading.Lock()
+        self._last_block: Optional[int] = None
+
+        self.stats = {'tracked': 0, 'finalized': 0, 'reorgs': 0, 'timeouts': 0, 'polls': 0}
+
+    def track(self, tx_hash: str):
+        """Add a submitted transaction to the pending set"""
+        with self._lock:
+            if tx_hash not in self._pending:
+                self._pending[tx_hash] = TrackedTransaction(tx_hash, time.monotonic())
+                self.stats['tracked'] += 1
+
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def poll_once(self):
+        """Check receipts if a new block has arrived since the last poll"""
+        if not self._pending:
+            return
+
+        head = hex_to_int(self.rpc.call('eth_blockNumber'))
+        if head == self._last_block:
+            return
+        self.stats['polls'] += 1
+
+        with self._lock:
+            tracked = list(self._pending.values())
+
+        results = self.rpc.batch([('eth_getTransactionReceipt', [tx.tx_hash]) for tx in tracked])
+        # Only a head whose receipts were actually read is skipped next time
+        self._last_block = head
+
+        finalized: List[FinalizedTransaction] = []
+        now = time.monotonic()
+        for tx, receipt in zip(tracked, results):
+            if isinstance(receipt, JsonRpcError):
+                continue
+
+            if receipt is None:
+                if tx.block_hash is not None:
+                    # Previously included, now gone: the block was reorganised out
+                    self.stats['reorgs'] += 1
+                    self.logger.warning(f"Transaction {tx.tx_hash} dropped by reorg at block {tx.block_number} - back to pending")
+                    tx.block_number = tx.block_hash = tx.receipt = None
+                elif now - tx.submitted_at >= self.max_wait_seconds:
+                    self.stats['timeouts'] += 1
+                    finalized.append(FinalizedTransaction(tx.tx_hash, 'timeout'))
+                continue
+
+            block_hash = receipt.get('blockHash')
+            if tx.block_hash is not None and block_hash != tx.block_hash:
+                # Re-included in a different block after a reorg; depth counts from the new block
+                self.stats['reorgs'] += 1
+                self.logger.warning(f"Transaction {tx.tx_hash} moved from block {tx.block_number} after reorg")
+
+            tx.block_number = hex_to_int(receipt.get('blockNumber'))
+            tx.block_hash = block_hash
+            tx.receipt = receipt
+
+            if head - tx.block_number + 1 >= self.confirmations:
+                finalized.append(FinalizedTransaction(
+                    tx.tx_hash,
+                    'confirmed' if hex_to_int(receipt.get('status')) == 1 else 'failed',
+                    gas_used=hex_to_int(receipt.get('gasUsed')),
+                    effective_gas_price=hex_to_int(receipt.get('effectiveGasPrice')),
+                    block_number=tx.block_number
+                ))
+
+        if not finalized:
+            return
+
+        try:
+            self.on_finalized(finalized)
+        except Exception as e:
+            # Keep them pending so the next block retries the update
+            self.logger.error(f"Failed to record {len(finalized)} finalized transactions: {e}")
+            return
+
+        with self._lock:
+            for result in finalized:
+                self._pending.pop(result.tx_hash, None)
+        self.stats['finalized'] += len(finalized)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return dict(self.stats, pending=len(self._pending), confirmations=self.confirmations,
+                    last_block=self._last_block)
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+"""
+AZORA RESILIENT HTTP
+Shared client for external HTTP APIs (mining pools, price feeds, webhooks, the engine API).
+Each endpoint gets a circuit breaker: after repeated failures calls fail fast until an
+exponentially growing, jittered backoff has passed, then a single probe decides whether
+to close it again. Calls to one host are capped, and latency-sensitive reads can be hedged
+with a second request when the first is slow.
+"""
+
+import os
+import random
+import threading
+import time
+import logging
+import concurrent.futures
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+
+from mint_mine_metrics import Counter, LatencyStats
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of calling an endpoint whose circuit is open"""
+
+
+class HostBusyError(requests.RequestException):
+    """Raised when a host's concurrency cap stays full for the whole timeout"""
+
+
+class CircuitBreaker:
+    """Closed -> open after failure_threshold consecutive failures -> half-open probe -> closed"""
+
+    def __init__(self, name: str, failure_threshold: int = 5, base_backoff: float = 5.0,
+                 max_backoff: float = 600.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.reopen_count = 0
+        self.open_until = 0.0
+        self._lock = threading.Lock()
+
+        self.successes = Counter()
+        self.failures = Counter()
+        self.rejected = Counter()
+        self.opened = Counter()
+        self.wasted_seconds = Counter()
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open only one probe is let through"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            if self.state == OPEN and time.monotonic() >= self.open_until:
+                self.state = HALF_OPEN
+                return True
+            self.rejected.inc()
+            return False
+
+    def cancel_probe(self):
+        """The half-open probe never reached the endpoint; let the next call probe instead"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.state = OPEN
+                self.open_until = time.monotonic()
+
+    def record_success(self):
+        self.successes.inc()
+        with self._lock:
+            self.state = CLOSED
+            self.consecutive_failures = 0
+            self.reopen_count = 0
+
+    def record_failure(self, elapsed: float) -> bool:
+        """Count a failed call; returns True if it opened the circuit"""
+        self.failures.inc()
+        self.wasted_seconds.inc(elapsed)
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state != HALF_OPEN and self.consecutive_failures < self.failure_threshold:
+                return False
+
+            # Exponential backoff with full jitter over the upper half, so peers do not probe in step
+            backoff = min(self.max_backoff, self.base_backoff * (2 ** self.reopen_count))
+            self.open_until = time.monotonic() + backoff * random.uniform(0.5, 1.0)
+            self.reopen_count += 1
+            self.state = OPEN
+        self.opened.inc()
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'retry_in_seconds': round(max(0.0, self.open_until - time.monotonic()), 1) if self.state == OPEN else 0.0,
+            'successes': self.successes.value,
+            'failures': self.failures.value,
+            'rejected': self.rejected.value,
+            'opened': self.opened.value,
+            'wasted_seconds': round(self.wasted_seconds.value, 3)
+        }
+
+
+class ResilientHttpClient:
+    """requests wrapper with per-endpoint circuit breakers, per-host caps and hedged reads"""
+
+    def __init__(self, timeout: float = 10.0, failure_threshold: int = 5, base_backoff: float = 5.0,
+                 max_backoff: float = 600.0, max_per_host: int = 4, hedge_after: float = 1.0,
+                 logger: Optional[logging.Logger] = None):
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.max_per_host = max_per_host
+        self.hedge_after = hedge_after
+        self.logger = logger or logging.getLogger('AzoraResilientHttp')
+
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._host_slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._latency: Dict[str, LatencyStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._hedge_executor = concurrent.futures.ThreadPoolExecutor(max_workers=8, thread_name_prefix='http-hedge')
+
+        self.hedges_sent = Counter()
+        self.hedges_won = Counter()
+
+    def _session(self) -> requests.Session:
+        # One keep-alive session per calling thread
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            self._local.session = session
+        return session
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(endpoint, self.failure_threshold, self.base_backoff, self.max_backoff)
+                self._breakers[endpoint] = breaker
+                self._latency[endpoint] = LatencyStats()
+            return breaker
+
+    def latency(self, endpoint: str) -> LatencyStats:
+        self.breaker(endpoint)
+        return self._latency[endpoint]
+
+    def _slots(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            slots = self._host_slots.get(host)
+            if slots is None:
+                slots = threading.BoundedSemaphore(self.max_per_host)
+                self._host_slots[host] = slots
+            return slots
+
+    # ------------------------------------------------------------------
+    # Requests
+    # ------------------------------------------------------------------
+
+    def request(self, method: str, url: str, endpoint: Optional[str] = None, hedge: bool = False,
+                timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """Send a request through the endpoint's breaker (endpoint defaults to the URL's host).
+
+        Connection errors, timeouts, 429 and 5xx responses count as failures; other
+        responses are returned as-is. Raises CircuitOpenError while the circuit is open.
+        """
+        host = urlsplit(url).netloc
+        endpoint = endpoint or host
+        breaker = self.breaker(endpoint)
+        if not breaker.allow():
+            raise CircuitOpenError(f"Circuit for {endpoint} is open")
+
+        timeout = self.timeout if timeout is None else timeout
+        started = time.monotonic()
+        try:
+            if hedge and method.upper() == 'GET' and self.hedge_after < timeout:
+                response = self._hedged(host, url, timeout, kwargs)
+            else:
+                response = self._send(host, method, url, timeout, kwargs)
+        except HostBusyError:
+            # Our own cap, not the remote's fault - do not trip the breaker
+            breaker.cancel_probe()
+            raise
+        except requests.RequestException:
+            self._record_failure(breaker, time.monotonic() - started)
+            raise
+        finally:
+            self._latency[endpoint].observe(time.monotonic() - started)
+
+        if response.status_code == 429 or response.status_code >= 500:
+            self._record_failure(breaker, time.monotonic() - started)
+        else:
+            breaker.record_success()
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def _record_failure(self, breaker: CircuitBreaker, elapsed: float):
+        if breaker.record_failure(elapsed):
+            stats = breaker.get_stats()
+            self.logger.warning(f"⚡ Circuit for {breaker.name} opened after {stats['consecutive_failures']} "
+                                f"failures - retrying in {stats['retry_in_seconds']:.0f}s")
+
+    def _send(self, host: str, method: str, url: str, timeout: float, kwargs: Dict[str, Any]) -> requests.Response:
+        slots = self._slots(host)
+        if not slots.acquire(timeout=timeout):
+            raise HostBusyError(f"{self.max_per_host} requests to {host} already in flight")
+        try:
+            return self._session().request(method, url, timeout=timeout, **kwargs)
+        finally:
+            slots.release()
+
+    def _hedged(self, host: str, url: str, timeout: float, kwargs: Dict[str, Any]) -> requests.Response:
+        """GET that sends a second copy if the first has not answered after hedge_after seconds"""
+        primary = self._hedge_executor.submit(self._send, host, 'GET', url, timeout, kwargs)
+        try:
+            return primary.result(timeout=self.hedge_after)
+        except concurrent.futures.TimeoutError:
+            pass
+
+        # Only hedge with a free slot; a hedge must never queue behind the host cap
+        slots = self._slots(host)
+        if not slots.acquire(blocking=False):
+            return primary.result()
+        slots.release()
+
+        self.hedges_sent.inc()
+        hedge = self._hedge_executor.submit(self._send, host, 'GET', url, timeout, kwargs)
+        pending = {primary, hedge}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedge:
+                        self.hedges_won.inc()
+                    return future.result()
+                error = future.exception()
+        raise error
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {
+            'endpoints': {name: breaker.get_stats() for name, breaker in sorted(breakers.items())},
+            'open_circuits': sum(1 for breaker in breakers.values() if breaker.state == OPEN),
+            'hedges_sent': self.hedges_sent.value,
+            'hedges_won': self.hedges_won.value
+        }
+
+
+_shared_client: Optional[ResilientHttpClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> ResilientHttpClient:
+    """Get the process-wide client, so breakers and host caps are shared by every caller"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = ResilientHttpClient(max_per_host=int(os.getenv('HTTP_MAX_PER_HOST', '4')))
+        return _shared_client
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+AZORA RUNNING TOTALS
+Engine totals maintained incrementally in the same transaction as session and mint writes,
+so startup and dashboards read them in O(1).
+Verify or rebuild from the source tables: python3 running_totals.py verify|rebuild
+"""
+
+import os
+import sys
+import argparse
+from typing import Dict, Iterable, Tuple
+
+from psycopg2.extras import execute_values
+
+from mining_logging import configure_logging
+
+RUNNING_TOTALS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS engine_running_totals (
+        metric VARCHAR(100) PRIMARY KEY,
+        value DECIMAL(38,8) NOT NULL DEFAULT 0,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+# Every total, with the full-scan query that defines it
+TOTAL_DEFINITIONS = {
+    'completed_sessions': "SELECT COUNT(*) FROM mining_sessions WHERE status = 'completed'",
+    'completed_earnings_usd': "SELECT COALESCE(SUM(total_earnings_usd), 0) FROM mining_sessions WHERE status = 'completed'",
+    'completed_session_azr': "SELECT COALESCE(SUM(azr_minted), 0) FROM mining_sessions WHERE status = 'completed'",
+    'completed_hashrate_mhs_sum': "SELECT COALESCE(SUM(total_hashrate_mhs), 0) FROM mining_sessions WHERE status = 'completed'",
+    'active_sessions': "SELECT COUNT(*) FROM mining_sessions WHERE status = 'active'",
+    'confirmed_mints': "SELECT COUNT(*) FROM minting_transactions WHERE blockchain_status = 'confirmed'",
+    'confirmed_azr_minted': "SELECT COALESCE(SUM(amount_azr), 0) FROM minting_transactions WHERE blockchain_status = 'confirmed'"
+}
+
+
+def session_deltas(status: str, earnings_usd: float, azr_minted: float, hashrate_mhs: float,
+                   sign: int = 1) -> Dict[str, float]:
+    """Total changes for a mining session entering (sign=1) or leaving (sign=-1) a status"""
+    if status == 'completed':
+        return {
+            'completed_sessions': sign,
+            'completed_earnings_usd': sign * float(earnings_usd or 0),
+            'completed_session_azr': sign * float(azr_minted or 0),
+            'completed_hashrate_mhs_sum': sign * float(hashrate_mhs or 0)
+        }
+    if status == 'active':
+        return {'active_sessions': sign}
+    return {}
+
+
+def mint_deltas(status: str, amount_azr: float, sign: int = 1) -> Dict[str, float]:
+    """Total changes for a minting transaction entering (sign=1) or leaving (sign=-1) a status"""
+    if status == 'confirmed':
+        return {'confirmed_mints': sign, 'confirmed_azr_minted': sign * float(amount_azr or 0)}
+    return {}
+
+
+def merge_deltas(deltas: Iterable[Dict[str, float]]) -> Dict[str, float]:
+    merged: Dict[str, float] = {}
+    for delta in deltas:
+        for metric, value in delta.items():
+            merged[metric] = merged.get(metric, 0) + value
+    return merged
+
+
+def apply_deltas(cursor, deltas: Dict[str, float]):
+    """Add deltas to the running totals; call with the cursor that wrote the source rows"""
+    rows = [(metric, value) for metric, value in deltas.items() if value]
+    if not rows:
+        return
+
+    execute_values(cursor, """
+        INSERT INTO engine_running_totals (metric, value)
+        VALUES %s
+        ON CONFLICT (metric) DO UPDATE
+        SET value = engine_running_totals.value + EXCLUDED.value,
+            updated_at = CURRENT_TIMESTAMP
+    """, sorted(rows), template="(%s, %s::numeric)")
+
+
+def read_totals(cursor) -> Dict[str, float]:
+    """Read every running total (missing metrics read as 0)"""
+    cursor.execute("SELECT metric, value FROM engine_running_totals")
+    stored = {row[0]: float(row[1]) for row in cursor.fetchall()}
+    return {metric: stored.get(metric, 0.0) for metric in TOTAL_DEFINITIONS}
+
+
+def is_initialized(cursor) -> bool:
+    cursor.execute("SELECT EXISTS (SELECT 1 FROM engine_running_totals)")
+    return cursor.fetchone()[0]
+
+
+def compute_totals(cursor) -> Dict[str, float]:
+    """Recompute every total with full scans of the source tables"""
+    totals = {}
+    for metric, query in TOTAL_DEFINITIONS.items():
+        cursor.execute(query)
+        totals[metric] = float(cursor.fetchone()[0])
+    return totals
+
+
+def verify(cursor, tolerance: float = 1e-6) -> Dict[str, Tuple[float, float]]:
+    """Compare stored totals with a full recompute; returns {metric: (stored, actual)} for mismatches"""
+    stored = read_totals(cursor)
+    actual = compute_totals(cursor)
+    return {
+        metric: (stored[metric], actual[metric])
+        for metric in TOTAL_DEFINITIONS
+        if abs(stored[metric] - actual[metric]) > tolerance
+    }
+
+
+def rebuild(cursor) -> Dict[str, float]:
+    """Replace the stored totals with a full recompute.
+
+    Writers block on the table lock, so anything they have not committed yet is
+    absent from the recompute and lands as a delta afterwards.
+    """
+    cursor.execute("LOCK TABLE engine_running_totals IN EXCLUSIVE MODE")
+    totals = compute_totals(cursor)
+    execute_values(cursor, """
+        INSERT INTO engine_running_totals (metric, value)
+        VALUES %s
+        ON CONFLICT (metric) DO UPDATE
+        SET value = EXCLUDED.value, updated_at = CURRENT_TIMESTAMP
+    """, sorted(totals.items()), template="(%s, %s::numeric)")
+    return totals
+
+
+def main():
+    """Verify or rebuild the running totals from the source tables"""
+    from mint_mine_storage import EngineStorage
+
+    parser = argparse.ArgumentParser(description='AZORA running totals maintenance')
+    parser.add_argument('command', choices=['verify', 'rebuild'])
+    parser.add_argument('--fix', action='store_true', help='rebuild when verify finds a mismatch')
+    args = parser.parse_args()
+
+    configure_logging('running_totals')
+    storage = EngineStorage({
+        'host': os.getenv('DB_HOST', 'localhost'),
+        'port': int(os.getenv('DB_PORT', '5432')),
+        'name': os.getenv('DB_NAME', 'azora_os'),
+        'user': os.getenv('DB_USER', 'azora'),
+        'password': os.getenv('DB_PASSWORD', '')
+    }, statement_timeout_ms=0)
+    storage.connect()
+
+    try:
+        with storage.cursor() as cursor:
+            cursor.execute(RUNNING_TOTALS_TABLE_SQL)
+
+            if args.command == 'rebuild':
+                for metric, value in rebuild(cursor).items():
+                    print(f"   {metric}: {value:,.8f}")
+                print("✅ Running totals rebuilt")
+                return
+
+            mismatches = verify(cursor)
+            if not mismatches:
+                print("✅ Running totals match the source tables")
+                return
+
+            for metric, (stored, actual) in mismatches.items():
+                print(f"   ❌ {metric}: stored {stored:,.8f} != actual {actual:,.8f}")
+
+            if args.fix:
+                rebuild(cursor)
+                print("✅ Running totals rebuilt")
+            else:
+                sys.exit(1)
+
+    finally:
+        storage.close()
+
+if __name__ == '__main__':
+    main()
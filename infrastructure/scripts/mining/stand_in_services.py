@@ -0,0 +1,931 @@
+#!/usr/bin/env python3
+"""
+AZORA STAND-IN SERVICES
+Local stand-ins for the external services the mining engine and dashboards depend on, so
+the whole stack can run, be load-tested and benchmarked offline on one machine:
+
+    miner   lolMiner /summary API, one per rig (rig N answers on 127.0.0.N)
+    pool    WoolyPooly wallet API with paged reward and hashrate history
+    prices  CoinGecko /simple/price
+    chain   EVM JSON-RPC dev chain with the AZR mintReward contract (needs eth-account)
+
+Every service takes a fault profile: a latency distribution, error and hang rates, and
+padding added to each response. Per-service request counts are served at /_stand_in/stats.
+
+    python3 stand_in_services.py all --rigs 4 --latency lognormal:40:0.5 --error-rate 0.02
+    python3 stand_in_services.py pool --port 8766 --profile faults.json
+
+faults.json overrides the command-line profile per service, for example:
+    {"pool": {"latency": "pareto:80:1.5", "error_rate": 0.05}, "chain": {"revert_rate": 0.1}}
+`all` prints the environment that points the engine and dashboards at the stand-ins.
+"""
+
+import json
+import math
+import time
+import random
+import argparse
+import threading
+import logging
+from dataclasses import dataclass, field, fields
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse, parse_qs
+
+from earnings_sources import POOL_HISTORY_PATHS
+from chain_state_sampler import TOTAL_SUPPLY_SELECTOR, MAX_SUPPLY_SELECTOR, MINTED_PER_USER_SELECTOR
+from mint_mine_metrics import Counter, LatencyStats
+from mining_logging import configure_logging
+
+try:
+    from eth_account import Account
+    from eth_utils import keccak
+    ETH_AVAILABLE = True
+except ImportError:
+    ETH_AVAILABLE = False
+
+STATS_PATH = '/_stand_in/stats'
+
+LATENCY_DISTRIBUTIONS = ('fixed', 'uniform', 'normal', 'lognormal', 'pareto')
+
+MINT_REWARD_SELECTOR = '0x9a49090e'  # mintReward(address,uint256)
+BALANCE_OF_SELECTOR = '0x70a08231'   # balanceOf(address)
+TRANSFER_TOPIC = '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+
+DEFAULT_CONTRACT_ADDRESS = '0xA2a0000000000000000000000000000000000001'
+GWEI = 10 ** 9
+
+
+@dataclass
+class FaultProfile:
+    """Latency, failures and payload size injected into every response of a stand-in"""
+    # fixed: latency_ms | uniform: latency_ms +- spread ms | normal: mean latency_ms, stddev spread ms
+    # lognormal: median latency_ms, sigma spread | pareto: minimum latency_ms, tail index spread
+    latency: str = 'fixed'
+    latency_ms: float = 0.0
+    spread: float = 0.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    # Requests that get no answer for hang_seconds and then a dropped connection
+    hang_rate: float = 0.0
+    hang_seconds: float = 30.0
+    # Whitespace appended to each JSON response, so clients parse it unchanged
+    pad_bytes: int = 0
+    # Chain only: share of mints mined as reverted
+    revert_rate: float = 0.0
+
+    def __post_init__(self):
+        if self.latency not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(f"Unknown latency distribution '{self.latency}' (one of {', '.join(LATENCY_DISTRIBUTIONS)})")
+
+    @staticmethod
+    def parse_latency(spec: str) -> Dict[str, Any]:
+        """'lognormal:40:0.5' -> distribution, latency_ms and spread"""
+        parts = spec.split(':')
+        return {'latency': parts[0], 'latency_ms': float(parts[1]) if len(parts) > 1 else 0.0,
+                'spread': float(parts[2]) if len(parts) > 2 else 0.0}
+
+    def merged(self, overrides: Dict[str, Any]) -> 'FaultProfile':
+        """Copy with a profile-file entry applied; 'latency' may be a spec string"""
+        values = {f.name: getattr(self, f.name) for f in fields(self)}
+        overrides = dict(overrides)
+        if ':' in str(overrides.get('latency', '')):
+            overrides.update(self.parse_latency(overrides.pop('latency')))
+        unknown = set(overrides) - set(values)
+        if unknown:
+            raise ValueError(f"Unknown fault profile keys: {', '.join(sorted(unknown))}")
+        values.update(overrides)
+        return FaultProfile(**values)
+
+    def delay(self, rng: random.Random) -> float:
+        """One injected latency, in seconds"""
+        if self.latency == 'uniform':
+            ms = rng.uniform(self.latency_ms - self.spread, self.latency_ms + self.spread)
+        elif self.latency == 'normal':
+            ms = rng.gauss(self.latency_ms, self.spread)
+        elif self.latency == 'lognormal':
+            ms = self.latency_ms * math.exp(rng.gauss(0.0, self.spread))
+        elif self.latency == 'pareto':
+            ms = self.latency_ms * rng.paretovariate(self.spread or 1.0)
+        else:
+            ms = self.latency_ms
+        return max(0.0, ms) / 1000.0
+
+    def fault(self, rng: random.Random) -> Optional[str]:
+        """'hang', 'error' or None for one request"""
+        draw = rng.random()
+        if draw < self.hang_rate:
+            return 'hang'
+        if draw < self.hang_rate + self.error_rate:
+            return 'error'
+        return None
+
+
+class StandInHTTPServer(ThreadingHTTPServer):
+    # Load tests open many connections at once; the default backlog of 5 refuses them
+    request_queue_size = 512
+    daemon_threads = True
+
+
+class StandInService:
+    """Base stand-in: fault injection, response padding and request stats around handle()"""
+
+    name = 'stand-in'
+
+    def __init__(self, profile: Optional[FaultProfile] = None, logger: Optional[logging.Logger] = None):
+        self.profile = profile or FaultProfile()
+        self.logger = logger or logging.getLogger('AzoraStandIn')
+        self.rng = random.Random()
+
+        self.requests = Counter()
+        self.errors = Counter()
+        self.hangs = Counter()
+        self.injected_latency = LatencyStats()
+
+    def handle(self, method: str, path: str, query: Dict[str, List[str]], body: Any) -> Tuple[int, Any]:
+        """(status, JSON body) for one request; a None body is a 404"""
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            'service': self.name,
+            'requests': self.requests.value,
+            'injected_errors': self.errors.value,
+            'injected_hangs': self.hangs.value,
+            'injected_latency': self.injected_latency.snapshot()
+        }
+
+    def serve(self, host: str = '127.0.0.1', port: int = 0) -> StandInHTTPServer:
+        service = self
+
+        class StandInHandler(BaseHTTPRequestHandler):
+            # Keep-alive, like the real services the clients pool connections to
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                self._respond('GET')
+
+            def do_POST(self):
+                self._respond('POST')
+
+            def _respond(self, method: str):
+                url = urlparse(self.path)
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+
+                if url.path == STATS_PATH:
+                    self._send(200, service.get_stats(), pad=False)
+                    return
+
+                service.requests.inc()
+                fault = service.profile.fault(service.rng)
+                if fault == 'hang':
+                    service.hangs.inc()
+                    time.sleep(service.profile.hang_seconds)
+                    self.close_connection = True
+                    return
+
+                delay = service.profile.delay(service.rng)
+                service.injected_latency.observe(delay)
+                if delay:
+                    time.sleep(delay)
+
+                if fault == 'error':
+                    service.errors.inc()
+                    self._send(service.profile.error_status, {'error': 'injected fault'})
+                    return
+
+                try:
+                    body = json.loads(raw) if raw else None
+                except ValueError:
+                    self._send(400, {'error': 'invalid JSON'})
+                    return
+
+                status, payload = service.handle(method, url.path, parse_qs(url.query), body)
+                if payload is None:
+                    self._send(404, {'error': f"no such endpoint: {url.path}"})
+                else:
+                    self._send(status, payload)
+
+            def _send(self, status: int, body: Any, pad: bool = True):
+                payload = json.dumps(body).encode()
+                if pad and service.profile.pad_bytes:
+                    payload += b' ' * service.profile.pad_bytes
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = StandInHTTPServer((host, port), StandInHandler)
+        threading.Thread(target=server.serve_forever, name=f'stand-in-{self.name}', daemon=True).start()
+        self.logger.info(f"✅ Stand-in {self.name} listening on http://{host}:{server.server_address[1]}")
+        return server
+
+
+# ----------------------------------------------------------------------
+# lolMiner
+# ----------------------------------------------------------------------
+
+class MinerStandIn(StandInService):
+    """lolMiner /summary for one rig whose hashrate, temperatures and shares drift over time"""
+
+    name = 'miner'
+
+    def __init__(self, rig: int = 0, gpus: int = 4, mhs_per_gpu: float = 10.5, algorithm: str = 'FishHash',
+                 pool: str = 'iron.woolypooly.com:3104', profile: Optional[FaultProfile] = None,
+                 logger: Optional[logging.Logger] = None):
+        super().__init__(profile, logger)
+        self.rig = rig
+        self.gpus = gpus
+        self.mhs_per_gpu = mhs_per_gpu
+        self.algorithm = algorithm
+        self.pool = pool
+        self.started = time.time()
+
+    def summary(self) -> Dict[str, Any]:
+        uptime = time.time() - self.started
+        # Readings change once per 10 seconds, like lolMiner's own averaging window
+        window = int(time.time() // 10)
+        workers = []
+        for gpu in range(self.gpus):
+            rng = random.Random(f"{self.rig}/{gpu}/{window}")
+            workers.append({
+                'Index': gpu,
+                'Name': f"Stand-in GPU {gpu}",
+                'Hashrate': f"{self.mhs_per_gpu * rng.uniform(0.95, 1.05):.2f} MH/s",
+                'Temp (deg C)': round(rng.uniform(58, 72), 1),
+                'Power (W)': round(rng.uniform(110, 140), 1),
+                'Fan Speed (%)': rng.randint(55, 75)
+            })
+
+        accepted = int(uptime * self.gpus * self.mhs_per_gpu / 60)
+        return {
+            'Software': 'lolMiner 1.88 (stand-in)',
+            'Algorithm': self.algorithm,
+            'Current_Pool': self.pool,
+            'Uptime': int(uptime),
+            'Shares_Accepted': accepted,
+            'Shares_Rejected': accepted // 200,
+            'Workers': workers
+        }
+
+    def handle(self, method, path, query, body):
+        if path.rstrip('/') == '/summary':
+            return 200, self.summary()
+        return 404, None
+
+
+# ----------------------------------------------------------------------
+# Mining pool
+# ----------------------------------------------------------------------
+
+class PoolStandIn(StandInService):
+    """Pool wallet API with deterministic synthetic rewards, payouts and hashrate for any wallet.
+
+    Rewards are credited every reward_seconds from `days` before start-up onwards and paid
+    out on payout_hours boundaries, so the unpaid balance grows and resets like a real pool's.
+    """
+
+    name = 'pool'
+
+    def __init__(self, days: float = 90.0, reward_seconds: float = 3600.0, sample_seconds: float = 600.0,
+                 payout_hours: float = 24.0, payments: int = 20, profile: Optional[FaultProfile] = None,
+                 logger: Optional[logging.Logger] = None):
+        super().__init__(profile, logger)
+        self.reward_interval = max(1, int(reward_seconds))
+        self.sample_interval = max(1, int(sample_seconds))
+        self.payout_interval = max(self.reward_interval, int(payout_hours * 3600))
+        # Payments listed per wallet payload
+        self.payments = payments
+        self.start = int(time.time() - days * 86400)
+
+        self._payout_sums: Dict[Tuple[str, str, int], float] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _rng(*key) -> random.Random:
+        return random.Random('/'.join(str(part) for part in key))
+
+    def reward(self, coin: str, wallet: str, at: int) -> Dict[str, Any]:
+        rng = self._rng(coin, wallet, 'reward', at)
+        return {'id': f"{at:x}{rng.getrandbits(64):016x}", 'time': at, 'amount': round(rng.uniform(0.01, 0.05), 8)}
+
+    def sample(self, coin: str, wallet: str, at: int) -> Dict[str, Any]:
+        rng = self._rng(coin, wallet, 'hashrate', at)
+        valid = rng.randint(80, 120)
+        return {'time': at, 'hashrate': rng.uniform(38e6, 46e6), 'validShares': valid,
+                'invalidShares': rng.randint(0, valid // 50)}
+
+    def history(self, kind: str, coin: str, wallet: str, to: int, limit: int) -> List[Dict[str, Any]]:
+        """Newest-first entries at or before `to`"""
+        interval = self.reward_interval if kind == 'rewards' else self.sample_interval
+        at = min(to, int(time.time())) // interval * interval
+        entries = []
+        while at >= self.start and len(entries) < limit:
+            entries.append(self.reward(coin, wallet, at) if kind == 'rewards' else self.sample(coin, wallet, at))
+            at -= interval
+        return entries
+
+    def _rewards_between(self, coin: str, wallet: str, after: int, until: int) -> float:
+        """Sum of rewards credited in (after, until]"""
+        first = max(after + 1, self.start)
+        first = -(-first // self.reward_interval) * self.reward_interval
+        return sum(self.reward(coin, wallet, at)['amount'] for at in range(first, until + 1, self.reward_interval))
+
+    def _payout(self, coin: str, wallet: str, boundary: int) -> float:
+        key = (coin, wallet, boundary)
+        with self._lock:
+            amount = self._payout_sums.get(key)
+        if amount is None:
+            amount = round(self._rewards_between(coin, wallet, boundary - self.payout_interval, boundary), 8)
+            with self._lock:
+                self._payout_sums[key] = amount
+        return amount
+
+    def wallet(self, coin: str, wallet: str) -> Dict[str, Any]:
+        now = int(time.time())
+        last_payout = now // self.payout_interval * self.payout_interval
+        payments = []
+        boundary = last_payout
+        while boundary > self.start and len(payments) < self.payments:
+            payments.append({'txId': f"payout-{coin}-{boundary}", 'amount': self._payout(coin, wallet, boundary),
+                             'timestamp': boundary})
+            boundary -= self.payout_interval
+        return {
+            'balance': {'unpaid': round(self._rewards_between(coin, wallet, last_payout, now), 8)},
+            'payments': payments,
+            'hashrate': self.sample(coin, wallet, now // self.sample_interval * self.sample_interval)['hashrate']
+        }
+
+    def handle(self, method, path, query, body):
+        parts = [part for part in path.split('/') if part]
+        if len(parts) == 3 and parts[1] == 'wallet':
+            return 200, self.wallet(parts[0], parts[2])
+        if len(parts) == 4 and parts[1] == 'wallet' and parts[3] in POOL_HISTORY_PATHS['woolypooly']:
+            to = int(query.get('to', [int(time.time())])[0])
+            limit = min(int(query.get('limit', ['1000'])[0]), 5000)
+            return 200, {parts[3]: self.history(parts[3], parts[0], parts[2], to, limit)}
+        return 404, None
+
+
+# ----------------------------------------------------------------------
+# CoinGecko
+# ----------------------------------------------------------------------
+
+class PriceStandIn(StandInService):
+    """CoinGecko /simple/price with slowly oscillating prices for any coin id"""
+
+    name = 'prices'
+
+    BASE_PRICES = {'iron-fish': 0.45, 'ergo': 1.20, 'conflux-token': 0.15, 'ethereum': 2500.0, 'monero': 160.0}
+
+    def __init__(self, volatility: float = 0.05, profile: Optional[FaultProfile] = None,
+                 logger: Optional[logging.Logger] = None):
+        super().__init__(profile, logger)
+        self.volatility = volatility
+
+    def price(self, coin_id: str, at: float) -> float:
+        rng = random.Random(coin_id)
+        base = self.BASE_PRICES.get(coin_id) or 10 ** rng.uniform(-2, 2)
+        phase = rng.uniform(0, 2 * math.pi)
+        minute_noise = random.Random(f"{coin_id}/{int(at // 60)}").gauss(0.0, self.volatility / 10)
+        return base * math.exp(self.volatility * math.sin(at / 3600.0 + phase) + minute_noise)
+
+    def simple_price(self, query: Dict[str, List[str]]) -> Dict[str, Dict[str, float]]:
+        coin_ids = [c for c in ','.join(query.get('ids', [])).split(',') if c]
+        flag = lambda name: query.get(name, ['false'])[0].lower() == 'true'
+        now = time.time()
+        prices = {}
+        for coin_id in coin_ids:
+            price = self.price(coin_id, now)
+            entry = {'usd': round(price, 8)}
+            if flag('include_market_cap'):
+                entry['usd_market_cap'] = round(price * 1e9, 2)
+            if flag('include_24hr_vol'):
+                entry['usd_24h_vol'] = round(price * 2.5e7, 2)
+            if flag('include_24hr_change'):
+                entry['usd_24h_change'] = round((price / self.price(coin_id, now - 86400) - 1) * 100, 4)
+            prices[coin_id] = entry
+        return prices
+
+    def handle(self, method, path, query, body):
+        path = path.rstrip('/')
+        if path.endswith('/simple/price'):
+            return 200, self.simple_price(query)
+        if path.endswith('/ping'):
+            return 200, {'gecko_says': '(V3) To the Moon!'}
+        return 404, None
+
+
+# ----------------------------------------------------------------------
+# EVM dev chain
+# ----------------------------------------------------------------------
+
+def _rlp_item(data: bytes, pos: int) -> Tuple[Any, int]:
+    if pos >= len(data):
+        raise ValueError('truncated RLP')
+    prefix = data[pos]
+    if prefix < 0x80:
+        return data[pos:pos + 1], pos + 1
+    if prefix < 0xb8:
+        start, length = pos + 1, prefix - 0x80
+    elif prefix < 0xc0:
+        size = prefix - 0xb7
+        start, length = pos + 1 + size, int.from_bytes(data[pos + 1:pos + 1 + size], 'big')
+    else:
+        if prefix < 0xf8:
+            start, length = pos + 1, prefix - 0xc0
+        else:
+            size = prefix - 0xf7
+            start, length = pos + 1 + size, int.from_bytes(data[pos + 1:pos + 1 + size], 'big')
+        end = start + length
+        if end > len(data):
+            raise ValueError('truncated RLP')
+        items = []
+        while start < end:
+            item, start = _rlp_item(data, start)
+            items.append(item)
+        return items, end
+
+    if start + length > len(data):
+        raise ValueError('truncated RLP')
+    return data[start:start + length], start + length
+
+
+def rlp_decode(data: bytes) -> Any:
+    item, end = _rlp_item(data, 0)
+    if end != len(data):
+        raise ValueError('trailing bytes after RLP item')
+    return item
+
+
+def decode_transaction(raw: bytes) -> Dict[str, Any]:
+    """Fields of a signed legacy, EIP-2930 or EIP-1559 transaction"""
+    as_int = lambda value: int.from_bytes(value, 'big')
+    if raw and raw[0] >= 0xc0:
+        nonce, gas_price, gas, to, value, data, v = rlp_decode(raw)[:7]
+        v = as_int(v)
+        return {'type': 0, 'chain_id': (v - 35) // 2 if v >= 35 else None, 'nonce': as_int(nonce),
+                'max_fee': as_int(gas_price), 'max_priority_fee': None, 'gas': as_int(gas), 'to': to,
+                'value': as_int(value), 'data': data}
+    if raw and raw[0] == 2:
+        chain_id, nonce, tip, max_fee, gas, to, value, data = rlp_decode(raw[1:])[:8]
+        return {'type': 2, 'chain_id': as_int(chain_id), 'nonce': as_int(nonce), 'max_fee': as_int(max_fee),
+                'max_priority_fee': as_int(tip), 'gas': as_int(gas), 'to': to, 'value': as_int(value), 'data': data}
+    if raw and raw[0] == 1:
+        chain_id, nonce, gas_price, gas, to, value, data = rlp_decode(raw[1:])[:7]
+        return {'type': 1, 'chain_id': as_int(chain_id), 'nonce': as_int(nonce), 'max_fee': as_int(gas_price),
+                'max_priority_fee': None, 'gas': as_int(gas), 'to': to, 'value': as_int(value), 'data': data}
+    raise ValueError('unsupported transaction type')
+
+
+class RpcError(Exception):
+    def __init__(self, message: str, code: int = -32000):
+        super().__init__(message)
+        self.code = code
+
+
+@dataclass
+class DevTransaction:
+    hash: str
+    sender: str
+    fields: Dict[str, Any]
+    received_at: float = field(default_factory=time.monotonic)
+
+
+class ChainStandIn(StandInService):
+    """Single-node EVM dev chain: mines every block_time seconds with an EIP-1559 base fee.
+
+    Only the AZR token is executed: mintReward(to, amount) mints (and can be made to
+    revert), and totalSupply / MAX_SUPPLY / mintedPerUser / balanceOf answer eth_call.
+    Transactions are included in nonce order per sender once their fee cap covers the
+    base fee, so nonce gaps and underpriced transactions wait in the pool as on a real node.
+    """
+
+    name = 'chain'
+
+    def __init__(self, chain_id: int = 1337, block_time: float = 2.0, contract_address: str = DEFAULT_CONTRACT_ADDRESS,
+                 max_supply_azr: float = 1e9, block_gas_limit: int = 30_000_000, min_base_fee_wei: int = GWEI,
+                 profile: Optional[FaultProfile] = None, logger: Optional[logging.Logger] = None):
+        if not ETH_AVAILABLE:
+            raise RuntimeError("The dev chain stand-in needs eth-account (pip install web3)")
+        super().__init__(profile, logger)
+        self.chain_id = chain_id
+        self.block_time = block_time
+        self.contract_address = contract_address.lower()
+        self.max_supply_wei = int(max_supply_azr * 10 ** 18)
+        self.block_gas_limit = block_gas_limit
+        self.min_base_fee_wei = min_base_fee_wei
+
+        self.base_fee_wei = min_base_fee_wei
+        self.blocks: List[Dict[str, Any]] = []
+        self.transactions: Dict[str, Dict[str, Any]] = {}
+        self.receipts: Dict[str, Dict[str, Any]] = {}
+        self.nonces: Dict[str, int] = {}
+        self.pending: Dict[str, Dict[int, DevTransaction]] = {}
+        self.total_supply_wei = 0
+        self.balances: Dict[str, int] = {}
+        self.minted: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self.mints = Counter()
+        self.reverts = Counter()
+        self.rejected = Counter()
+
+        self._seal_block()
+
+    # Blocks -----------------------------------------------------------
+
+    def start(self):
+        threading.Thread(target=self._run, name='stand-in-chain-miner', daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.block_time):
+            try:
+                self._seal_block()
+            except Exception as e:
+                self.logger.error(f"Stand-in chain failed to seal a block: {e}")
+
+    def _seal_block(self):
+        with self._lock:
+            number = len(self.blocks)
+            parent = self.blocks[-1]['hash'] if self.blocks else '0x' + '00' * 32
+            timestamp = int(time.time())
+            block_hash = '0x' + keccak(f"{self.chain_id}/{number}/{parent}/{timestamp}".encode()).hex()
+
+            included: List[Dict[str, Any]] = []
+            tips: List[int] = []
+            gas_used = 0
+            senders = sorted(self.pending, key=lambda s: min(tx.received_at for tx in self.pending[s].values()))
+            for sender in senders:
+                queue = self.pending[sender]
+                while True:
+                    tx = queue.get(self.nonces.get(sender, 0))
+                    if tx is None or tx.fields['max_fee'] < self.base_fee_wei:
+                        break
+                    if gas_used + tx.fields['gas'] > self.block_gas_limit:
+                        break
+                    del queue[tx.fields['nonce']]
+                    self.nonces[sender] = tx.fields['nonce'] + 1
+
+                    tip = tx.fields['max_fee'] - self.base_fee_wei
+                    if tx.fields['max_priority_fee'] is not None:
+                        tip = min(tip, tx.fields['max_priority_fee'])
+                    receipt = self._execute(tx, block_hash, number, len(included), gas_used, self.base_fee_wei + tip)
+                    gas_used += int(receipt['gasUsed'], 16)
+                    tips.append(tip)
+                    entry = self.transactions[tx.hash]
+                    entry.update(blockHash=block_hash, blockNumber=hex(number), transactionIndex=hex(len(included)))
+                    included.append(entry)
+                if not queue:
+                    del self.pending[sender]
+
+            self.blocks.append({
+                'number': hex(number), 'hash': block_hash, 'parentHash': parent, 'timestamp': hex(timestamp),
+                'baseFeePerGas': hex(self.base_fee_wei), 'gasLimit': hex(self.block_gas_limit),
+                'gasUsed': hex(gas_used), 'miner': '0x' + '00' * 20, 'extraData': '0x' + '00' * 32,
+                'difficulty': '0x0', 'totalDifficulty': '0x0', 'nonce': '0x' + '00' * 8, 'size': hex(1000),
+                'mixHash': '0x' + '00' * 32, 'sha3Uncles': '0x' + '00' * 32, 'logsBloom': '0x' + '00' * 256,
+                'stateRoot': '0x' + '00' * 32, 'transactionsRoot': '0x' + '00' * 32,
+                'receiptsRoot': '0x' + '00' * 32, 'uncles': [], 'transactions': included,
+                '_tips': sorted(tips)
+            })
+
+            # EIP-1559: move the base fee up to 12.5% towards the gas target
+            target = self.block_gas_limit // 2
+            self.base_fee_wei = max(self.min_base_fee_wei,
+                                    self.base_fee_wei + self.base_fee_wei * (gas_used - target) // target // 8)
+
+    def _execute(self, tx: DevTransaction, block_hash: str, number: int, index: int, cumulative_gas: int,
+                 gas_price: int) -> Dict[str, Any]:
+        to = '0x' + tx.fields['to'].hex() if tx.fields['to'] else None
+        data = tx.fields['data'].hex()
+        logs = []
+        status = 1
+        gas_used = 21000
+
+        if to == self.contract_address and data.startswith(MINT_REWARD_SELECTOR[2:]) and len(data) >= 136:
+            self.mints.inc()
+            recipient = '0x' + data[32:72]
+            amount = int(data[72:136], 16)
+            gas_used = 51000
+            if (self.rng.random() < self.profile.revert_rate or gas_used > tx.fields['gas']
+                    or self.total_supply_wei + amount > self.max_supply_wei):
+                self.reverts.inc()
+                status, gas_used = 0, min(tx.fields['gas'], 23000)
+            else:
+                self.total_supply_wei += amount
+                self.balances[recipient] = self.balances.get(recipient, 0) + amount
+                self.minted[recipient] = self.minted.get(recipient, 0) + amount
+                logs.append({
+                    'address': to, 'topics': [TRANSFER_TOPIC, '0x' + '00' * 32, '0x' + recipient[2:].rjust(64, '0')],
+                    'data': '0x' + hex(amount)[2:].rjust(64, '0'), 'blockHash': block_hash,
+                    'blockNumber': hex(number), 'transactionHash': tx.hash, 'transactionIndex': hex(index),
+                    'logIndex': hex(0), 'removed': False
+                })
+
+        receipt = {
+            'transactionHash': tx.hash, 'transactionIndex': hex(index), 'blockHash': block_hash,
+            'blockNumber': hex(number), 'from': tx.sender, 'to': to, 'cumulativeGasUsed': hex(cumulative_gas + gas_used),
+            'gasUsed': hex(gas_used), 'effectiveGasPrice': hex(gas_price), 'contractAddress': None, 'logs': logs,
+            'logsBloom': '0x' + '00' * 256, 'status': hex(status), 'type': hex(tx.fields['type'])
+        }
+        self.receipts[tx.hash] = receipt
+        return receipt
+
+    def _block(self, tag: Any) -> Optional[Dict[str, Any]]:
+        if tag in ('latest', 'pending', 'safe', 'finalized', None):
+            return self.blocks[-1]
+        if tag == 'earliest':
+            return self.blocks[0]
+        number = int(tag, 16) if isinstance(tag, str) else int(tag)
+        return self.blocks[number] if 0 <= number < len(self.blocks) else None
+
+    @staticmethod
+    def _public_block(block: Dict[str, Any], full: bool) -> Dict[str, Any]:
+        public = {key: value for key, value in block.items() if not key.startswith('_')}
+        public['transactions'] = [dict(tx) if full else tx['hash'] for tx in block['transactions']]
+        return public
+
+    # Transactions -----------------------------------------------------
+
+    def send_raw_transaction(self, raw_hex: str) -> str:
+        raw = bytes.fromhex(raw_hex[2:] if raw_hex.startswith('0x') else raw_hex)
+        try:
+            fields_ = decode_transaction(raw)
+            sender = Account.recover_transaction(raw).lower()
+        except Exception as e:
+            self.rejected.inc()
+            raise RpcError(f"invalid transaction: {e}", -32602)
+
+        tx_hash = '0x' + keccak(raw).hex()
+        with self._lock:
+            if fields_['chain_id'] is not None and fields_['chain_id'] != self.chain_id:
+                self.rejected.inc()
+                raise RpcError(f"invalid chain id {fields_['chain_id']} (expected {self.chain_id})")
+            if tx_hash in self.transactions:
+                raise RpcError('already known')
+            if fields_['nonce'] < self.nonces.get(sender, 0):
+                self.rejected.inc()
+                raise RpcError('nonce too low')
+            if fields_['gas'] < 21000:
+                self.rejected.inc()
+                raise RpcError('intrinsic gas too low')
+
+            queued = self.pending.setdefault(sender, {})
+            replaced = queued.get(fields_['nonce'])
+            if replaced is not None:
+                # Replacement needs a 10% higher fee cap, as in geth
+                if fields_['max_fee'] < replaced.fields['max_fee'] * 11 // 10:
+                    self.rejected.inc()
+                    raise RpcError('replacement transaction underpriced')
+                self.transactions.pop(replaced.hash, None)
+
+            queued[fields_['nonce']] = DevTransaction(tx_hash, sender, fields_)
+            self.transactions[tx_hash] = {
+                'hash': tx_hash, 'from': sender, 'to': '0x' + fields_['to'].hex() if fields_['to'] else None,
+                'nonce': hex(fields_['nonce']), 'gas': hex(fields_['gas']), 'value': hex(fields_['value']),
+                'input': '0x' + fields_['data'].hex(), 'type': hex(fields_['type']), 'chainId': hex(self.chain_id),
+                'gasPrice': hex(fields_['max_fee']), 'maxFeePerGas': hex(fields_['max_fee']),
+                'maxPriorityFeePerGas': hex(fields_['max_priority_fee'] or 0),
+                'blockHash': None, 'blockNumber': None, 'transactionIndex': None
+            }
+        return tx_hash
+
+    def transaction_count(self, address: str, tag: str) -> int:
+        address = address.lower()
+        with self._lock:
+            nonce = self.nonces.get(address, 0)
+            if tag == 'pending':
+                queued = self.pending.get(address, {})
+                while nonce in queued:
+                    nonce += 1
+            return nonce
+
+    def call(self, request: Dict[str, Any]) -> str:
+        if (request.get('to') or '').lower() != self.contract_address:
+            return '0x'
+        data = (request.get('data') or request.get('input') or '0x').lower()
+        word = lambda value: '0x' + hex(value)[2:].rjust(64, '0')
+        argument = '0x' + data[34:74] if len(data) >= 74 else None
+        with self._lock:
+            if data.startswith(TOTAL_SUPPLY_SELECTOR):
+                return word(self.total_supply_wei)
+            if data.startswith(MAX_SUPPLY_SELECTOR):
+                return word(self.max_supply_wei)
+            if data.startswith(MINTED_PER_USER_SELECTOR) and argument:
+                return word(self.minted.get(argument, 0))
+            if data.startswith(BALANCE_OF_SELECTOR) and argument:
+                return word(self.balances.get(argument, 0))
+        raise RpcError('execution reverted', 3)
+
+    def fee_history(self, block_count: Any, newest: Any, percentiles: List[float]) -> Dict[str, Any]:
+        count = int(block_count, 16) if isinstance(block_count, str) else int(block_count)
+        with self._lock:
+            newest_number = int(self._block(newest)['number'], 16)
+            oldest_number = max(0, newest_number - count + 1)
+            blocks = self.blocks[oldest_number:newest_number + 1]
+            next_base_fee = self.base_fee_wei if newest_number == len(self.blocks) - 1 else \
+                int(self.blocks[newest_number + 1]['baseFeePerGas'], 16)
+
+        def tip_at(tips: List[int], percentile: float) -> int:
+            if not tips:
+                return 0
+            return tips[min(len(tips) - 1, int(len(tips) * percentile / 100))]
+
+        return {
+            'oldestBlock': hex(oldest_number),
+            'baseFeePerGas': [block['baseFeePerGas'] for block in blocks] + [hex(next_base_fee)],
+            'gasUsedRatio': [int(block['gasUsed'], 16) / self.block_gas_limit for block in blocks],
+            'reward': [[hex(tip_at(block['_tips'], p)) for p in percentiles or []] for block in blocks]
+        }
+
+    # JSON-RPC ---------------------------------------------------------
+
+    def rpc(self, method: str, params: List[Any]) -> Any:
+        if method in ('eth_chainId',):
+            return hex(self.chain_id)
+        if method == 'net_version':
+            return str(self.chain_id)
+        if method == 'web3_clientVersion':
+            return 'AzoraStandInChain/v1'
+        if method in ('eth_syncing', 'eth_mining'):
+            return False
+        if method == 'eth_accounts':
+            return []
+        if method == 'eth_blockNumber':
+            with self._lock:
+                return hex(len(self.blocks) - 1)
+        if method in ('eth_getBlockByNumber', 'eth_getBlockByHash'):
+            with self._lock:
+                if method == 'eth_getBlockByHash':
+                    block = next((b for b in reversed(self.blocks) if b['hash'] == params[0]), None)
+                else:
+                    block = self._block(params[0])
+                return self._public_block(block, bool(params[1]) if len(params) > 1 else False) if block else None
+        if method == 'eth_gasPrice':
+            return hex(self.base_fee_wei + GWEI)
+        if method == 'eth_maxPriorityFeePerGas':
+            return hex(GWEI)
+        if method == 'eth_feeHistory':
+            return self.fee_history(params[0], params[1], params[2] if len(params) > 2 else [])
+        if method == 'eth_getBalance':
+            return hex(1000 * 10 ** 18)
+        if method == 'eth_getCode':
+            return '0x60806040' if (params[0] or '').lower() == self.contract_address else '0x'
+        if method == 'eth_getTransactionCount':
+            return hex(self.transaction_count(params[0], params[1] if len(params) > 1 else 'latest'))
+        if method == 'eth_estimateGas':
+            data = (params[0].get('data') or params[0].get('input') or '')
+            return hex(60000 if data.startswith(MINT_REWARD_SELECTOR) else 21000)
+        if method == 'eth_call':
+            return self.call(params[0])
+        if method == 'eth_sendRawTransaction':
+            return self.send_raw_transaction(params[0])
+        if method == 'eth_getTransactionByHash':
+            with self._lock:
+                tx = self.transactions.get(params[0])
+                return dict(tx) if tx else None
+        if method == 'eth_getTransactionReceipt':
+            with self._lock:
+                return self.receipts.get(params[0])
+        raise RpcError(f"the method {method} does not exist/is not available", -32601)
+
+    def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        response = {'jsonrpc': '2.0', 'id': request.get('id')}
+        try:
+            response['result'] = self.rpc(request.get('method'), request.get('params') or [])
+        except RpcError as e:
+            response['error'] = {'code': e.code, 'message': str(e)}
+        except Exception as e:
+            response['error'] = {'code': -32602, 'message': f"invalid params: {e}"}
+        return response
+
+    def handle(self, method, path, query, body):
+        if method != 'POST' or body is None:
+            return 404, None
+        if isinstance(body, list):
+            return 200, [self._dispatch(request) for request in body]
+        return 200, self._dispatch(body)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            chain = {
+                'block_number': len(self.blocks) - 1,
+                'base_fee_gwei': self.base_fee_wei / GWEI,
+                'pending_transactions': sum(len(queue) for queue in self.pending.values()),
+                'total_supply_azr': self.total_supply_wei / 10 ** 18
+            }
+        return dict(super().get_stats(), mints=self.mints.value, reverts=self.reverts.value,
+                    rejected=self.rejected.value, **chain)
+
+
+# ----------------------------------------------------------------------
+# Command line
+# ----------------------------------------------------------------------
+
+def start_services(args, profiles: Dict[str, FaultProfile], logger: logging.Logger) -> Tuple[List[Any], Dict[str, str]]:
+    """Start the requested stand-ins; returns their servers and the environment pointing at them"""
+    servers: List[Any] = []
+    env: Dict[str, str] = {}
+    wanted = ('miner', 'pool', 'prices', 'chain') if args.command == 'all' else (args.command,)
+
+    if 'miner' in wanted:
+        hosts = []
+        for rig in range(args.rigs):
+            host = f"127.0.0.{rig + 1}"
+            service = MinerStandIn(rig, args.gpus, args.mhs_per_gpu, profile=profiles['miner'], logger=logger)
+            servers.append(service.serve(host, args.miner_port))
+            hosts.append(host)
+        env.update(MINER_RIGS=','.join(hosts), MINER_API_PORTS=str(args.miner_port))
+
+    if 'pool' in wanted:
+        service = PoolStandIn(args.days, args.reward_seconds, args.sample_seconds, args.payout_hours,
+                              args.payments, profile=profiles['pool'], logger=logger)
+        servers.append(service.serve(args.host, args.pool_port))
+        env['WOOLYPOOLY_API'] = f"http://{args.host}:{args.pool_port}"
+
+    if 'prices' in wanted:
+        service = PriceStandIn(profile=profiles['prices'], logger=logger)
+        servers.append(service.serve(args.host, args.prices_port))
+        env['COINGECKO_API'] = f"http://{args.host}:{args.prices_port}/api/v3"
+
+    if 'chain' in wanted:
+        chain = ChainStandIn(args.chain_id, args.block_time, profile=profiles['chain'], logger=logger)
+        chain.start()
+        servers.append(chain.serve(args.host, args.chain_port))
+        env.update(AZORA_RPC_URL=f"http://{args.host}:{args.chain_port}", AZORA_CHAIN_ID=str(args.chain_id),
+                   AZR_CONTRACT_ADDRESS=DEFAULT_CONTRACT_ADDRESS)
+
+    return servers, env
+
+
+def main():
+    """Run one stand-in service, or all of them"""
+    parser = argparse.ArgumentParser(description='AZORA stand-in services for offline runs and load tests')
+    parser.add_argument('command', choices=['all', 'miner', 'pool', 'prices', 'chain'])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--latency', default='fixed:0', help='distribution:ms[:spread], e.g. lognormal:40:0.5')
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=503)
+    parser.add_argument('--hang-rate', type=float, default=0.0)
+    parser.add_argument('--hang-seconds', type=float, default=30.0)
+    parser.add_argument('--pad-bytes', type=int, default=0)
+    parser.add_argument('--profile', help='JSON file of per-service fault profile overrides')
+
+    parser.add_argument('--rigs', type=int, default=1)
+    parser.add_argument('--gpus', type=int, default=4)
+    parser.add_argument('--mhs-per-gpu', type=float, default=10.5)
+    parser.add_argument('--miner-port', type=int, default=4444)
+
+    parser.add_argument('--pool-port', type=int, default=8766)
+    parser.add_argument('--days', type=float, default=90.0)
+    parser.add_argument('--reward-seconds', type=float, default=3600.0)
+    parser.add_argument('--sample-seconds', type=float, default=600.0)
+    parser.add_argument('--payout-hours', type=float, default=24.0)
+    parser.add_argument('--payments', type=int, default=20, help='payouts listed per wallet payload')
+
+    parser.add_argument('--prices-port', type=int, default=8767)
+
+    parser.add_argument('--chain-port', type=int, default=8545)
+    parser.add_argument('--chain-id', type=int, default=1337)
+    parser.add_argument('--block-time', type=float, default=2.0)
+    parser.add_argument('--port', type=int, help='port of a single service')
+    args = parser.parse_args()
+
+    if args.port is not None and args.command != 'all':
+        setattr(args, f"{args.command}_port", args.port)
+
+    logger = configure_logging('stand_in_services')
+    base = FaultProfile(error_rate=args.error_rate, error_status=args.error_status, hang_rate=args.hang_rate,
+                        hang_seconds=args.hang_seconds, pad_bytes=args.pad_bytes,
+                        **FaultProfile.parse_latency(args.latency))
+    overrides = {}
+    if args.profile:
+        with open(args.profile) as f:
+            overrides = json.load(f)
+    profiles = {name: base.merged(overrides.get(name, {})) for name in ('miner', 'pool', 'prices', 'chain')}
+
+    servers, env = start_services(args, profiles, logger)
+    print("Point the engine and dashboards at the stand-ins with:")
+    for name, value in env.items():
+        print(f"   export {name}={value}")
+
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        print("\n⏹️ Stopping stand-in services...")
+        for server in servers:
+            server.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -28,7 +28,7 @@ echo $AUTONOMOUS_PID > /tmp/azr_autonomous.pid
 echo "✅ Autonomous mining engine started (PID: $AUTONOMOUS_PID)"
 echo "📊 Dashboard: http://localhost:3000"
 echo "🔧 API: http://localhost:8000"
-echo "📝 Logs: tail -f /tmp/azr_mining_engine.log"
+echo "📝 Logs: tail -f ${AZORA_LOG_DIR:-$(pwd)/logs}/azr_mining_engine.log"
 echo ""
 echo "The system will run autonomously for 365 days."
 echo "Progress will be logged daily."
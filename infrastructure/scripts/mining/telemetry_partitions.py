@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+AZORA TELEMETRY PARTITIONS
+Daily/weekly range partitions for append-only telemetry tables: created ahead of time,
+retired by dropping whole partitions instead of DELETE
+"""
+
+import re
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Any
+
+PARTITION_INTERVALS = {
+    'day': timedelta(days=1),
+    'week': timedelta(weeks=1)
+}
+
+_BOUND_PATTERN = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def period_start(timestamp: datetime, interval: str) -> datetime:
+    """Start of the partition period containing timestamp (weeks start on Monday)"""
+    start = timestamp.replace(hour=0, minute=0, second=0, microsecond=0)
+    if interval == 'week':
+        start -= timedelta(days=start.weekday())
+    return start
+
+
+def partition_name(table: str, start: datetime) -> str:
+    return f"{table}_p{start:%Y%m%d}"
+
+
+def is_partitioned(cursor, table: str) -> bool:
+    cursor.execute("SELECT relkind = 'p' FROM pg_class WHERE oid = to_regclass(%s)", (table,))
+    row = cursor.fetchone()
+    return bool(row and row[0])
+
+
+def create_partition(cursor, table: str, start: datetime, end: datetime, name: Optional[str] = None):
+    """Create one range partition (no-op if it already exists)"""
+    name = name or partition_name(table, start)
+    cursor.execute(
+        f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{table}" FOR VALUES FROM (%s) TO (%s)',
+        (start, end)
+    )
+
+
+def ensure_partitions(cursor, table: str, interval: str, premake: int,
+                      now: Optional[datetime] = None, until: Optional[datetime] = None) -> int:
+    """Create partitions from the current period through `premake` periods ahead (or `until`)"""
+    step = PARTITION_INTERVALS[interval]
+    now = now or datetime.now()
+    start = period_start(now, interval)
+    # Never overlap an existing partition (e.g. the archive left by the conversion migration)
+    existing = list_partitions(cursor, table)
+    last = start + step * (premake + 1)
+    if until is not None:
+        last = max(last, period_start(until, interval) + step)
+
+    created = 0
+    while start < last:
+        end = start + step
+        if not any(lower < end and start < upper for _, lower, upper in existing):
+            create_partition(cursor, table, start, end)
+            created += 1
+        start = end
+    return created
+
+
+def _parse_bound(value: str) -> datetime:
+    value = value.strip("'")
+    if value == 'MINVALUE':
+        return datetime.min
+    if value == 'MAXVALUE':
+        return datetime.max
+    return datetime.fromisoformat(value)
+
+
+def list_partitions(cursor, table: str) -> List[Tuple[str, datetime, datetime]]:
+    """List (name, lower, upper) for every range partition of table"""
+    cursor.execute("""
+        SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+        FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE pg_inherits.inhparent = to_regclass(%s)
+    """, (table,))
+
+    partitions = []
+    for name, bound in cursor.fetchall():
+        match = _BOUND_PATTERN.search(bound or '')
+        if match:
+            partitions.append((name, _parse_bound(match.group(1)), _parse_bound(match.group(2))))
+    return sorted(partitions, key=lambda partition: partition[1])
+
+
+def drop_expired_partitions(cursor, table: str, retention_days: float,
+                            now: Optional[datetime] = None) -> List[str]:
+    """Drop every partition whose newest possible row is older than the retention window"""
+    cutoff = (now or datetime.now()) - timedelta(days=retention_days)
+    dropped = []
+    for name, _, upper in list_partitions(cursor, table):
+        if upper <= cutoff:
+            cursor.execute(f'DROP TABLE IF EXISTS "{name}"')
+            dropped.append(name)
+    return dropped
+
+
+def maintain_partitions(cursor, settings: Dict[str, Dict[str, Any]], now: Optional[datetime] = None,
+                        logger: Optional[logging.Logger] = None) -> Dict[str, Dict[str, Any]]:
+    """Create upcoming partitions and drop expired ones for every configured table.
+
+    settings: {table: {'interval': 'day'|'week', 'premake': periods, 'retention_days': days}}
+    """
+    logger = logger or logging.getLogger('AzoraTelemetryPartitions')
+    report = {}
+    for table, table_settings in settings.items():
+        if not is_partitioned(cursor, table):
+            continue
+        created = ensure_partitions(cursor, table, table_settings['interval'], table_settings['premake'], now)
+        dropped = drop_expired_partitions(cursor, table, table_settings['retention_days'], now)
+        if created or dropped:
+            logger.info(f"🗂️ {table}: created {created} partitions, dropped {len(dropped)}")
+        report[table] = {'created': created, 'dropped': dropped}
+    return report
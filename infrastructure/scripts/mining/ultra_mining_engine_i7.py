@@ -18,18 +18,11 @@ from typing import Dict, List, Optional
 import json
 import asyncio
 import signal
-import logging
+
+from mining_logging import configure_logging
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('/tmp/ultra_mining_engine.log'),
-        logging.StreamHandler()
-    ]
-)
-logger = logging.getLogger(__name__)
+logger = configure_logging('ultra_mining_engine', fmt='%(asctime)s - %(levelname)s - %(message)s')
 
 class UltraOptimizedMiningEngine:
     def __init__(self):
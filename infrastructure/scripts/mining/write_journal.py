@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+AZORA WRITE JOURNAL
+Local append-only journal for engine writes that failed because Postgres was unavailable.
+Records go to JSON-lines segment files with batched fsync; sealed segments are replayed
+in bulk once the database is back, each in one transaction keyed by its segment id so a
+segment is never applied twice.
+"""
+
+import io
+import os
+import csv
+import json
+import time
+import socket
+import threading
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from mint_mine_metrics import Counter
+
+JOURNAL_SEGMENTS_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS write_journal_segments (
+        segment_id VARCHAR(255) PRIMARY KEY,
+        records INTEGER NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+SEGMENT_SUFFIX = '.seg'
+COPY_NULL = '\\N'
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {'$dt': value.isoformat()}
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict) and '$dt' in value:
+        return datetime.fromisoformat(value['$dt'])
+    return value
+
+
+def copy_rows(cursor, table: str, columns: Sequence[str], rows: Sequence[Sequence[Any]]):
+    """Bulk-load rows with COPY ... FROM STDIN (CSV)"""
+    if not rows:
+        return
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([COPY_NULL if value is None else value for value in row])
+    buffer.seek(0)
+    cursor.copy_expert(
+        f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')",
+        buffer
+    )
+
+
+class WriteJournal:
+    """Segmented append-only journal with group fsync and segment-at-a-time replay"""
+
+    def __init__(self, directory: str, segment_max_bytes: int = 16 * 1024 * 1024,
+                 fsync_interval: float = 0.2, logger: Optional[logging.Logger] = None):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.fsync_interval = fsync_interval
+        self.logger = logger or logging.getLogger('AzoraWriteJournal')
+
+        # Segment ids must stay unique across restarts and cluster members
+        self._writer_id = f"{socket.gethostname()}-{os.getpid()}"
+        self._segment_seq = 0
+        self._file = None
+        self._segment_path: Optional[str] = None
+        self._segment_records = 0
+
+        self._lock = threading.Lock()
+        self._synced = threading.Condition(self._lock)
+        self._replay_lock = threading.Lock()
+        self._appended_seq = 0
+        self._synced_seq = 0
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.records_appended = Counter()
+        self.records_replayed = Counter()
+        self.replay_failures = Counter()
+        self.pending_records = 0
+        self.last_replay: Dict[str, Any] = {}
+
+        os.makedirs(self.directory, exist_ok=True)
+        # Segments left by earlier runs are pending replay
+        self.pending_records = sum(self._count_records(path) for path in self.pending_segments())
+
+    @staticmethod
+    def _count_records(path: str) -> int:
+        with open(path, 'rb') as f:
+            return sum(1 for line in f if line.strip())
+
+    # ------------------------------------------------------------------
+    # Appending
+    # ------------------------------------------------------------------
+
+    def start(self):
+        """Start the group-fsync thread"""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._sync_loop, name='write-journal-fsync', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._lock:
+            self._sync_locked()
+            self._close_segment_locked()
+
+    def append(self, kind: str, row: Dict[str, Any], durable: bool = False, timeout: float = 5.0) -> bool:
+        """Journal one failed write; durable=True waits until it has been fsynced"""
+        record = json.dumps({'kind': kind, 'row': {key: _encode_value(value) for key, value in row.items()}},
+                            default=str) + '\n'
+
+        with self._lock:
+            if self._file is None or self._file.tell() >= self.segment_max_bytes:
+                self._close_segment_locked()
+                self._open_segment_locked()
+            self._file.write(record)
+            self._segment_records += 1
+            self._appended_seq += 1
+            seq = self._appended_seq
+            self.pending_records += 1
+            self.records_appended.inc()
+
+            if durable:
+                if not self._running:
+                    self._sync_locked()
+                elif not self._synced.wait_for(lambda: self._synced_seq >= seq, timeout):
+                    return False
+        return True
+
+    def _open_segment_locked(self):
+        self._segment_seq += 1
+        name = f"{datetime.now():%Y%m%d%H%M%S}-{self._writer_id}-{self._segment_seq:06d}{SEGMENT_SUFFIX}"
+        self._segment_path = os.path.join(self.directory, name)
+        self._file = open(self._segment_path, 'a', encoding='utf-8')
+        self._segment_records = 0
+
+    def _close_segment_locked(self):
+        if self._file is None:
+            return
+        self._sync_locked()
+        self._file.close()
+        self._file = None
+        self._segment_path = None
+
+    def _sync_locked(self):
+        if self._file is not None and self._synced_seq < self._appended_seq:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+        self._synced_seq = self._appended_seq
+        self._synced.notify_all()
+
+    def _sync_loop(self):
+        while self._running:
+            time.sleep(self.fsync_interval)
+            with self._lock:
+                try:
+                    self._sync_locked()
+                except OSError as e:
+                    self.logger.error(f"Journal fsync failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Replay
+    # ------------------------------------------------------------------
+
+    def pending_segments(self) -> List[str]:
+        """Segment files not yet replayed, oldest first (excluding the one being written)"""
+        paths = [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_SUFFIX)
+        ]
+        return sorted(path for path in paths if path != self._segment_path)
+
+    def seal(self):
+        """Close the current segment so its records become replayable"""
+        with self._lock:
+            self._close_segment_locked()
+
+    @staticmethod
+    def read_segment(path: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Records of one segment grouped by kind; a torn final line (crash mid-write) is skipped"""
+        records: Dict[str, List[Dict[str, Any]]] = {}
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                row = {key: _decode_value(value) for key, value in record['row'].items()}
+                records.setdefault(record['kind'], []).append(row)
+        return records
+
+    def replay(self, apply_segment: Callable[[str, Dict[str, List[Dict[str, Any]]]], Any]) -> int:
+        """Apply every pending segment; stops at the first failure and returns records replayed.
+
+        apply_segment(segment_id, records_by_kind) must apply a whole segment
+        atomically and do nothing for a segment id it has already applied.
+        """
+        if self.pending_records == 0:
+            return 0
+
+        with self._replay_lock:
+            self.seal()
+            started = time.monotonic()
+            replayed = 0
+            for path in self.pending_segments():
+                segment_id = os.path.basename(path)[:-len(SEGMENT_SUFFIX)]
+                records = self.read_segment(path)
+                count = sum(len(rows) for rows in records.values())
+                try:
+                    apply_segment(segment_id, records)
+                except Exception as e:
+                    self.replay_failures.inc()
+                    self.last_replay = {'error': str(e), 'at': datetime.now().isoformat()}
+                    self.logger.warning(f"Journal replay of {segment_id} failed: {e}")
+                    break
+
+                os.remove(path)
+                replayed += count
+                with self._lock:
+                    self.pending_records = max(0, self.pending_records - count)
+                self.records_replayed.inc(count)
+
+            if replayed:
+                elapsed = time.monotonic() - started
+                self.last_replay = {
+                    'records': replayed,
+                    'seconds': round(elapsed, 3),
+                    'records_per_second': round(replayed / elapsed, 1) if elapsed > 0 else None,
+                    'at': datetime.now().isoformat()
+                }
+                self.logger.info(f"📼 Replayed {replayed} journaled writes in {elapsed:.2f}s")
+            return replayed
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            open_bytes = self._file.tell() if self._file else 0
+            segments = self.pending_segments()
+        return {
+            'pending_records': self.pending_records,
+            'pending_segments': len(segments) + (1 if open_bytes else 0),
+            'pending_bytes': sum(os.path.getsize(path) for path in segments) + open_bytes,
+            'records_appended': self.records_appended.value,
+            'records_replayed': self.records_replayed.value,
+            'replay_failures': self.replay_failures.value,
+            'last_replay': dict(self.last_replay)
+        }
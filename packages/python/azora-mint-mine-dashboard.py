@@ -6,29 +6,67 @@ Advanced dashboard with real-time monitoring, analytics, and control panel
 
 import json
 import time
+import select
 import threading
 import logging
 import os
+import sys
 from datetime import datetime, timedelta
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, Response, render_template_string, request, jsonify
 import psycopg2
 from psycopg2.extras import RealDictCursor
 import requests
 import plotly.graph_objects as go
 import plotly.utils
 
+# Shared mining modules (infrastructure/scripts/mining), from either copy of this file
+_HERE = os.path.dirname(os.path.abspath(__file__))
+MINING_SCRIPTS_DIR = os.getenv('AZORA_MINING_SCRIPTS') or next(
+    (path for path in (os.path.join(_HERE, '..', 'scripts', 'mining'),
+                       os.path.join(_HERE, '..', '..', 'infrastructure', 'scripts', 'mining'))
+     if os.path.isdir(path)),
+    os.path.join(_HERE, '..', 'scripts', 'mining'))
+sys.path.append(os.path.abspath(MINING_SCRIPTS_DIR))
+
+from mining_logging import configure_logging
+from resilient_http import get_http_client
+
 # Initialize Flask app
 app = Flask(__name__)
 
+# Mint-mine engine's embedded stats API (scripts/mining/mint_mine_http_api.py)
+ENGINE_API_URL = os.getenv('ENGINE_API_URL', 'http://127.0.0.1:8790')
+
+# Published by the mint-mine engine (scripts/mining/mint_mine_events.py)
+ENGINE_EVENTS_CHANNEL = 'azora_mint_mine_events'
+
+# Sections re-queried when an engine event invalidates them
+QUERIED_SECTIONS = ('transactions', 'hourly_earnings', 'daily_azr')
+
+POLL_INTERVAL = 30  # Without a listener connection
+FULL_REFRESH_SECONDS = int(os.getenv('DASHBOARD_FULL_REFRESH_SECONDS', '300'))  # Safety net for missed events
+
 class AzoraDashboard:
     def __init__(self):
         self.app = app
         self.db_connection = None
         self.engine_stats = {}
+        self.dashboard_data = {}
         self.monitoring_active = True
 
+        # Caches kept warm by engine events
+        self.running_totals = {}
+        self.prices = {}
+        self.tx_summary = {}
+        self.listening = False
+        self.dirty = set(QUERIED_SECTIONS)
+        self.cache_lock = threading.Lock()
+        self.refresh_event = threading.Event()
+        self.stats_changed = threading.Condition()
+        self.stats_version = 0
+
         # Setup logging
-        logging.basicConfig(level=logging.INFO)
+        configure_logging('azora_mint_mine_dashboard')
         self.logger = logging.getLogger('AzoraDashboard')
 
         # Initialize database connection
@@ -38,34 +76,200 @@ class AzoraDashboard:
         self.monitor_thread = threading.Thread(target=self.monitor_engine, daemon=True)
         self.monitor_thread.start()
 
+        # Engine events keep the caches current between refreshes
+        self.listen_thread = threading.Thread(target=self.listen_for_events, daemon=True)
+        self.listen_thread.start()
+
+    def connect(self, autocommit: bool = False):
+        connection = psycopg2.connect(
+            host=os.getenv('DB_HOST', 'localhost'),
+            port=int(os.getenv('DB_PORT', '5432')),
+            database=os.getenv('DB_NAME', 'azora_os'),
+            user=os.getenv('DB_USER', 'azora'),
+            password=os.getenv('DB_PASSWORD', '')
+        )
+        connection.autocommit = autocommit
+        return connection
+
     def initialize_database(self):
         """Initialize database connection"""
         try:
-            self.db_connection = psycopg2.connect(
-                host=os.getenv('DB_HOST', 'localhost'),
-                port=int(os.getenv('DB_PORT', '5432')),
-                database=os.getenv('DB_NAME', 'azora_os'),
-                user=os.getenv('DB_USER', 'azora'),
-                password=os.getenv('DB_PASSWORD', '')
-            )
+            self.db_connection = self.connect()
             self.logger.info("✅ Database connection established")
         except Exception as e:
             self.logger.error(f"Database connection failed: {e}")
 
     def monitor_engine(self):
-        """Monitor the mining engine status"""
+        """Re-query invalidated sections as soon as an engine event arrives"""
+        last_full_refresh = 0.0
         while self.monitoring_active:
             try:
-                # Check engine health via API or direct connection
-                self.update_engine_stats()
+                if not self.listening:
+                    # No event feed: fall back to polling everything
+                    self.update_engine_stats()
+                    self.invalidate(*QUERIED_SECTIONS)
+                elif time.monotonic() - last_full_refresh >= FULL_REFRESH_SECONDS:
+                    # Rolling 24h/7d windows move even when nothing is written
+                    self.invalidate(*QUERIED_SECTIONS)
+                    last_full_refresh = time.monotonic()
 
                 # Update dashboard data
-                self.update_dashboard_data()
+                self.refresh_invalidated_sections()
 
             except Exception as e:
                 self.logger.error(f"Engine monitoring error: {e}")
 
-            time.sleep(30)  # Update every 30 seconds
+            self.refresh_event.wait(POLL_INTERVAL)
+            self.refresh_event.clear()
+
+    def invalidate(self, *sections):
+        with self.cache_lock:
+            self.dirty.update(sections)
+        self.refresh_event.set()
+
+    def refresh_invalidated_sections(self):
+        with self.cache_lock:
+            sections, self.dirty = self.dirty, set()
+        if not sections:
+            return
+
+        try:
+            if 'transactions' in sections:
+                self.update_transaction_summary()
+            if sections & {'hourly_earnings', 'daily_azr'}:
+                self.update_dashboard_data(sections)
+        except Exception:
+            # Retry on the next wake-up
+            with self.cache_lock:
+                self.dirty.update(sections)
+            raise
+
+        self.publish_engine_stats()
+
+    # ------------------------------------------------------------------
+    # Engine event feed
+    # ------------------------------------------------------------------
+
+    def listen_for_events(self):
+        """LISTEN for engine events and apply them to the caches"""
+        while self.monitoring_active:
+            connection = None
+            try:
+                connection = self.connect(autocommit=True)
+                with connection.cursor() as cursor:
+                    cursor.execute(f"LISTEN {ENGINE_EVENTS_CHANNEL}")
+                self.load_pushed_state(connection)
+                self.listening = True
+                self.invalidate(*QUERIED_SECTIONS)
+                self.logger.info("📡 Listening for engine events")
+
+                last_full_refresh = time.monotonic()
+                while self.monitoring_active:
+                    if time.monotonic() - last_full_refresh >= FULL_REFRESH_SECONDS:
+                        self.load_pushed_state(connection)
+                        last_full_refresh = time.monotonic()
+
+                    if select.select([connection], [], [], 5.0) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        self.handle_engine_event(connection.notifies.pop(0).payload)
+
+            except Exception as e:
+                self.logger.warning(f"Engine event feed unavailable: {e}")
+
+            self.listening = False
+            if connection is not None and not connection.closed:
+                connection.close()
+            time.sleep(5)
+
+    def load_pushed_state(self, connection):
+        """Load the event-maintained caches on the listening connection.
+
+        Events already received by then describe commits the query has seen, so
+        their totals and prices are skipped; later events apply on top.
+        """
+        with connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            self.running_totals = self.query_running_totals(cursor)
+            self.prices = self.query_latest_prices(cursor)
+
+        while connection.notifies:
+            self.handle_engine_event(connection.notifies.pop(0).payload, included=True)
+        self.publish_engine_stats()
+
+    def handle_engine_event(self, payload: str, included: bool = False):
+        """Apply one engine event; included=True when its data is already in the caches"""
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            return
+
+        kind = event.get('event')
+        changed = False
+        with self.cache_lock:
+            if not included and event.get('totals'):
+                for metric, delta in event['totals'].items():
+                    self.running_totals[metric] = self.running_totals.get(metric, 0.0) + float(delta)
+                changed = True
+
+            if kind == 'prices' and not included and event.get('prices'):
+                for symbol, quote in event['prices'].items():
+                    previous = self.prices.get(symbol, {})
+                    self.prices[symbol] = {
+                        'symbol': symbol,
+                        'price_usd': quote.get('price_usd'),
+                        'price_change_24h': previous.get('price_change_24h')
+                    }
+                changed = True
+
+        if kind == 'mint':
+            self.invalidate('transactions')
+            statuses = {tx.get('status') for tx in event.get('transactions', [])}
+            if 'confirmed' in statuses or event.get('truncated'):
+                self.invalidate('daily_azr')
+        elif kind == 'prices' and event.get('truncated') and not included:
+            self.prices_stale()
+        elif kind == 'rollups':
+            self.invalidate('hourly_earnings')
+
+        if changed:
+            self.publish_engine_stats()
+
+    def prices_stale(self):
+        """Oversized price events carry no prices; re-read them on the query connection"""
+        try:
+            with self.db_connection.cursor(cursor_factory=RealDictCursor) as cursor:
+                prices = self.query_latest_prices(cursor)
+            with self.cache_lock:
+                self.prices = prices
+        except Exception as e:
+            self.logger.error(f"Failed to refresh prices: {e}")
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def query_running_totals(cursor):
+        # Engine running totals (O(1))
+        cursor.execute("""
+            SELECT metric, value
+            FROM engine_running_totals
+            WHERE metric IN ('completed_sessions', 'completed_earnings_usd',
+                             'completed_session_azr', 'completed_hashrate_mhs_sum')
+        """)
+        return {row['metric']: float(row['value']) for row in cursor.fetchall()}
+
+    @staticmethod
+    def query_latest_prices(cursor):
+        cursor.execute("""
+            SELECT symbol, price_usd, price_change_24h
+            FROM crypto_prices
+            WHERE timestamp = (
+                SELECT MAX(timestamp) FROM crypto_prices WHERE symbol = crypto_prices.symbol
+            )
+        """)
+        return {price['symbol']: dict(price) for price in cursor.fetchall()}
 
     def update_engine_stats(self):
         """Update engine statistics from database"""
@@ -74,68 +278,90 @@ class AzoraDashboard:
 
         try:
             with self.db_connection.cursor(cursor_factory=RealDictCursor) as cursor:
-                # Get mining summary
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as total_sessions,
-                        SUM(total_earnings_usd) as total_earnings,
-                        SUM(azr_minted) as total_azr_minted,
-                        AVG(total_hashrate_mhs) as avg_hashrate
-                    FROM mining_sessions
-                    WHERE status = 'completed'
-                """)
-                mining_summary = cursor.fetchone()
-
-                # Get recent transactions
-                cursor.execute("""
-                    SELECT
-                        COUNT(*) as pending_txs,
-                        COUNT(CASE WHEN blockchain_status = 'confirmed' THEN 1 END) as confirmed_txs
-                    FROM minting_transactions
-                    WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '24 hours'
-                """)
-                tx_summary = cursor.fetchone()
-
-                # Get current prices
-                cursor.execute("""
-                    SELECT symbol, price_usd, price_change_24h
-                    FROM crypto_prices
-                    WHERE timestamp = (
-                        SELECT MAX(timestamp) FROM crypto_prices WHERE symbol = crypto_prices.symbol
-                    )
-                """)
-                prices = cursor.fetchall()
+                running_totals = self.query_running_totals(cursor)
+                prices = self.query_latest_prices(cursor)
 
-                self.engine_stats = {
-                    'mining': dict(mining_summary) if mining_summary else {},
-                    'transactions': dict(tx_summary) if tx_summary else {},
-                    'prices': {price['symbol']: price for price in prices},
-                    'last_update': datetime.now().isoformat()
-                }
+            with self.cache_lock:
+                self.running_totals = running_totals
+                self.prices = prices
+            self.update_transaction_summary()
+            self.publish_engine_stats()
 
         except Exception as e:
             self.logger.error(f"Failed to update engine stats: {e}")
 
-    def update_dashboard_data(self):
+    def update_transaction_summary(self):
+        if not self.db_connection:
+            return
+
+        with self.db_connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            # Get recent transactions
+            cursor.execute("""
+                SELECT
+                    COUNT(*) as pending_txs,
+                    COUNT(CASE WHEN blockchain_status = 'confirmed' THEN 1 END) as confirmed_txs
+                FROM minting_transactions
+                WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '24 hours'
+            """)
+            tx_summary = cursor.fetchone()
+
+        self.tx_summary = dict(tx_summary) if tx_summary else {}
+
+    def publish_engine_stats(self):
+        """Rebuild engine_stats from the caches and wake streaming clients"""
+        with self.cache_lock:
+            totals = dict(self.running_totals)
+            prices = {symbol: dict(price) for symbol, price in self.prices.items()}
+
+        total_sessions = int(totals.get('completed_sessions', 0))
+        mining_summary = {
+            'total_sessions': total_sessions,
+            'total_earnings': totals.get('completed_earnings_usd', 0.0),
+            'total_azr_minted': totals.get('completed_session_azr', 0.0),
+            'avg_hashrate': totals.get('completed_hashrate_mhs_sum', 0.0) / total_sessions if total_sessions else None
+        }
+
+        with self.stats_changed:
+            self.engine_stats = {
+                'mining': mining_summary,
+                'transactions': dict(self.tx_summary),
+                'prices': prices,
+                'last_update': datetime.now().isoformat()
+            }
+            self.stats_version += 1
+            self.stats_changed.notify_all()
+
+    def wait_for_stats(self, after_version: int, timeout: float):
+        """Block until engine_stats changes past after_version; returns (version, stats or None)"""
+        with self.stats_changed:
+            self.stats_changed.wait_for(lambda: self.stats_version != after_version, timeout)
+            if self.stats_version == after_version:
+                return after_version, None
+            return self.stats_version, self.engine_stats
+
+    def update_dashboard_data(self, sections=('hourly_earnings', 'daily_azr')):
         """Update dashboard data for charts and analytics"""
         if not self.db_connection:
             return
 
-        try:
-            with self.db_connection.cursor(cursor_factory=RealDictCursor) as cursor:
-                # Get hourly earnings for the last 24 hours
+        dashboard_data = dict(self.dashboard_data)
+        with self.db_connection.cursor(cursor_factory=RealDictCursor) as cursor:
+            if 'hourly_earnings' in sections:
+                # Get hourly earnings for the last 24 hours from the engine's 1m rollups
+                # (includes the current, still-open hour)
                 cursor.execute("""
                     SELECT
-                        DATE_TRUNC('hour', created_at) as hour,
-                        SUM(total_earnings_usd) as earnings
-                    FROM mining_sessions
-                    WHERE created_at >= CURRENT_TIMESTAMP - INTERVAL '24 hours'
-                    AND status = 'completed'
-                    GROUP BY DATE_TRUNC('hour', created_at)
+                        DATE_TRUNC('hour', bucket) as hour,
+                        SUM(earnings_usd) as earnings
+                    FROM mining_sessions_rollup
+                    WHERE resolution = '1m'
+                    AND bucket >= CURRENT_TIMESTAMP - INTERVAL '24 hours'
+                    GROUP BY DATE_TRUNC('hour', bucket)
                     ORDER BY hour
                 """)
-                hourly_earnings = cursor.fetchall()
+                dashboard_data['hourly_earnings'] = cursor.fetchall()
 
+            if 'daily_azr' in sections:
                 # Get daily AZR minting for the last 7 days
                 cursor.execute("""
                     SELECT
@@ -147,47 +373,39 @@ class AzoraDashboard:
                     GROUP BY DATE(created_at)
                     ORDER BY date
                 """)
-                daily_azr = cursor.fetchall()
+                dashboard_data['daily_azr'] = cursor.fetchall()
 
-                self.dashboard_data = {
-                    'hourly_earnings': hourly_earnings,
-                    'daily_azr': daily_azr,
-                    'updated_at': datetime.now().isoformat()
-                }
-
-        except Exception as e:
-            self.logger.error(f"Failed to update dashboard data: {e}")
+        dashboard_data['updated_at'] = datetime.now().isoformat()
+        self.dashboard_data = dashboard_data
 
     def get_system_health(self):
-        """Get system health status"""
-        if not self.db_connection:
-            return {'status': 'error', 'message': 'Database not connected'}
-
+        """Get system health status from the engine's /health endpoint"""
         try:
-            with self.db_connection.cursor(cursor_factory=RealDictCursor) as cursor:
-                cursor.execute("""
-                    SELECT component, status, message, timestamp
-                    FROM system_health
-                    ORDER BY timestamp DESC
-                    LIMIT 10
-                """)
-                health_records = cursor.fetchall()
-
-                # Calculate overall health
-                healthy_count = sum(1 for record in health_records if record['status'] == 'healthy')
-                total_count = len(health_records)
-
-                overall_status = 'healthy' if healthy_count == total_count else 'warning' if healthy_count > 0 else 'critical'
-
-                return {
-                    'overall_status': overall_status,
-                    'healthy_components': healthy_count,
-                    'total_components': total_count,
-                    'components': health_records
-                }
-
-        except Exception as e:
-            return {'status': 'error', 'message': str(e)}
+            response = get_http_client().get(f"{ENGINE_API_URL}/health", endpoint='engine_api', timeout=2)
+            health = response.json()
+        except (requests.RequestException, ValueError) as e:
+            return {'overall_status': 'error', 'message': f'Engine API unreachable: {e}'}
+
+        components = [
+            {'component': name, 'status': 'healthy' if healthy else 'critical'}
+            for name, healthy in (health.get('components') or {}).items()
+        ]
+        healthy_count = sum(1 for component in components if component['status'] == 'healthy')
+
+        if health.get('stale'):
+            overall_status = 'critical'
+        elif health.get('healthy'):
+            overall_status = 'healthy' if healthy_count == len(components) else 'warning'
+        else:
+            overall_status = 'critical'
+
+        return {
+            'overall_status': overall_status,
+            'healthy_components': healthy_count,
+            'total_components': len(components),
+            'components': components,
+            'snapshot_age_seconds': health.get('snapshot_age_seconds')
+        }
 
 # Initialize dashboard
 dashboard = AzoraDashboard()
@@ -580,20 +798,45 @@ DASHBOARD_HTML = """
 
         // Initialize
         loadData();
-        setInterval(loadData, 30000); // Refresh every 30 seconds
+
+        // Stats are pushed as soon as the engine reports a change
+        if (window.EventSource) {
+            const stream = new EventSource('/api/stream');
+            stream.onmessage = event => {
+                engineStats = JSON.parse(event.data);
+                updateStats(engineStats);
+                updatePrices(engineStats.prices || {});
+                updateLastUpdate();
+            };
+        }
+        setInterval(loadData, 30000); // Health, and a fallback without the stream
     </script>
 </body>
 </html>
 """
 
 @app.route('/')
-def dashboard():
+def index():
     return render_template_string(DASHBOARD_HTML)
 
 @app.route('/api/stats')
 def get_stats():
     return jsonify(dashboard.engine_stats)
 
+@app.route('/api/stream')
+def stream_stats():
+    """Server-sent events: the latest engine stats whenever they change"""
+    def events():
+        version = -1
+        while True:
+            version, stats = dashboard.wait_for_stats(version, timeout=15)
+            if stats is None:
+                yield ': keepalive\n\n'
+            else:
+                yield f"data: {json.dumps(stats, default=str)}\n\n"
+
+    return Response(events(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
 @app.route('/api/health')
 def get_health():
     return jsonify(dashboard.get_system_health())
@@ -639,6 +882,7 @@ def main():
     print("📊 Dashboard available at: http://localhost:5000")
     print("🔧 API endpoints:")
     print("   GET  /api/stats  - Engine statistics")
+    print("   GET  /api/stream - Live engine statistics (server-sent events)")
     print("   GET  /api/health - System health")
     print("   POST /api/control/start-mining - Start mining")
     print("   POST /api/control/stop-mining  - Stop mining")